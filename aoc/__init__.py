@@ -0,0 +1,7 @@
+"""
+Tooling for the Advent of Code 2025 agent comparison.
+
+Discovers every ``Day N/<Agent>`` solution in the repository and measures
+them on equal terms so the README results can be regenerated instead of
+being recorded by hand.
+"""
@@ -0,0 +1,598 @@
+"""
+Adapter registry mapping each solution onto a common parse/part1/part2 shape.
+
+The agents picked their own entry points (``solve_puzzle1``/``solve_puzzle2``,
+``puzzle1``/``puzzle2``, ``solve_part1``, ``solve_puzzles``, ``run_solver``)
+and their own split between parsing and solving. An adapter imports the
+solution module once and exposes:
+
+- ``parse(path)``: read and parse the input file
+- ``prepare(data)``: optional work both puzzles share, such as a sorted
+  edge list or a graph search; its result replaces ``data`` for the parts
+- ``part1(data)`` / ``part2(data)``: solve each puzzle from the parsed
+  (or prepared) data
+- ``solve(data)``: both answers at once, for solutions that only offer a
+  combined entry point (``solve_puzzles``, ``run_solver``)
+
+Where a solution keeps its loop inside ``main()``, the adapter repeats that
+loop around the module's own helper functions. Parts must not modify the
+prepared data: the harness may hand the same object to both parts and,
+with ``reuse_prepared``, to every run.
+"""
+
+import importlib.util
+import io
+import re
+import sys
+from collections import deque
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from aoc.discovery import Solution
+from aoc.runner import parse_answers
+
+
+@dataclass(frozen=True)
+class Adapter:
+    """Common entry points for one solution."""
+
+    parse: Callable[[Path], Any]
+    part1: Optional[Callable[[Any], Any]] = None
+    part2: Optional[Callable[[Any], Any]] = None
+    solve: Optional[Callable[[Any], Tuple[Any, Any]]] = None
+    prepare: Optional[Callable[[Any], Any]] = None
+
+    def load(self, path: Path) -> Any:
+        """Parse and prepare ``path``, untimed."""
+        data = self.parse(path)
+        return data if self.prepare is None else self.prepare(data)
+
+    def phases(self) -> List[Tuple[str, Callable[[Any], Any]]]:
+        """The solving phases to time, in order."""
+        if self.solve is not None:
+            return [("solve", self.solve)]
+        phases = []
+        if self.part1 is not None:
+            phases.append(("part1", self.part1))
+        if self.part2 is not None:
+            phases.append(("part2", self.part2))
+        return phases
+
+
+AdapterFactory = Callable[[ModuleType], Adapter]
+
+REGISTRY: Dict[Tuple[int, str], AdapterFactory] = {}
+
+_modules: Dict[Path, ModuleType] = {}
+
+
+def register(day: int, agent: str) -> Callable[[AdapterFactory], AdapterFactory]:
+    """Decorator registering the adapter factory for ``(day, agent)``."""
+    def decorator(factory: AdapterFactory) -> AdapterFactory:
+        REGISTRY[(day, agent)] = factory
+        return factory
+    return decorator
+
+
+def load_module(solution: Solution) -> ModuleType:
+    """Import a solution script once, under a name unique to its day and agent."""
+    if solution.path in _modules:
+        return _modules[solution.path]
+
+    slug = re.sub(r"\W+", "_", solution.agent.lower())
+    name = f"aoc_day{solution.day:02d}_{slug}"
+    spec = importlib.util.spec_from_file_location(name, solution.path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    _modules[solution.path] = module
+    return module
+
+
+def has_adapter(solution: Solution) -> bool:
+    return (solution.day, solution.agent) in REGISTRY
+
+
+def get_adapter(solution: Solution) -> Adapter:
+    try:
+        factory = REGISTRY[(solution.day, solution.agent)]
+    except KeyError:
+        raise KeyError(f"No adapter registered for {solution.key}") from None
+    return factory(load_module(solution))
+
+
+# ---------------------------------------------------------------------------
+# Shared parsing helpers
+# ---------------------------------------------------------------------------
+
+def _read_text(path: Path) -> str:
+    return Path(path).read_text(encoding="utf-8")
+
+
+def _stripped_lines(path: Path) -> List[str]:
+    return [line.strip() for line in _read_text(path).splitlines() if line.strip()]
+
+
+def _captured_answers(fn: Callable[..., Any], *args: Any) -> Tuple[Any, Any]:
+    """Call a printing entry point and return the answers it printed."""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        fn(*args)
+    answers = parse_answers(buffer.getvalue())
+    return answers.get(1), answers.get(2)
+
+
+# ---------------------------------------------------------------------------
+# Day 1
+# ---------------------------------------------------------------------------
+
+@register(1, "Claude CLI")
+def _day1_claude(m: ModuleType) -> Adapter:
+    return Adapter(
+        parse=lambda path: [m.parse_rotation(line) for line in _stripped_lines(path)],
+        part1=m.solve_puzzle_one,
+        part2=m.solve_puzzle_two,
+    )
+
+
+@register(1, "Google Gemini")
+def _day1_gemini(m: ModuleType) -> Adapter:
+    return Adapter(
+        parse=lambda path: m.read_input(str(path)),
+        part1=m.solve_puzzle_1,
+        part2=m.solve_puzzle_2,
+    )
+
+
+@register(1, "Chat GPT")
+def _day1_chatgpt(m: ModuleType) -> Adapter:
+    return Adapter(
+        parse=lambda path: m.read_input(str(path)),
+        part1=m.solve_puzzle1,
+        part2=m.solve_puzzle2,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Day 2
+# ---------------------------------------------------------------------------
+
+@register(2, "Claude CLI")
+def _day2_claude(m: ModuleType) -> Adapter:
+    return Adapter(
+        parse=lambda path: m.parse_ranges(_read_text(path)),
+        part1=m.solve_puzzle1,
+        part2=m.solve_puzzle2,
+    )
+
+
+@register(2, "Google Gemini")
+def _day2_gemini(m: ModuleType) -> Adapter:
+    # solve() reads input.txt itself; repeat its loop around the predicates.
+    def part(predicate: Callable[[str], bool]) -> Callable[[Any], int]:
+        def run(ranges: List[Tuple[int, int]]) -> int:
+            return sum(
+                num
+                for start, end in ranges
+                for num in range(start, end + 1)
+                if predicate(str(num))
+            )
+        return run
+
+    return Adapter(
+        parse=lambda path: m.parse_input(str(path)),
+        part1=part(m.is_invalid_p1),
+        part2=part(m.is_invalid_p2),
+    )
+
+
+@register(2, "Chat GPT")
+def _day2_chatgpt(m: ModuleType) -> Adapter:
+    return Adapter(
+        parse=lambda path: m.read_ranges(str(path)),
+        solve=m.solve_puzzles,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Day 3
+# ---------------------------------------------------------------------------
+
+@register(3, "Claude CLI")
+def _day3_claude(m: ModuleType) -> Adapter:
+    return Adapter(parse=_stripped_lines, part1=m.solve_puzzle1, part2=m.solve_puzzle2)
+
+
+@register(3, "Google Gemini")
+def _day3_gemini(m: ModuleType) -> Adapter:
+    return Adapter(
+        parse=lambda path: _read_text(path).splitlines(keepends=True),
+        part1=m.solve_part1,
+        part2=m.solve_part2,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Day 4
+# ---------------------------------------------------------------------------
+
+@register(4, "Claude CLI")
+def _day4_claude(m: ModuleType) -> Adapter:
+    return Adapter(
+        parse=lambda path: m.read_input(str(path)),
+        part1=m.solve_puzzle1,
+        part2=m.solve_puzzle2,
+    )
+
+
+@register(4, "Google Gemini")
+def _day4_gemini(m: ModuleType) -> Adapter:
+    return Adapter(
+        parse=lambda path: m.load_grid(str(path)),
+        part1=m.solve_puzzle_1,
+        part2=m.solve_puzzle_2,
+    )
+
+
+@register(4, "Chat GPT")
+def _day4_chatgpt(m: ModuleType) -> Adapter:
+    return Adapter(
+        parse=lambda path: m.load_input(str(path)),
+        part1=m.puzzle1,
+        part2=m.puzzle2,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Day 5
+# ---------------------------------------------------------------------------
+
+@register(5, "Claude CLI")
+def _day5_claude(m: ModuleType) -> Adapter:
+    return Adapter(
+        parse=lambda path: m.parse_input(str(path)),
+        part1=lambda data: m.solve_puzzle1(*data),
+        part2=lambda data: m.solve_puzzle2(data[0]),
+    )
+
+
+@register(5, "Chat GPT")
+def _day5_chatgpt(m: ModuleType) -> Adapter:
+    # main() merges the intervals once before timing either puzzle.
+    def parse(path: Path) -> Tuple[Any, Any]:
+        ranges, ids = m.parse_input(Path(path))
+        return m.merge_intervals(ranges), ids
+
+    return Adapter(
+        parse=parse,
+        part1=lambda data: m.solve_puzzle1(*data),
+        part2=lambda data: m.solve_puzzle2(data[0]),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Day 6
+# ---------------------------------------------------------------------------
+
+@register(6, "Claude CLI")
+def _day6_claude(m: ModuleType) -> Adapter:
+    return Adapter(
+        parse=lambda path: m.parse_worksheet(m.read_input(str(path))),
+        part1=m.solve_puzzle1,
+        part2=m.solve_puzzle2,
+    )
+
+
+@register(6, "Google Gemini")
+def _day6_gemini(m: ModuleType) -> Adapter:
+    return Adapter(
+        parse=lambda path: m.load_input_grid(str(path)),
+        part1=lambda grid: m.solve_problems_part1(m.parse_problems_part1(grid)),
+        part2=lambda grid: m.solve_problems_part2(m.parse_problems_part2(grid)),
+    )
+
+
+@register(6, "Chat GPT")
+def _day6_chatgpt(m: ModuleType) -> Adapter:
+    # Both puzzles pad the lines and find the blocks again; do that once and
+    # repeat the per-block loops over the cut-out number rows.
+    def prepare(lines: List[str]) -> List[Tuple[str, List[str]]]:
+        lines = m.pad_lines(lines)
+        return [
+            (m.get_operator(lines, (start, end)), [line[start:end] for line in lines[:-1]])
+            for start, end in m.find_problem_blocks(lines)
+        ]
+
+    def total(numbers_per_block: Iterable[Tuple[str, List[int]]]) -> int:
+        return sum(
+            sum(numbers) if op == "+" else m.prod(numbers)
+            for op, numbers in numbers_per_block
+            if numbers
+        )
+
+    def part1(blocks: List[Tuple[str, List[str]]]) -> int:
+        return total(
+            (op, [int(row) for row in rows if row.strip()]) for op, rows in blocks
+        )
+
+    def part2(blocks: List[Tuple[str, List[str]]]) -> int:
+        def columns(rows: List[str]) -> List[int]:
+            numbers = []
+            for c in range(len(rows[0]) - 1, -1, -1) if rows else ():
+                digits = "".join(row[c] for row in rows if row[c].isdigit())
+                if digits:
+                    numbers.append(int(digits))
+            return numbers
+
+        return total((op, columns(rows)) for op, rows in blocks)
+
+    return Adapter(
+        parse=lambda path: m.read_input(str(path)),
+        prepare=prepare,
+        part1=part1,
+        part2=part2,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Day 7
+# ---------------------------------------------------------------------------
+
+@register(7, "Claude CLI")
+def _day7_claude(m: ModuleType) -> Adapter:
+    return Adapter(
+        parse=lambda path: m.parse_input(str(path)),
+        part1=lambda data: m.solve_puzzle1(*data),
+        part2=lambda data: m.solve_puzzle2(*data),
+    )
+
+
+@register(7, "Google Gemini")
+def _day7_gemini(m: ModuleType) -> Adapter:
+    # run_solution() parses inline; this mirrors it.
+    def parse(path: Path) -> Tuple[List[str], Tuple[int, int]]:
+        grid: List[str] = []
+        start_pos = None
+        for r, line in enumerate(line.strip() for line in _read_text(path).splitlines()):
+            if not line:
+                continue
+            if "S" in line:
+                start_pos = (r, line.find("S"))
+                line = line.replace("S", ".")
+            grid.append(line)
+        if start_pos is None:
+            raise ValueError("'S' (start position) not found in input")
+        return grid, start_pos
+
+    return Adapter(
+        parse=parse,
+        part1=lambda data: m.solve_puzzle_1(*data),
+        part2=lambda data: m.solve_puzzle_2(*data),
+    )
+
+
+@register(7, "Chat GPT")
+def _day7_chatgpt(m: ModuleType) -> Adapter:
+    # puzzle1() and puzzle2() run the same BFS from S; run it once and keep
+    # the splitters it reaches. puzzle1() counts them, puzzle2() returns
+    # 2 ** count (which is wrong, but it is the agent's answer).
+    def prepare(grid: List[List[str]]) -> FrozenSet[Tuple[int, int]]:
+        rows, cols = len(grid), len(grid[0])
+        queue = deque([(1, grid[0].index("S"))])
+        visited = set()
+        splitters = set()
+        while queue:
+            r, c = queue.popleft()
+            if not (0 <= r < rows and 0 <= c < cols) or (r, c) in visited:
+                continue
+            visited.add((r, c))
+            if grid[r][c] == "^":
+                splitters.add((r, c))
+                if c - 1 >= 0:
+                    queue.append((r + 1, c - 1))
+                if c + 1 < cols:
+                    queue.append((r + 1, c + 1))
+            else:
+                queue.append((r + 1, c))
+        return frozenset(splitters)
+
+    return Adapter(
+        parse=lambda path: m.load_input(str(path)),
+        prepare=prepare,
+        part1=len,
+        part2=lambda splitters: pow(2, len(splitters)),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Day 8
+# ---------------------------------------------------------------------------
+
+@register(8, "Claude CLI")
+def _day8_claude(m: ModuleType) -> Adapter:
+    # solve_puzzles() parses the file itself, so parsing is part of "solve".
+    return Adapter(parse=lambda path: str(path), solve=m.solve_puzzles)
+
+
+@register(8, "Google Gemini")
+def _day8_gemini(m: ModuleType) -> Adapter:
+    # main() sorts the edges once but starts part 2 on a fresh DSU. Part 2
+    # only needs to continue from the state part 1 leaves, so prepare runs
+    # the first 1000 connections and each part works on a copy of that DSU.
+    def prepare(points: List[Tuple[int, int, int]]) -> Tuple[Any, ...]:
+        edges = m.get_sorted_edges(points)
+        dsu = m.DSU(len(points))
+        connections = 0
+        position = len(edges)
+        for index, (_, i, j) in enumerate(edges):
+            if dsu.union(i, j):
+                connections += 1
+                if connections == 1000:
+                    position = index + 1
+                    break
+        return points, edges, dsu, position
+
+    def copy(dsu: Any) -> Any:
+        clone = m.DSU(0)
+        clone.parent, clone.size, clone.num_sets = list(dsu.parent), list(dsu.size), dsu.num_sets
+        return clone
+
+    def part1(state: Tuple[Any, ...]) -> Any:
+        _, _, dsu, _ = state
+        # The connections are already made; this only reads the circuit sizes.
+        return m.solve_part1(dsu, [], num_connections=1000)
+
+    def part2(state: Tuple[Any, ...]) -> Any:
+        points, edges, dsu, position = state
+        if dsu.num_sets == 1:  # connected within part 1: start over as main() does
+            return m.solve_part2(m.DSU(len(points)), edges, points)
+        return m.solve_part2(copy(dsu), edges[position:], points)
+
+    return Adapter(
+        parse=lambda path: m.parse_input(str(path)),
+        prepare=prepare,
+        part1=part1,
+        part2=part2,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Day 9
+# ---------------------------------------------------------------------------
+
+@register(9, "Claude CLI")
+def _day9_claude(m: ModuleType) -> Adapter:
+    return Adapter(
+        parse=lambda path: m.read_input(str(path)),
+        part1=m.solve_puzzle1,
+        part2=m.solve_puzzle2,
+    )
+
+
+@register(9, "Google Gemini")
+def _day9_gemini(m: ModuleType) -> Adapter:
+    return Adapter(
+        parse=lambda path: m.parse_input(str(path)),
+        part1=lambda data: m.solve_puzzle_1(data[0]),
+        part2=lambda data: m.solve_puzzle_2(*data),
+    )
+
+
+@register(9, "Chat GPT")
+def _day9_chatgpt(m: ModuleType) -> Adapter:
+    # Both puzzles are solved inline in main(); this mirrors those loops.
+    def part1(reds: List[Tuple[int, int]]) -> int:
+        best = 0
+        for i, (x1, y1) in enumerate(reds):
+            for x2, y2 in reds[i + 1:]:
+                best = max(best, abs(x1 - x2) * abs(y1 - y2))
+        return best
+
+    def part2(reds: List[Tuple[int, int]]) -> int:
+        best = 0
+        for i, (x1, y1) in enumerate(reds):
+            for x2, y2 in reds[i + 1:]:
+                area = abs(x1 - x2) * abs(y1 - y2)
+                if area > best and m.rect_inside_polygon(x1, y1, x2, y2, reds):
+                    best = area
+        return best
+
+    return Adapter(parse=lambda path: m.load_coords(str(path)), part1=part1, part2=part2)
+
+
+# ---------------------------------------------------------------------------
+# Day 10
+# ---------------------------------------------------------------------------
+
+@register(10, "Claude CLI")
+def _day10_claude(m: ModuleType) -> Adapter:
+    return Adapter(
+        parse=lambda path: [m.parse_machine(line) for line in _stripped_lines(path)],
+        part1=lambda machines: sum(
+            m.solve_puzzle1_machine(lights, buttons) for lights, buttons, _ in machines
+        ),
+        part2=lambda machines: sum(
+            m.solve_puzzle2_machine(joltages, buttons) for _, buttons, joltages in machines
+        ),
+    )
+
+
+@register(10, "Google Gemini")
+def _day10_gemini(m: ModuleType) -> Adapter:
+    return Adapter(
+        parse=lambda path: m.parse_input(str(path)),
+        part1=m.puzzle_1_solve,
+        part2=m.puzzle_2_solve,
+    )
+
+
+@register(10, "Chat GPT")
+def _day10_chatgpt(m: ModuleType) -> Adapter:
+    return Adapter(
+        parse=lambda path: m.load_input(Path(path)),
+        part1=m.solve_puzzle1,
+        part2=m.solve_puzzle2,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Day 11
+# ---------------------------------------------------------------------------
+
+@register(11, "Claude CLI")
+def _day11_claude(m: ModuleType) -> Adapter:
+    return Adapter(
+        parse=lambda path: m.parse_graph(str(path)),
+        part1=m.solve_puzzle1,
+        part2=m.solve_puzzle2,
+    )
+
+
+@register(11, "Google Gemini")
+def _day11_gemini(m: ModuleType) -> Adapter:
+    return Adapter(
+        parse=lambda path: m.parse_input(str(path)),
+        part1=m.solve_puzzle_1,
+        part2=m.solve_puzzle_2,
+    )
+
+
+@register(11, "Chat GPT")
+def _day11_chatgpt(m: ModuleType) -> Adapter:
+    return Adapter(
+        parse=lambda path: m.parse_graph(str(path)),
+        part1=m.solve_puzzle1,
+        part2=m.solve_puzzle2,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Day 12 (one puzzle only)
+# ---------------------------------------------------------------------------
+
+@register(12, "Claude CLI")
+def _day12_claude(m: ModuleType) -> Adapter:
+    return Adapter(
+        parse=lambda path: m.parse_input(str(path)),
+        part1=lambda data: m.solve_puzzle1(*data),
+    )
+
+
+@register(12, "Google Gemini")
+def _day12_gemini(m: ModuleType) -> Adapter:
+    # run_solver() parses, solves and prints in one go.
+    return Adapter(
+        parse=lambda path: str(path),
+        solve=lambda path: _captured_answers(m.run_solver, path),
+    )
+
+
+@register(12, "Chat GPT")
+def _day12_chatgpt(m: ModuleType) -> Adapter:
+    return Adapter(
+        parse=lambda path: m.parse_input(Path(path)),
+        part1=lambda data: m.solve_puzzle_1(*data),
+    )
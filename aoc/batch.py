@@ -0,0 +1,151 @@
+"""
+Batch mode: one solution over many inputs in a pool of warm workers.
+
+Every script is hard-wired to the ``input.txt`` next to it (or, for Day 1
+Claude, to ``Instructions/input.txt``), so grading hundreds of inputs
+would otherwise mean copying each one into place and starting a fresh
+interpreter. Here the inputs are spread over a ``ProcessPoolExecutor``.
+Each worker imports the solution through its adapter once, in the pool
+initializer, and then solves input after input. Inputs are sent in chunks
+so that small, fast inputs are not dominated by inter-process overhead.
+
+Answers are written as JSON lines, one per input, in input order::
+
+    {"input": "inputs/alice.txt", "answers": {"1": "1097", "2": "7101"},
+     "elapsed_ms": 1.92, "error": null}
+"""
+
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from aoc.adapters import Adapter, get_adapter
+from aoc.discovery import Solution
+from aoc.scheduler import usable_cpus
+
+
+@dataclass
+class BatchResult:
+    input: str
+    answers: Dict[int, str] = field(default_factory=dict)
+    elapsed_ms: float = 0.0
+    error: Optional[str] = None
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+
+@dataclass
+class BatchSummary:
+    solved: int
+    failed: int
+    elapsed_s: float
+
+    @property
+    def inputs_per_s(self) -> float:
+        total = self.solved + self.failed
+        return total / self.elapsed_s if self.elapsed_s > 0 else float("inf")
+
+
+def collect_inputs(source: Path) -> List[Path]:
+    """
+    The inputs named by ``source``.
+
+    A directory contributes every ``*.txt`` file in it, sorted by name. Any
+    other file is read as a manifest: one path per line, relative to the
+    manifest's directory, with blank lines and ``#`` comments ignored.
+    """
+    source = Path(source)
+    if source.is_dir():
+        return sorted(p for p in source.glob("*.txt") if p.is_file())
+    inputs = []
+    for line in source.read_text(encoding="utf-8").splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line:
+            inputs.append(source.parent / line)
+    return inputs
+
+
+def solve_input(adapter: Adapter, path: Path) -> BatchResult:
+    """Parse, prepare and solve one input; failures are recorded, not raised."""
+    result = BatchResult(str(path))
+    start = time.perf_counter()
+    try:
+        data = adapter.load(path)
+        for phase, fn in adapter.phases():
+            answer = fn(data)
+            if phase == "solve":
+                answers: Dict[int, Any] = dict(zip((1, 2), answer))
+            else:
+                answers = {int(phase[-1]): answer}
+            result.answers.update((n, str(v)) for n, v in answers.items() if v is not None)
+    except (Exception, SystemExit) as exc:  # several parsers sys.exit() on bad input
+        result.error = f"{type(exc).__name__}: {exc}"
+    result.elapsed_ms = (time.perf_counter() - start) * 1000.0
+    return result
+
+
+_adapter: Optional[Adapter] = None
+
+
+def _init_worker(solution: Solution) -> None:
+    global _adapter
+    _adapter = get_adapter(solution)
+
+
+def _solve_in_worker(path: Path) -> BatchResult:
+    return solve_input(_adapter, path)
+
+
+def default_chunksize(count: int, workers: int) -> int:
+    """About four chunks per worker: few round trips, still balanced at the end."""
+    return max(1, count // (workers * 4))
+
+
+def solve_all(
+    solution: Solution,
+    inputs: Iterable[Path],
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> Iterator[BatchResult]:
+    """
+    Yield one result per input, in input order.
+
+    ``workers`` defaults to the usable cores. With one worker the inputs are
+    solved in this process, without a pool.
+    """
+    inputs = list(inputs)
+    workers = min(workers or len(usable_cpus()), max(1, len(inputs)))
+    if workers == 1:
+        adapter = get_adapter(solution)
+        for path in inputs:
+            yield solve_input(adapter, path)
+        return
+
+    chunksize = chunksize or default_chunksize(len(inputs), workers)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(solution,),
+    ) as pool:
+        yield from pool.map(_solve_in_worker, inputs, chunksize=chunksize)
+
+
+def run_batch(
+    solution: Solution,
+    inputs: Iterable[Path],
+    out: TextIO,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> BatchSummary:
+    """Solve every input, writing each result to ``out`` as it arrives."""
+    solved = failed = 0
+    start = time.perf_counter()
+    for result in solve_all(solution, inputs, workers, chunksize):
+        out.write(result.to_json() + "\n")
+        if result.error is None:
+            solved += 1
+        else:
+            failed += 1
+    return BatchSummary(solved, failed, time.perf_counter() - start)
@@ -0,0 +1,193 @@
+"""
+Content-addressed cache of benchmark results.
+
+A result is stored under the hash of everything that can change it: the
+solution's source files, the input it reads, the day's expected answers
+and the interpreter version. Editing a solution, its input or
+``answers.txt`` therefore invalidates its entry on its own, and the full
+comparison only re-runs what changed. Slow solutions such as
+Day 9 then cost minutes once rather than on every run.
+
+Entries live in ``.aoc-cache/<day>-<agent>/<key>.json``. Results that ended
+in a timeout or out of memory are reused only if the cached run had limits
+at least as generous as the current ones. Entries from ``--no-check`` runs
+are marked unchecked and never served to a run that checks answers.
+"""
+
+import hashlib
+import json
+import shutil
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from aoc.discovery import REPO_ROOT, Solution
+from aoc.harness import default_input
+from aoc.runner import RunResult
+from aoc.sandbox import OOM, TIMEOUT
+
+CACHE_DIR = REPO_ROOT / ".aoc-cache"
+
+# Files in a solution directory that are not part of its source.
+NON_SOURCE_NAMES = {"input.txt"}
+NON_SOURCE_DIRS = {"__pycache__", "bin", "obj", "target"}
+
+
+def _hash_file(digest: Any, path: Path) -> None:
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+
+
+def source_hash(directory: Path) -> str:
+    """Hash of every source file under ``directory``, by relative path and content."""
+    digest = hashlib.sha256()
+    for path in sorted(directory.rglob("*")):
+        relative = path.relative_to(directory)
+        if not path.is_file() or path.name in NON_SOURCE_NAMES:
+            continue
+        if NON_SOURCE_DIRS.intersection(relative.parts[:-1]):
+            continue
+        digest.update(relative.as_posix().encode("utf-8") + b"\0")
+        _hash_file(digest, path)
+    return digest.hexdigest()
+
+
+def input_path(solution: Solution) -> Path:
+    """The input a solution reads when run from its own directory."""
+    local = solution.directory / "input.txt"
+    return local if local.is_file() else default_input(solution.day)
+
+
+def input_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    _hash_file(digest, path)
+    return digest.hexdigest()
+
+
+def answers_hash(day: int) -> str:
+    """Hash of the day's ``answers.txt``, empty if there is none."""
+    path = REPO_ROOT / f"Day {day}" / "Instructions" / "answers.txt"
+    return input_hash(path) if path.is_file() else ""
+
+
+def interpreter_id(python: str = sys.executable) -> str:
+    if python == sys.executable:
+        return f"{sys.implementation.name}-{sys.version.split()[0]}"
+    return python
+
+
+def cache_key(solution: Solution, python: str = sys.executable) -> str:
+    parts = [
+        source_hash(solution.directory),
+        input_hash(input_path(solution)),
+        answers_hash(solution.day),
+        interpreter_id(python),
+    ]
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:32]
+
+
+def _encode(result: RunResult) -> Dict[str, Any]:
+    data = asdict(result)
+    data["answers"] = {str(n): value for n, value in result.answers.items()}
+    return data
+
+
+def _decode(data: Dict[str, Any]) -> RunResult:
+    data = dict(data)
+    data["answers"] = {int(n): value for n, value in data["answers"].items()}
+    return RunResult(**data)
+
+
+def _at_least(cached: Optional[float], current: Optional[float]) -> bool:
+    """Whether a cached limit was at least as generous as the current one."""
+    if cached is None:
+        return True
+    return current is not None and cached >= current
+
+
+class ResultCache:
+    """Cached :class:`RunResult` lists keyed by solution content."""
+
+    def __init__(self, root: Path = CACHE_DIR):
+        self.root = Path(root)
+
+    def _path(self, solution: Solution, key: str) -> Path:
+        return self.root / solution.slug / f"{key}.json"
+
+    def get(
+        self,
+        solution: Solution,
+        runs: int,
+        timeout: Optional[float] = None,
+        memory_mb: Optional[int] = None,
+        checked: bool = False,
+    ) -> Optional[List[RunResult]]:
+        """
+        Cached results for ``solution`` if they still apply, else ``None``.
+
+        Successful entries need at least ``runs`` results; failures are final
+        and reused whenever the limits they hit were no tighter than now.
+        With ``checked``, only entries whose answers were checked apply.
+        """
+        path = self._path(solution, cache_key(solution))
+        if not path.is_file():
+            return None
+        entry = json.loads(path.read_text(encoding="utf-8"))
+        if checked and not entry.get("checked", False):
+            return None
+        results = [_decode(r) for r in entry["results"]]
+        if not results:
+            return None
+
+        last = results[-1]
+        if last.outcome == TIMEOUT and not _at_least(entry["timeout"], timeout):
+            return None
+        if last.outcome == OOM and not _at_least(entry["memory_mb"], memory_mb):
+            return None
+        if last.ok and len(results) < runs:
+            return None
+        return results[:runs] if last.ok else results
+
+    def put(
+        self,
+        solution: Solution,
+        results: List[RunResult],
+        timeout: Optional[float] = None,
+        memory_mb: Optional[int] = None,
+        checked: bool = False,
+    ) -> Path:
+        path = self._path(solution, cache_key(solution))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "solution": solution.key,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "timeout": timeout,
+            "memory_mb": memory_mb,
+            "checked": checked,
+            "results": [_encode(r) for r in results],
+        }
+        path.write_text(json.dumps(entry, indent=2), encoding="utf-8")
+        return path
+
+    def entries(self, solution: Solution) -> List[Path]:
+        directory = self.root / solution.slug
+        return sorted(directory.glob("*.json")) if directory.is_dir() else []
+
+    def is_current(self, solution: Solution, path: Path) -> bool:
+        return path.stem == cache_key(solution)
+
+    def invalidate(self, solution: Solution) -> int:
+        """Drop every entry for ``solution``; returns how many were removed."""
+        entries = self.entries(solution)
+        shutil.rmtree(self.root / solution.slug, ignore_errors=True)
+        return len(entries)
+
+    def prune(self, solution: Solution) -> int:
+        """Drop entries left behind by older versions of ``solution``."""
+        stale = [p for p in self.entries(solution) if not self.is_current(solution, p)]
+        for path in stale:
+            path.unlink()
+        return len(stale)
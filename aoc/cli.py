@@ -0,0 +1,925 @@
+"""
+Command-line entry point: ``python -m aoc <command> [options]``.
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from aoc.discovery import REPO_ROOT, Solution, discover
+from aoc.lazy import lazy_import
+from aoc.runner import RunResult, run_solution
+from aoc.sandbox import ERROR, WRONG_ANSWER
+from aoc.stats import format_ms, summarize
+
+# Each command imports only the modules it uses: bench does not pay for
+# tracemalloc, cProfile or multiprocessing, nor generate for the adapters.
+adapters = lazy_import("aoc.adapters")
+batch = lazy_import("aoc.batch")
+cache = lazy_import("aoc.cache")
+complexity = lazy_import("aoc.complexity")
+dashboard = lazy_import("aoc.dashboard")
+dial_index = lazy_import("aoc.engines.day01_index")
+differential = lazy_import("aoc.differential")
+engines = lazy_import("aoc.engines")
+generators = lazy_import("aoc.generators")
+harness = lazy_import("aoc.harness")
+history = lazy_import("aoc.history")
+id_index = lazy_import("aoc.engines.day02_index")
+profiling = lazy_import("aoc.profiling")
+readme = lazy_import("aoc.readme")
+regression = lazy_import("aoc.regression")
+scheduler = lazy_import("aoc.scheduler")
+startup = lazy_import("aoc.startup")
+streaming = lazy_import("aoc.streaming")
+
+
+def _add_selection_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--day", type=int, action="append", dest="days",
+        help="only run this day (repeatable)",
+    )
+    parser.add_argument(
+        "--agent", action="append", dest="agents",
+        help="only run this agent, e.g. 'Claude CLI' (repeatable)",
+    )
+
+
+def _dial_position(text: str) -> int:
+    """``--position`` for dial-index: a dial position, 0..99."""
+    try:
+        position = int(text)
+    except ValueError:
+        position = -1
+    if not 0 <= position < dial_index.DIAL:
+        raise argparse.ArgumentTypeError(
+            f"{text!r} is not a dial position (0..{dial_index.DIAL - 1})"
+        )
+    return position
+
+
+def _print_row(label: str, kind: str, samples: List[float], extra: str = "") -> None:
+    s = summarize(samples)
+    print(
+        f"{label:<26} {kind:<8} {s.count:>4} {s.median:>11.3f} {s.p95:>11.3f} "
+        f"{s.minimum:>11.3f} {s.stddev:>10.3f}{extra}"
+    )
+
+
+def _describe_failure(result: RunResult) -> str:
+    got = ", ".join(f"{n}={v}" for n, v in sorted(result.answers.items()))
+    if result.outcome == ERROR:
+        return f"error (exit {result.returncode})"
+    if result.outcome == WRONG_ANSWER:
+        return f"wrong answer ({got})"
+    return f"{result.outcome} ({got} so far)" if got else result.outcome
+
+
+def _profile(args: argparse.Namespace, solutions) -> int:
+    for solution in solutions:
+        if not adapters.has_adapter(solution):
+            print(f"{solution.key:<26} no adapter registered")
+            continue
+        print(solution.key)
+        for profile in profiling.profile_solution(solution, args.profile, args.input, top=args.top):
+            print(f"  {profile.phase} ({profile.samples} samples)")
+            for name, ms in profile.top_functions[:5]:
+                print(f"    {ms:>10.2f} ms  {name}")
+            for site, size in profile.top_allocations[:3]:
+                print(f"    {size / 1024:>10.1f} KiB {site}")
+    print(f"Profiles written to {args.profile}")
+    return 0
+
+
+def _record(mode: str, rows: List["history.ResultRow"]) -> None:
+    if not rows:
+        return
+    with history.ResultStore() as store:
+        run_id = store.record_run(mode, rows)
+    print(f"Recorded as run {run_id} in {history.DB_PATH.relative_to(REPO_ROOT)}.")
+
+
+def _bench_in_process(args: argparse.Namespace, solutions) -> int:
+    rows = []
+    print(
+        f"{'Solution':<26} {'Phase':<8} {'Runs':>4} {'Median ms':>11} "
+        f"{'p95 ms':>11} {'Min ms':>11} {'Stddev':>10}"
+    )
+    for solution in solutions:
+        if not adapters.has_adapter(solution):
+            print(f"{solution.key:<26} no adapter registered")
+            continue
+        measurement = harness.measure(
+            solution,
+            input_path=args.input,
+            runs=args.runs,
+            warmup=args.warmup,
+            disable_gc=not args.keep_gc,
+            reuse_prepared=args.reuse_prepared,
+        )
+        label = solution.key
+        for phase, samples in measurement.timings.items():
+            _print_row(label, phase, samples)
+            rows.append(history.ResultRow(solution.day, solution.agent, phase, samples))
+            label = ""
+        for puzzle, answer in sorted(measurement.answers.items()):
+            print(f"{'':<26} Puzzle {puzzle}: {answer}")
+    if not args.no_record and args.input is None:
+        _record("in-process", rows)
+    return 0
+
+
+def _lookup_cache(
+    args: argparse.Namespace,
+    store: Optional["cache.ResultCache"],
+    solution: Solution,
+) -> Tuple[Optional[List[RunResult]], bool]:
+    """
+    Cached results for ``solution``, and whether it has to run anyway.
+
+    Re-timing keeps a validated result's answers, so those runs skip the check.
+    A checking run ignores entries from ``--no-check`` runs.
+    """
+    if store is None or args.force:
+        return None, True
+    cached = store.get(
+        solution, args.runs, timeout=args.timeout, memory_mb=args.memory_limit,
+        checked=not args.no_check,
+    )
+    if cached is None:
+        return None, True
+    return cached, args.retime and cached[-1].ok
+
+
+def _history_rows(solution: Solution, results: List[RunResult]) -> List["history.ResultRow"]:
+    """The wall and self-reported timings of one subprocess benchmark."""
+    failed = next((r.outcome for r in results if not r.ok), "ok")
+    peak = max((r.peak_rss_kb for r in results if r.peak_rss_kb), default=None)
+    rows = [history.ResultRow(
+        solution.day, solution.agent, "wall", [r.wall_ms for r in results], peak, failed,
+    )]
+    reported = [r.reported_ms for r in results if r.reported_ms is not None]
+    if reported:
+        rows.append(history.ResultRow(
+            solution.day, solution.agent, "reported", reported, peak, failed,
+        ))
+    return rows
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    solutions = discover(days=args.days, agents=args.agents)
+    if not solutions:
+        print("No solutions matched the selection.", file=sys.stderr)
+        return 1
+    if args.in_process:
+        if args.update_readme:
+            print("--update-readme needs subprocess timings.", file=sys.stderr)
+            return 1
+        if args.profile is not None:
+            return _profile(args, solutions)
+        return _bench_in_process(args, solutions)
+    if args.input is not None or args.profile is not None:
+        print("--input and --profile need --in-process.", file=sys.stderr)
+        return 1
+
+    print(
+        f"{'Solution':<26} {'Clock':<8} {'Runs':>4} {'Median ms':>11} "
+        f"{'p95 ms':>11} {'Min ms':>11} {'Stddev':>10} {'Peak RSS':>10}"
+    )
+    store = None if args.no_cache else cache.ResultCache()
+    finished: Dict[Solution, scheduler.JobResult] = {}
+    jobs = []
+    for solution in solutions:
+        cached, rerun = _lookup_cache(args, store, solution)
+        if rerun:
+            jobs.append((solution, cached is None and not args.no_check))
+        else:
+            finished[solution] = scheduler.JobResult(solution, cached)
+
+    limits = dict(timeout=args.timeout, memory_mb=args.memory_limit)
+    workers = args.jobs or len(scheduler.worker_cpus(args.spare_cores))
+    for job in scheduler.run_jobs(jobs, args.runs, workers=workers, spare=args.spare_cores, **limits):
+        if store is not None:
+            # Re-timed entries were checked when they were first stored.
+            store.put(job.solution, job.results, checked=not args.no_check, **limits)
+        finished[job.solution] = job
+
+    ran = {solution for solution, _ in jobs}
+    rows = []
+    cells = {}
+    any_cached = False
+    contended = []
+    for solution in solutions:
+        job = finished[solution]
+        results = job.results
+        cached = solution not in ran
+        cells[(solution.day, solution.agent)] = readme.result_cell(results)
+        label = solution.key + (" *" if cached else "")
+        any_cached = any_cached or cached
+        if job.contention is not None and job.contention > scheduler.CONTENTION_WARNING:
+            contended.append(f"{solution.key} (x{job.contention:.2f} on cpu {job.cpu})")
+
+        if not cached:
+            rows += _history_rows(solution, results)
+
+        failed = [r for r in results if not r.ok]
+        if failed:
+            print(
+                f"{label:<26} {_describe_failure(failed[0])} after "
+                f"{format_ms(failed[0].wall_ms)}, peak RSS "
+                f"{failed[0].peak_rss_kb / 1024:.1f} MB"
+            )
+            continue
+
+        peak_mb = max(r.peak_rss_kb for r in results) / 1024
+        _print_row(label, "wall", [r.wall_ms for r in results], f" {peak_mb:>7.1f} MB")
+        reported = [r.reported_ms for r in results if r.reported_ms is not None]
+        if reported:
+            _print_row("", "reported", reported)
+
+    if any_cached:
+        print("* cached result; --retime or --force to run again")
+    if contended:
+        print("Slowed down by parallel runs, timings not comparable to serial: " + ", ".join(contended))
+    if args.update_readme:
+        readme.rewrite_readme(cells)
+        print("README results table updated.")
+    if not args.no_record:
+        _record("subprocess", rows)
+    return 0
+
+
+def cmd_dashboard(args: argparse.Namespace) -> int:
+    if not history.DB_PATH.exists():
+        print("No results recorded yet; run python -m aoc bench first.", file=sys.stderr)
+        return 1
+    with history.ResultStore() as store:
+        results = store.results(mode=args.mode, machine=args.machine)
+    results = [
+        r for r in results
+        if (not args.days or r.day in args.days) and (not args.agents or r.agent in args.agents)
+    ]
+    dashboard.write_dashboard(args.output, results)
+    print(f"Dashboard with {len(results)} results written to {args.output}")
+    return 0
+
+
+def cmd_batch(args: argparse.Namespace) -> int:
+    solutions = [s for s in discover(days=args.days, agents=args.agents) if adapters.has_adapter(s)]
+    if len(solutions) != 1:
+        found = ", ".join(s.key for s in solutions) or "none"
+        print(f"Select exactly one solution with --day and --agent (matched: {found}).",
+              file=sys.stderr)
+        return 1
+    inputs = batch.collect_inputs(args.source)
+    if not inputs:
+        print(f"No inputs found in {args.source}.", file=sys.stderr)
+        return 1
+
+    out = sys.stdout if str(args.output) == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        summary = batch.run_batch(
+            solutions[0], inputs, out, workers=args.jobs or None, chunksize=args.chunksize,
+        )
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(
+        f"{summary.solved} solved, {summary.failed} failed in {summary.elapsed_s:.2f}s "
+        f"({summary.inputs_per_s:.1f} inputs/s)",
+        file=sys.stderr,
+    )
+    return 1 if summary.failed else 0
+
+
+def cmd_cache(args: argparse.Namespace) -> int:
+    store = cache.ResultCache()
+    for solution in discover(days=args.days, agents=args.agents):
+        if args.clear:
+            removed = store.invalidate(solution)
+        elif args.prune:
+            removed = store.prune(solution)
+        else:
+            for path in store.entries(solution):
+                state = "current" if store.is_current(solution, path) else "stale"
+                print(f"{solution.key:<26} {state:<8} {path.relative_to(store.root)}")
+            continue
+        if removed:
+            print(f"{solution.key:<26} removed {removed} entr{'y' if removed == 1 else 'ies'}")
+    return 0
+
+
+def _short(answer: str, width: int = 24) -> str:
+    if len(answer) <= width:
+        return answer
+    return f"{answer[:width - 8]}... ({len(answer)} chars)"
+
+
+def cmd_diff(args: argparse.Namespace) -> int:
+    if args.input is not None and args.scale is not None:
+        print("Use either --input or --scale, not both.", file=sys.stderr)
+        return 1
+
+    status = 0
+    for day in args.days or sorted(generators.GENERATORS):
+        with tempfile.TemporaryDirectory(prefix="aoc-diff-") as work_dir:
+            path = args.input
+            if args.scale is not None:
+                path = generators.write_input(
+                    Path(work_dir) / generators.default_filename(day, args.scale, args.seed),
+                    day, args.scale, args.seed,
+                )
+            store = None if args.no_golden else differential.GoldenStore(day)
+            comparison = differential.compare(
+                day, path, args.agents, timeout=args.timeout,
+                store=store, trusted_only=args.trusted,
+            )
+
+            print(f"Day {day} ({comparison.reference_source} reference)")
+            for result in comparison.results:
+                if result.error is not None:
+                    print(f"  {result.agent:<16} {result.error}")
+                    continue
+                answers = "  ".join(f"{n}={_short(v)}" for n, v in sorted(result.answers.items()))
+                print(f"  {result.agent:<16} {answers}  ({format_ms(result.elapsed_ms)})")
+
+            disagreements = comparison.disagreements()
+            for puzzle, by_answer in disagreements.items():
+                status = 1
+                votes = "; ".join(
+                    f"{_short(answer)} from {', '.join(agents)}" for answer, agents in by_answer.items()
+                )
+                print(f"  puzzle {puzzle} disagrees: {votes}")
+            if not disagreements or not args.shrink:
+                continue
+            if args.scale is None:
+                print("  --shrink needs a generated input (--scale).")
+                continue
+
+            puzzle, by_answer = next(iter(disagreements.items()))
+            agents = [agent for group in by_answer.values() for agent in group]
+            out = args.out_dir / f"day{day:02d}-counterexample.txt"
+            out.parent.mkdir(parents=True, exist_ok=True)
+            lines = differential.shrink_generated(
+                day, args.scale, args.seed, agents, puzzle, out,
+                timeout=args.timeout, max_tests=args.max_tests,
+            )
+            print(f"  shrunk to {len(lines)} lines -> {out}")
+    return status
+
+
+def cmd_generate(args: argparse.Namespace) -> int:
+    days = args.days or sorted(generators.GENERATORS)
+    if args.output is not None and (len(days) != 1 or len(args.scales) != 1):
+        print("--output needs exactly one --day and one --scale.", file=sys.stderr)
+        return 1
+
+    for day in days:
+        for scale in args.scales:
+            path = args.output or args.out_dir / generators.default_filename(day, scale, args.seed)
+            generators.write_input(path, day, scale, args.seed)
+            print(f"Day {day} x{scale:g} -> {path}")
+    return 0
+
+
+def _measure_suite(args: argparse.Namespace) -> Dict[str, Dict[str, List[float]]]:
+    solutions = [s for s in discover(days=args.days, agents=args.agents) if adapters.has_adapter(s)]
+    measurements = []
+    for solution in solutions:
+        print(f"Measuring {solution.key} ...", file=sys.stderr)
+        measurements.append(harness.measure(solution, runs=args.runs, warmup=args.warmup))
+    return regression.samples_from(measurements)
+
+
+def cmd_baseline(args: argparse.Namespace) -> int:
+    samples = _measure_suite(args)
+    if not samples:
+        print("No solutions matched the selection.", file=sys.stderr)
+        return 1
+    if args.output.is_file() and (args.days or args.agents):
+        # Partial runs refresh only the selected entries.
+        samples = {**regression.load_baseline(args.output), **samples}
+    regression.save_baseline(args.output, samples)
+    print(f"Baseline for {len(samples)} solutions written to {args.output}")
+    return 0
+
+
+def cmd_compare(args: argparse.Namespace) -> int:
+    baseline = regression.load_baseline(args.baseline)
+    current = _measure_suite(args)
+    comparisons = regression.compare_samples(
+        baseline, current, method=args.method,
+        alpha=args.alpha, threshold=args.threshold / 100.0,
+    )
+
+    print(
+        f"{'Solution':<26} {'Phase':<8} {'Base ms':>11} {'Now ms':>11} "
+        f"{'Ratio':>7} {'Evidence':>18}  Verdict"
+    )
+    for c in comparisons:
+        evidence = (
+            f"p={c.p_value:.4f}" if c.p_value is not None else f"[{c.low:.3f}, {c.high:.3f}]"
+        )
+        print(
+            f"{c.key:<26} {c.phase:<8} {c.baseline_ms:>11.3f} {c.current_ms:>11.3f} "
+            f"{c.ratio:>7.3f} {evidence:>18}  {c.verdict}"
+        )
+    for key in sorted(set(current) - set(baseline)):
+        print(f"{key:<26} not in baseline")
+
+    regressions = [c for c in comparisons if c.verdict == regression.REGRESSION]
+    if regressions:
+        print(f"{len(regressions)} significant slowdown(s) above {args.threshold:g}%.")
+        return 1
+    return 0
+
+
+def cmd_stream(args: argparse.Namespace) -> int:
+    if args.stdin and args.input is not None:
+        print("Use either --stdin or --input, not both.", file=sys.stderr)
+        return 1
+    if args.day not in streaming.STREAMERS:
+        print(
+            f"No streaming solver for day {args.day}, expected one of "
+            f"{sorted(streaming.STREAMERS)}", file=sys.stderr,
+        )
+        return 1
+    start = time.perf_counter()
+    if args.stdin:
+        answers = streaming.solve_stream(args.day, sys.stdin.buffer)
+    else:
+        path = args.input or harness.default_input(args.day)
+        with open(path, "rb") as f:
+            answers = streaming.solve_stream(args.day, f)
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+
+    for puzzle, answer in enumerate(answers, start=1):
+        if answer is not None:
+            print(f"Puzzle {puzzle}: {answer}")
+    print(f"Total Duration: {elapsed_ms:.3f}ms")
+    return 0
+
+
+def cmd_engine(args: argparse.Namespace) -> int:
+    if args.day not in engines.DAYS:
+        print(
+            f"No engines for day {args.day}, expected one of {sorted(engines.DAYS)}",
+            file=sys.stderr,
+        )
+        return 1
+    names = engines.names(args.day)
+    engine = args.engine or names[0]
+    path = args.input or harness.default_input(args.day)
+    start = time.perf_counter()
+    try:
+        answers = engines.solve(args.day, engine, path)
+    except (ValueError, ImportError) as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+
+    for puzzle, answer in enumerate(answers, start=1):
+        if answer is not None:
+            print(f"Puzzle {puzzle}: {answer}")
+    print(f"Total Duration: {elapsed_ms:.3f}ms")
+    return 0
+
+
+def cmd_dial_index(args: argparse.Namespace) -> int:
+    if args.action in ("build", "append"):
+        source = args.input or harness.default_input(1)
+        lines = sys.stdin if str(source) == "-" else open(source, encoding="utf-8")
+        try:
+            if args.action == "build":
+                index = dial_index.build(args.index, lines)
+                added = len(index)
+            else:
+                index = dial_index.RotationIndex(args.index)
+                added = dial_index.append_lines(index, lines)
+        finally:
+            if lines is not sys.stdin:
+                lines.close()
+        print(f"{added} rotations added; {len(index)} in {args.index}")
+        index.close()
+        return 0
+
+    with dial_index.RotationIndex(args.index) as index:
+        i, j = args.range or (0, len(index))
+        try:
+            end, at_zero, passed_zero = index.query(i, j, args.position)
+        except (IndexError, ValueError) as exc:
+            print(exc, file=sys.stderr)
+            return 1
+        start = index.position(i) if args.position is None else args.position
+    print(f"Rotations {i}..{j} from position {start}: ends at {end}")
+    print(f"Puzzle 1: {at_zero}")
+    print(f"Puzzle 2: {passed_zero}")
+    return 0
+
+
+def cmd_id_index(args: argparse.Namespace) -> int:
+    try:
+        if args.action == "build":
+            start = time.perf_counter()
+            index = id_index.RepeatedIdIndex.create(args.index, args.digits)
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+            print(
+                f"{len(index)} IDs up to {index.digits} digits in {args.index} "
+                f"({format_ms(elapsed_ms)})"
+            )
+            return 0
+
+        index = id_index.RepeatedIdIndex(args.index)
+        ranges = engines.DAYS[2].read_ranges(args.input or harness.default_input(2))
+        start = time.perf_counter()
+        answers = index.solve(ranges)
+    except (ValueError, ImportError) as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+
+    for puzzle, answer in enumerate(answers, start=1):
+        print(f"Puzzle {puzzle}: {answer}")
+    print(f"Total Duration: {elapsed_ms:.3f}ms")
+    return 0
+
+
+def cmd_startup(args: argparse.Namespace) -> int:
+    solutions = discover(days=args.days, agents=args.agents)
+    if not solutions:
+        print("No solutions matched the selection.", file=sys.stderr)
+        return 1
+
+    flags = ["-S"] if args.no_site else []
+    interpreter = startup.interpreter_ms(flags=flags, runs=args.runs)
+    print(f"Interpreter startup{' (-S)' if flags else ''}: {format_ms(interpreter)}")
+    print(
+        f"{'Solution':<26} {'Wall':>10} {'Interp.':>10} {'Imports':>10} "
+        f"{'Solve':>10} {'Other':>10}  Heaviest imports"
+    )
+    for solution in solutions:
+        profile = startup.StartupProfile(solution, interpreter)
+        profile.imports = startup.solution_imports(solution, flags=flags, runs=args.runs)
+        results = run_solution(
+            solution, args.runs, timeout=args.timeout, check=False, python_flags=flags,
+        )
+        if results and all(r.ok for r in results):
+            profile.wall_ms = statistics.median(r.wall_ms for r in results)
+            reported = [r.reported_ms for r in results if r.reported_ms is not None]
+            profile.solve_ms = statistics.median(reported) if reported else None
+
+        heaviest = sorted(
+            (r for r in profile.imports if r.depth == 0),
+            key=lambda r: r.cumulative_us, reverse=True,
+        )[:3]
+        cells = [
+            format_ms(value) if value is not None else "-"
+            for value in (profile.wall_ms, interpreter, profile.import_ms,
+                          profile.solve_ms, profile.other_ms)
+        ]
+        names = ", ".join(f"{r.name} {format_ms(r.cumulative_us / 1000.0)}" for r in heaviest)
+        print(f"{solution.key:<26} " + " ".join(f"{c:>10}" for c in cells) + f"  {names}")
+    return 0
+
+
+def cmd_complexity(args: argparse.Namespace) -> int:
+    solutions = [s for s in discover(days=args.days, agents=args.agents) if adapters.has_adapter(s)]
+    if not solutions:
+        print("No solutions matched the selection.", file=sys.stderr)
+        return 1
+
+    scales = complexity.geometric_scales(args.start, args.factor, args.steps)
+    reports = []
+    with tempfile.TemporaryDirectory(prefix="aoc-complexity-") as work_dir:
+        for solution in solutions:
+            report = complexity.profile_complexity(
+                solution, scales, Path(work_dir),
+                runs=args.runs, seed=args.seed,
+                budget_s=args.budget, track=args.track or (),
+            )
+            reports.append(report)
+            print(report.summary())
+
+    if args.json is not None:
+        args.json.write_text(
+            json.dumps([r.to_json() for r in reports], indent=2), encoding="utf-8",
+        )
+        print(f"Report written to {args.json}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc",
+        description="Benchmark the Advent of Code 2025 agent solutions.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    bench = commands.add_parser(
+        "bench", help="run every solution K times in fresh interpreters",
+    )
+    _add_selection_args(bench)
+    bench.add_argument("--runs", type=int, default=5, help="runs per solution")
+    bench.add_argument(
+        "--timeout", type=float, default=300.0,
+        help="seconds before a run is killed",
+    )
+    bench.add_argument(
+        "--memory-limit", type=int, metavar="MB",
+        help="address-space limit per run (RLIMIT_AS); exceeding it counts as oom",
+    )
+    bench.add_argument(
+        "--no-check", action="store_true",
+        help="do not compare answers against Day N/Instructions/answers.txt",
+    )
+    bench.add_argument(
+        "--update-readme", action="store_true",
+        help="rewrite the README results table from the measurements",
+    )
+    bench.add_argument(
+        "--in-process", action="store_true",
+        help="import each solution once and time parse/part1/part2 separately",
+    )
+    bench.add_argument(
+        "--warmup", type=int, default=1,
+        help="untimed runs before measuring (--in-process only)",
+    )
+    bench.add_argument(
+        "--keep-gc", action="store_true",
+        help="leave the garbage collector running while timing (--in-process only)",
+    )
+    bench.add_argument(
+        "--reuse-prepared", action="store_true",
+        help="parse and prepare once, then time only the parts on every run "
+             "(--in-process only)",
+    )
+    bench.add_argument(
+        "--input", type=Path,
+        help="input file to use instead of the day's Instructions/input.txt "
+             "(--in-process only)",
+    )
+    bench.add_argument(
+        "--profile", type=Path, metavar="DIR",
+        help="profile each phase instead of timing it and write pstats, collapsed "
+             "stacks and allocation sites to DIR (--in-process only)",
+    )
+    bench.add_argument(
+        "--top", type=int, default=15, help="rows kept in --profile reports",
+    )
+    bench.add_argument(
+        "--force", action="store_true",
+        help="ignore cached results and re-run everything",
+    )
+    bench.add_argument(
+        "--retime", action="store_true",
+        help="re-run cached solutions for fresh timings, keeping their validation",
+    )
+    bench.add_argument(
+        "--no-cache", action="store_true",
+        help="neither read nor write the result cache",
+    )
+    bench.add_argument(
+        "-j", "--jobs", type=int, default=1,
+        help="solutions to run in parallel, one pinned core each (0: all free cores)",
+    )
+    bench.add_argument(
+        "--spare-cores", type=int, default=1,
+        help="cores left to the system when running in parallel",
+    )
+    bench.add_argument(
+        "--no-record", action="store_true",
+        help="do not append this run to benchmarks/results.sqlite",
+    )
+    bench.set_defaults(func=cmd_bench)
+
+    dashboard_parser = commands.add_parser(
+        "dashboard", help="render the recorded results as a static HTML page",
+    )
+    _add_selection_args(dashboard_parser)
+    dashboard_parser.add_argument(
+        "-o", "--output", type=Path, default=Path("benchmarks/dashboard.html"),
+        help="HTML file to write (default: benchmarks/dashboard.html)",
+    )
+    dashboard_parser.add_argument(
+        "--mode", choices=("subprocess", "in-process"),
+        help="only runs of this kind (default: both)",
+    )
+    dashboard_parser.add_argument("--machine", help="only runs with this machine fingerprint")
+    dashboard_parser.set_defaults(func=cmd_dashboard)
+
+    batch_parser = commands.add_parser(
+        "batch", help="solve many inputs with one solution in a pool of warm workers",
+    )
+    _add_selection_args(batch_parser)
+    batch_parser.add_argument(
+        "source", type=Path,
+        help="directory of *.txt inputs, or a manifest listing one input path per line",
+    )
+    batch_parser.add_argument(
+        "-o", "--output", type=Path, default=Path("-"),
+        help="JSON lines file for the answers (default: stdout)",
+    )
+    batch_parser.add_argument(
+        "-j", "--jobs", type=int, default=0,
+        help="worker processes (default 0: one per usable core)",
+    )
+    batch_parser.add_argument(
+        "--chunksize", type=int,
+        help="inputs sent to a worker at a time (default: about 4 chunks per worker)",
+    )
+    batch_parser.set_defaults(func=cmd_batch)
+
+    cache_parser = commands.add_parser(
+        "cache", help="list or invalidate cached benchmark results",
+    )
+    _add_selection_args(cache_parser)
+    action = cache_parser.add_mutually_exclusive_group()
+    action.add_argument("--clear", action="store_true", help="remove all entries")
+    action.add_argument(
+        "--prune", action="store_true",
+        help="remove entries for old versions of the source or input",
+    )
+    cache_parser.set_defaults(func=cmd_cache)
+
+    diff = commands.add_parser(
+        "diff", help="run every agent on the same input and compare answers",
+    )
+    _add_selection_args(diff)
+    diff.add_argument("--input", type=Path, help="input file (default: the real input)")
+    diff.add_argument("--scale", type=float, help="use a generated input of this scale")
+    diff.add_argument("--seed", type=int, default=0)
+    diff.add_argument(
+        "--timeout", type=float, default=60.0, help="seconds per agent and input",
+    )
+    diff.add_argument(
+        "--shrink", action="store_true",
+        help="reduce a disagreeing generated input to a small counterexample",
+    )
+    diff.add_argument("--max-tests", type=int, default=200, help="shrinking budget")
+    diff.add_argument(
+        "--out-dir", type=Path, default=Path("generated"),
+        help="where counterexamples are written (default: ./generated)",
+    )
+    diff.add_argument(
+        "--trusted", action="store_true",
+        help="on inputs without golden answers, run only the day's trusted agent",
+    )
+    diff.add_argument(
+        "--no-golden", action="store_true", help="neither read nor record golden answers",
+    )
+    diff.set_defaults(func=cmd_diff)
+
+    baseline = commands.add_parser(
+        "baseline", help="record in-process timing distributions as a baseline",
+    )
+    compare = commands.add_parser(
+        "compare", help="flag significant slowdowns against a stored baseline",
+    )
+    for sub in (baseline, compare):
+        _add_selection_args(sub)
+        sub.add_argument("--runs", type=int, default=20, help="timed runs per solution")
+        sub.add_argument("--warmup", type=int, default=2, help="untimed runs first")
+    baseline.add_argument(
+        "-o", "--output", type=Path, default=Path("benchmarks/baseline.json"),
+        help="baseline file (default: benchmarks/baseline.json)",
+    )
+    baseline.set_defaults(func=cmd_baseline)
+    compare.add_argument(
+        "--baseline", type=Path, default=Path("benchmarks/baseline.json"),
+        help="baseline file (default: benchmarks/baseline.json)",
+    )
+    compare.add_argument("--method", choices=regression.METHODS, default="mann-whitney")
+    compare.add_argument(
+        "--alpha", type=float, default=0.01, help="significance level (default 0.01)",
+    )
+    compare.add_argument(
+        "--threshold", type=float, default=5.0,
+        help="smallest median slowdown in percent that counts (default 5)",
+    )
+    compare.set_defaults(func=cmd_compare)
+
+    startup_parser = commands.add_parser(
+        "startup", help="split end-to-end time into interpreter, imports and solve",
+    )
+    _add_selection_args(startup_parser)
+    startup_parser.add_argument("--runs", type=int, default=5, help="runs per measurement")
+    startup_parser.add_argument(
+        "--timeout", type=float, default=60.0, help="seconds before a run is killed",
+    )
+    startup_parser.add_argument(
+        "--no-site", action="store_true",
+        help="run everything with python -S (skips site, ~5 ms less per start)",
+    )
+    startup_parser.set_defaults(func=cmd_startup)
+
+    stream = commands.add_parser(
+        "stream", help="solve a line-oriented day while reading its input",
+    )
+    # Days are checked in the commands: listing them here would import the
+    # streaming and engine modules for every command.
+    stream.add_argument("--day", type=int, required=True)
+    stream.add_argument(
+        "--stdin", action="store_true", help="read the input from standard input",
+    )
+    stream.add_argument("--input", type=Path, help="input file (default: the real input)")
+    stream.set_defaults(func=cmd_stream)
+
+    engine = commands.add_parser(
+        "engine", help="solve a day with one of the scalable reference engines",
+    )
+    engine.add_argument("--day", type=int, required=True)
+    engine.add_argument("--engine", help="engine name (default: the day's first)")
+    engine.add_argument("--input", type=Path, help="input file (default: the real input)")
+    engine.set_defaults(func=cmd_engine)
+
+    dial = commands.add_parser(
+        "dial-index", help="build, extend or query a Day 1 rotation index",
+    )
+    dial.add_argument("action", choices=("build", "append", "query"))
+    dial.add_argument(
+        "--index", type=Path, default=Path(".aoc-cache/dial-index"),
+        help="index directory (default: .aoc-cache/dial-index)",
+    )
+    dial.add_argument(
+        "--input", type=Path,
+        help="rotation log to build from or append, '-' for stdin (default: the real input)",
+    )
+    dial.add_argument(
+        "--range", nargs=2, type=int, metavar=("I", "J"),
+        help="query rotations I..J-1 (default: the whole log)",
+    )
+    dial.add_argument(
+        "--position", type=_dial_position,
+        help="start the query at this dial position instead of the logged one",
+    )
+    dial.set_defaults(func=cmd_dial_index)
+
+    ids = commands.add_parser(
+        "id-index", help="build or query a Day 2 index of repeated-block IDs",
+    )
+    ids.add_argument("action", choices=("build", "query"))
+    ids.add_argument(
+        "--index", type=Path, default=Path(".aoc-cache/id-index"),
+        help="index directory (default: .aoc-cache/id-index)",
+    )
+    ids.add_argument(
+        "--digits", type=int, default=12,
+        help="build: index every ID with up to this many digits (default: 12)",
+    )
+    ids.add_argument("--input", type=Path, help="query: ranges file (default: the real input)")
+    ids.set_defaults(func=cmd_id_index)
+
+    generate = commands.add_parser(
+        "generate", help="write seeded synthetic puzzle inputs",
+    )
+    generate.add_argument(
+        "--day", type=int, action="append", dest="days",
+        choices=sorted(generators.GENERATORS), help="day to generate (repeatable, default: all)",
+    )
+    generate.add_argument(
+        "--scale", type=float, action="append", dest="scales",
+        help="size relative to the real input, e.g. 10, 100, 1000 (repeatable)",
+    )
+    generate.add_argument("--seed", type=int, default=0)
+    generate.add_argument(
+        "--out-dir", type=Path, default=Path("generated"),
+        help="directory for generated files (default: ./generated)",
+    )
+    generate.add_argument("-o", "--output", type=Path, help="write a single file here")
+    generate.set_defaults(func=cmd_generate, scales=None)
+
+    complexity = commands.add_parser(
+        "complexity",
+        help="fit time and memory against input size on generated inputs",
+    )
+    _add_selection_args(complexity)
+    complexity.add_argument("--start", type=float, default=0.25, help="smallest scale")
+    complexity.add_argument("--factor", type=float, default=2.0, help="growth per step")
+    complexity.add_argument("--steps", type=int, default=5, help="number of sizes")
+    complexity.add_argument("--runs", type=int, default=3, help="timed runs per size")
+    complexity.add_argument("--seed", type=int, default=0)
+    complexity.add_argument(
+        "--budget", type=float, default=60.0,
+        help="stop growing once one size takes longer than this many seconds",
+    )
+    complexity.add_argument(
+        "--track", action="append",
+        help="also count calls to this module function, e.g. "
+             "'UnionFind.get_component_sizes' (repeatable)",
+    )
+    complexity.add_argument("--json", type=Path, help="write the full report here")
+    complexity.set_defaults(func=cmd_complexity)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if getattr(args, "scales", ()) is None:
+        args.scales = [1.0]
+    return args.func(args)
@@ -0,0 +1,252 @@
+"""
+Empirical complexity profiler.
+
+Runs a solution through its adapter on generated inputs of geometrically
+growing size, then fits time and peak memory of each phase against the
+input size. The fitted exponent is the solution's practical complexity:
+about 1 for linear work, 2 for all-pairs loops such as Day 8's edge list.
+
+Individual module functions can be tracked too (``--track``), reporting how
+the number of calls and the time per call grow. This separates "called
+more often" from "each call got slower", e.g. Day 8 Claude's
+``UnionFind.get_component_sizes``, which is called once per edge and is
+O(n) itself.
+"""
+
+import functools
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from aoc.adapters import get_adapter, load_module
+from aoc.discovery import Solution
+from aoc.generators import default_filename, write_input
+from aoc.harness import measure
+from aoc.stats import PowerFit, fit_power_law
+
+
+@dataclass
+class SizePoint:
+    """Measurements for one input size."""
+
+    scale: float
+    input_bytes: int
+    time_ms: Dict[str, float] = field(default_factory=dict)
+    peak_bytes: Dict[str, int] = field(default_factory=dict)
+    # tracked function -> (calls, total milliseconds)
+    calls: Dict[str, Tuple[int, float]] = field(default_factory=dict)
+
+
+@dataclass
+class ComplexityReport:
+    solution: Solution
+    points: List[SizePoint] = field(default_factory=list)
+    stopped_early: bool = False
+
+    def _fit(self, values: Sequence[Tuple[int, float]]) -> Optional[PowerFit]:
+        try:
+            return fit_power_law([x for x, _ in values], [y for _, y in values])
+        except ValueError:
+            return None
+
+    def fits(self) -> Dict[str, Dict[str, Optional[PowerFit]]]:
+        """Power-law fits keyed by phase or tracked function, then metric."""
+        fits: Dict[str, Dict[str, Optional[PowerFit]]] = {}
+        phases = [p for p in self.points[0].time_ms] if self.points else []
+        for phase in phases:
+            fits[phase] = {
+                "time": self._fit([(p.input_bytes, p.time_ms[phase]) for p in self.points]),
+                "memory": self._fit([(p.input_bytes, p.peak_bytes[phase]) for p in self.points]),
+            }
+        names = [name for name in self.points[0].calls] if self.points else []
+        for name in names:
+            calls = [(p.input_bytes, p.calls[name]) for p in self.points]
+            fits[name] = {
+                "calls": self._fit([(x, c) for x, (c, _) in calls]),
+                "time_per_call": self._fit([(x, ms / c) for x, (c, ms) in calls if c]),
+            }
+        return fits
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "day": self.solution.day,
+            "agent": self.solution.agent,
+            "stopped_early": self.stopped_early,
+            "points": [
+                {
+                    "scale": p.scale,
+                    "input_bytes": p.input_bytes,
+                    "time_ms": p.time_ms,
+                    "peak_bytes": p.peak_bytes,
+                    "calls": {
+                        name: {"calls": c, "total_ms": ms} for name, (c, ms) in p.calls.items()
+                    },
+                }
+                for p in self.points
+            ],
+            "fits": {
+                name: {
+                    metric: None if fit is None else {
+                        "exponent": fit.exponent,
+                        "coefficient": fit.coefficient,
+                        "r_squared": fit.r_squared,
+                    }
+                    for metric, fit in metrics.items()
+                }
+                for name, metrics in self.fits().items()
+            },
+        }
+
+    def summary(self) -> str:
+        if not self.points:
+            return f"{self.solution.key}: no sizes completed"
+        scales = [p.scale for p in self.points]
+        lines = [
+            f"{self.solution.key} (x{min(scales):g} .. x{max(scales):g}, "
+            f"{len(self.points)} sizes{', stopped at time budget' if self.stopped_early else ''})"
+        ]
+        for name, metrics in self.fits().items():
+            parts = [f"{metric} ~ {_describe(fit)}" for metric, fit in metrics.items()]
+            lines.append(f"  {name:<30} " + "   ".join(parts))
+        return "\n".join(lines)
+
+
+def _describe(fit: Optional[PowerFit]) -> str:
+    if fit is None:
+        return "n/a"
+    return f"n^{fit.exponent:.2f} (R²={fit.r_squared:.2f})"
+
+
+def geometric_scales(start: float, factor: float, steps: int) -> List[float]:
+    return [start * factor ** i for i in range(steps)]
+
+
+def _resolve(module: Any, dotted: str) -> Tuple[Any, str]:
+    """Return ``(owner, attribute)`` for ``name`` or ``Class.method``."""
+    owner = module
+    parts = dotted.split(".")
+    for part in parts[:-1]:
+        owner = getattr(owner, part)
+    if not hasattr(owner, parts[-1]):
+        raise AttributeError(f"{dotted!r} not found in solution module")
+    return owner, parts[-1]
+
+
+class FunctionTracker:
+    """
+    Temporarily wrap module functions to count calls and time spent.
+
+    Recursive calls are counted, but only the outermost call is timed so
+    nothing is counted twice.
+    """
+
+    def __init__(self, module: Any, names: Iterable[str]):
+        self.module = module
+        self.names = list(names)
+        self.stats: Dict[str, List[float]] = {}
+        self._originals: List[Tuple[Any, str, Any]] = []
+
+    def _wrap(self, name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        stats = self.stats.setdefault(name, [0, 0.0])
+        depth = [0]
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            stats[0] += 1
+            if depth[0]:
+                return fn(*args, **kwargs)
+            depth[0] += 1
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                stats[1] += (time.perf_counter() - start) * 1000.0
+                depth[0] -= 1
+
+        return wrapper
+
+    def __enter__(self) -> "FunctionTracker":
+        for name in self.names:
+            owner, attr = _resolve(self.module, name)
+            original = owner.__dict__[attr] if isinstance(owner, type) else getattr(owner, attr)
+            self._originals.append((owner, attr, original))
+            setattr(owner, attr, self._wrap(name, getattr(owner, attr)))
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        for owner, attr, original in reversed(self._originals):
+            setattr(owner, attr, original)
+        self._originals.clear()
+
+    def results(self) -> Dict[str, Tuple[int, float]]:
+        return {name: (int(c), ms) for name, (c, ms) in self.stats.items()}
+
+
+def peak_memory(solution: Solution, path: Path) -> Dict[str, int]:
+    """Peak bytes allocated by each phase, measured with ``tracemalloc``."""
+    adapter = get_adapter(solution)
+    peaks: Dict[str, int] = {}
+
+    def traced(name: str, fn: Callable[[Any], Any], arg: Any) -> Any:
+        tracemalloc.start()
+        try:
+            result = fn(arg)
+            peaks[name] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        return result
+
+    data = traced("parse", adapter.parse, path)
+    if adapter.prepare is not None:
+        data = traced("prepare", adapter.prepare, data)
+    for phase, fn in adapter.phases():
+        traced(phase, fn, data)
+    return peaks
+
+
+def profile_complexity(
+    solution: Solution,
+    scales: Sequence[float],
+    work_dir: Path,
+    runs: int = 3,
+    seed: int = 0,
+    budget_s: float = 60.0,
+    track: Sequence[str] = (),
+) -> ComplexityReport:
+    """
+    Measure ``solution`` at each scale, smallest first.
+
+    Larger sizes are skipped once one size takes longer than ``budget_s``
+    to measure, since the next (bigger) one would take longer still.
+    """
+    report = ComplexityReport(solution)
+    module = load_module(solution)
+
+    for scale in sorted(scales):
+        path = write_input(
+            Path(work_dir) / default_filename(solution.day, scale, seed),
+            solution.day, scale, seed,
+        )
+        point = SizePoint(scale, path.stat().st_size)
+
+        start = time.perf_counter()
+        measurement = measure(solution, path, runs=runs, warmup=0)
+        point.time_ms = {
+            phase: statistics.median(samples)
+            for phase, samples in measurement.timings.items()
+        }
+        point.peak_bytes = peak_memory(solution, path)
+        if track:
+            with FunctionTracker(module, track) as tracker:
+                measure(solution, path, runs=1, warmup=0)
+            point.calls = tracker.results()
+        report.points.append(point)
+
+        if time.perf_counter() - start > budget_s:
+            report.stopped_early = scale != max(scales)
+            break
+
+    return report
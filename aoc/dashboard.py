@@ -0,0 +1,206 @@
+"""
+Static HTML dashboard over the results store.
+
+One self-contained page, with no scripts and no external assets:
+
+- the agent comparison: the latest median of each day and agent, with the
+  fastest of each day highlighted (what the README table shows by hand);
+- one trend chart per day: median time of each agent across runs, on a
+  log scale, as inline SVG. Hovering a point shows its run, commit and
+  machine.
+
+Subprocess runs are charted by their wall time and in-process runs by the
+sum of their phase medians, each mode in its own section.
+"""
+
+import html
+import math
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from aoc.history import StoredResult
+from aoc.stats import format_ms
+
+COLOURS = {
+    "Claude CLI": "#d97706",
+    "Google Gemini": "#2563eb",
+    "Chat GPT": "#059669",
+    "Human": "#6b7280",
+}
+
+MODE_TITLES = {
+    "subprocess": "subprocess runs, wall time",
+    "in-process": "in-process runs, sum of phase medians",
+}
+
+WIDTH, HEIGHT, MARGIN = 560, 240, 48
+
+
+@dataclass
+class Point:
+    run_id: int
+    created: str
+    git_commit: Optional[str]
+    machine: str
+    mode: str
+    median_ms: Optional[float]
+    outcome: str
+
+
+def points(results: Iterable[StoredResult]) -> Dict[int, Dict[str, List[Point]]]:
+    """``day -> agent -> points`` in run order, one point per run."""
+    grouped: Dict[Tuple[int, int, str], List[StoredResult]] = defaultdict(list)
+    for result in results:
+        grouped[(result.run_id, result.day, result.agent)].append(result)
+
+    series: Dict[int, Dict[str, List[Point]]] = defaultdict(lambda: defaultdict(list))
+    for (run_id, day, agent), rows in sorted(grouped.items()):
+        first = rows[0]
+        failed = next((r.outcome for r in rows if r.outcome != "ok"), None)
+        if first.mode == "subprocess":
+            medians = [r.median_ms for r in rows if r.phase == "wall"]
+        else:
+            medians = [r.median_ms for r in rows]
+        value = None
+        if failed is None and medians and None not in medians:
+            value = sum(medians)
+        series[day][agent].append(Point(
+            run_id, first.created, first.git_commit, first.machine, first.mode,
+            value, failed or "ok",
+        ))
+    return series
+
+
+def _y(value: float, low: float, high: float) -> float:
+    span = math.log10(high) - math.log10(low) or 1.0
+    fraction = (math.log10(value) - math.log10(low)) / span
+    return HEIGHT - MARGIN / 2 - fraction * (HEIGHT - MARGIN)
+
+
+def trend_chart(day: int, by_agent: Dict[str, List[Point]]) -> str:
+    """Inline SVG with one line per agent, x = run order, y = log median."""
+    runs = sorted({p.run_id for pts in by_agent.values() for p in pts})
+    values = [p.median_ms for pts in by_agent.values() for p in pts if p.median_ms]
+    if not values:
+        return f"<p>Day {day}: no successful runs recorded.</p>"
+    low = 10 ** math.floor(math.log10(min(values)))
+    high = 10 ** math.ceil(math.log10(max(values)))
+    if high <= low:
+        high = low * 10
+    step = (WIDTH - 2 * MARGIN) / max(1, len(runs) - 1)
+    x_of = {run: MARGIN + i * step for i, run in enumerate(runs)}
+
+    parts = [
+        f'<svg width="{WIDTH}" height="{HEIGHT}" role="img" '
+        f'aria-label="Day {day} median time per run">'
+    ]
+    decade = low
+    while decade <= high:
+        y = _y(decade, low, high)
+        parts.append(
+            f'<line x1="{MARGIN}" x2="{WIDTH - MARGIN / 2}" y1="{y:.1f}" y2="{y:.1f}" '
+            f'class="grid"/><text x="{MARGIN - 4}" y="{y + 4:.1f}" class="axis">'
+            f"{html.escape(format_ms(decade))}</text>"
+        )
+        decade *= 10
+
+    for agent, pts in sorted(by_agent.items()):
+        colour = COLOURS.get(agent, "#111827")
+        ok = [p for p in pts if p.median_ms]
+        if len(ok) > 1:
+            path = " ".join(f"{x_of[p.run_id]:.1f},{_y(p.median_ms, low, high):.1f}" for p in ok)
+            parts.append(f'<polyline points="{path}" stroke="{colour}" class="line"/>')
+        for p in pts:
+            label = html.escape(
+                f"{agent}: {format_ms(p.median_ms) if p.median_ms else p.outcome} "
+                f"(run {p.run_id}, {p.created}, {p.git_commit or 'no commit'}, "
+                f"{p.mode}, machine {p.machine})"
+            )
+            if p.median_ms:
+                y = _y(p.median_ms, low, high)
+                parts.append(
+                    f'<circle cx="{x_of[p.run_id]:.1f}" cy="{y:.1f}" r="3" '
+                    f'fill="{colour}"><title>{label}</title></circle>'
+                )
+            else:  # failures sit on the top edge as crosses
+                x, y = x_of[p.run_id], MARGIN / 4
+                parts.append(
+                    f'<text x="{x:.1f}" y="{y + 4:.1f}" fill="{colour}" '
+                    f'class="fail">x<title>{label}</title></text>'
+                )
+    parts.append("</svg>")
+    legend = " ".join(
+        f'<span style="color:{COLOURS.get(agent, "#111827")}">&#9679; {html.escape(agent)}</span>'
+        for agent in sorted(by_agent)
+    )
+    return f"<h3>Day {day}</h3>\n{''.join(parts)}\n<p class=\"legend\">{legend}</p>"
+
+
+def comparison_table(series: Dict[int, Dict[str, List[Point]]]) -> str:
+    """Latest recorded result of each day and agent; the fastest is bold."""
+    agents = sorted({agent for by_agent in series.values() for agent in by_agent})
+    rows = ["<tr><th>Day</th>" + "".join(f"<th>{html.escape(a)}</th>" for a in agents) + "</tr>"]
+    for day in sorted(series):
+        latest = {agent: pts[-1] for agent, pts in series[day].items()}
+        timed = [p.median_ms for p in latest.values() if p.median_ms]
+        fastest = min(timed) if timed else None
+        cells = []
+        for agent in agents:
+            point = latest.get(agent)
+            if point is None:
+                cells.append("<td></td>")
+            elif point.median_ms is None:
+                cells.append(f'<td class="fail">{html.escape(point.outcome)}</td>')
+            else:
+                text = html.escape(format_ms(point.median_ms))
+                if point.median_ms == fastest:
+                    text = f"<strong>{text}</strong>"
+                cells.append(f'<td title="{html.escape(point.mode)}">{text}</td>')
+        rows.append(f"<tr><th>Day {day}</th>{''.join(cells)}</tr>")
+    return "<table>\n" + "\n".join(rows) + "\n</table>"
+
+
+STYLE = """
+body { font-family: system-ui, sans-serif; margin: 2em; color: #111827; }
+table { border-collapse: collapse; margin-bottom: 2em; }
+th, td { border: 1px solid #d1d5db; padding: 4px 10px; text-align: right; }
+.fail { color: #b91c1c; }
+.grid { stroke: #e5e7eb; }
+.axis { font-size: 10px; text-anchor: end; fill: #6b7280; }
+.line { fill: none; stroke-width: 1.5; }
+.legend span { margin-right: 1em; }
+"""
+
+
+def render(results: Iterable[StoredResult], title: str = "Advent of Code 2025 benchmarks") -> str:
+    """
+    The whole page. Subprocess and in-process times are not comparable, so
+    each mode gets its own table and charts.
+    """
+    results = list(results)
+    runs = len({r.run_id for r in results})
+    sections = []
+    for mode, heading in MODE_TITLES.items():
+        series = points(r for r in results if r.mode == mode)
+        if not series:
+            continue
+        charts = "\n".join(trend_chart(day, series[day]) for day in sorted(series))
+        sections.append(
+            f"<h2>Latest comparison ({heading})</h2>\n{comparison_table(series)}\n"
+            f"<h2>Trends ({heading})</h2>\n{charts}"
+        )
+    return (
+        "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n<meta charset=\"utf-8\">\n"
+        f"<title>{html.escape(title)}</title>\n<style>{STYLE}</style>\n</head>\n<body>\n"
+        f"<h1>{html.escape(title)}</h1>\n"
+        f"<p>{runs} recorded run(s), {len(results)} results.</p>\n"
+        + "\n".join(sections) + "\n</body>\n</html>\n"
+    )
+
+
+def write_dashboard(path: Path, results: Iterable[StoredResult]) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(render(results), encoding="utf-8")
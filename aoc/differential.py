@@ -0,0 +1,290 @@
+"""
+Cross-agent differential answer checking.
+
+Every agent with an adapter is run on the same input, and the answers are
+compared puzzle by puzzle. On Day 7, for example, ChatGPT returns
+``2^(reachable splitters)``, Claude counts distinct exit positions and
+Gemini runs a DP, so they disagree on puzzle 2. Such disagreements are
+flagged here instead of being spotted by eye in the README.
+
+A disagreement on a generated input can be shrunk to a small
+counterexample. The generator scale is lowered first, then lines are
+deleted (delta debugging) for as long as the same agents still disagree.
+
+Answers the agents agree on are stored as golden values, keyed by the
+input's hash. Each agreement also counts towards the agent being trusted
+for that day. Once a trusted agent exists, ``trusted_only`` runs just that
+agent on new inputs and records its answer as golden, so the slow agents
+are skipped.
+"""
+
+import json
+import multiprocessing
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from aoc.adapters import has_adapter
+from aoc.cache import CACHE_DIR, input_hash
+from aoc.discovery import Solution, discover
+from aoc.generators import generate_text
+from aoc.harness import default_input, measure
+from aoc.runner import expected_answers
+
+GOLDEN_DIR = CACHE_DIR / "golden"
+
+# Agreements needed before an agent's answer alone is trusted.
+TRUST_THRESHOLD = 3
+
+
+@dataclass
+class AgentAnswer:
+    """Answers of one agent, or why it produced none."""
+
+    agent: str
+    answers: Dict[int, str] = field(default_factory=dict)
+    elapsed_ms: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class Comparison:
+    day: int
+    input_path: Path
+    results: List[AgentAnswer]
+    reference: Dict[int, str] = field(default_factory=dict)
+    reference_source: str = "majority"
+
+    def answered(self) -> List[AgentAnswer]:
+        return [r for r in self.results if r.error is None]
+
+    def disagreements(self) -> Dict[int, Dict[str, List[str]]]:
+        """Puzzle -> answer -> agents, for every puzzle with more than one answer."""
+        found: Dict[int, Dict[str, List[str]]] = {}
+        puzzles = sorted({n for r in self.answered() for n in r.answers})
+        for puzzle in puzzles:
+            by_answer: Dict[str, List[str]] = {}
+            for result in self.answered():
+                if puzzle in result.answers:
+                    by_answer.setdefault(result.answers[puzzle], []).append(result.agent)
+            reference = self.reference.get(puzzle)
+            if len(by_answer) > 1 or (reference is not None and set(by_answer) != {reference}):
+                found[puzzle] = by_answer
+        return found
+
+    def wrong(self) -> Dict[str, List[int]]:
+        """Agent -> puzzles where it differs from the reference."""
+        wrong: Dict[str, List[int]] = {}
+        for result in self.answered():
+            for puzzle, expected in self.reference.items():
+                if result.answers.get(puzzle) not in (None, expected):
+                    wrong.setdefault(result.agent, []).append(puzzle)
+        return wrong
+
+
+def _normalise(answers: Dict[int, Any]) -> Dict[int, str]:
+    return {n: str(v) for n, v in answers.items() if v is not None}
+
+
+def _child(solution: Solution, path: Path, queue: "multiprocessing.Queue") -> None:
+    try:
+        measurement = measure(solution, path, runs=1, warmup=0)
+        elapsed = sum(samples[0] for samples in measurement.timings.values())
+        queue.put((_normalise(measurement.answers), elapsed, None))
+    except BaseException as exc:  # report anything, including MemoryError
+        queue.put(({}, 0.0, f"{type(exc).__name__}: {exc}"))
+
+
+def run_agent(solution: Solution, path: Path, timeout: Optional[float] = None) -> AgentAnswer:
+    """
+    Run one solution's adapter on ``path`` in a child process.
+
+    A separate process keeps a crashing or hanging solution from taking the
+    checker down with it, and lets a timeout actually stop it.
+    """
+    queue: "multiprocessing.Queue" = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_child, args=(solution, path, queue), daemon=True)
+    start = time.perf_counter()
+    process.start()
+    try:
+        answers, elapsed, error = queue.get(timeout=timeout)
+    except Exception:  # queue.Empty after the timeout
+        answers, elapsed, error = {}, (time.perf_counter() - start) * 1000.0, "timeout"
+    finally:
+        if process.is_alive():
+            process.kill()
+        process.join()
+    return AgentAnswer(solution.agent, answers, elapsed, error)
+
+
+def majority(results: Sequence[AgentAnswer]) -> Dict[int, str]:
+    """Per-puzzle answer given by a strict majority of the agents that answered."""
+    reference: Dict[int, str] = {}
+    answered = [r for r in results if r.error is None]
+    for puzzle in sorted({n for r in answered for n in r.answers}):
+        votes = Counter(r.answers[puzzle] for r in answered if puzzle in r.answers)
+        answer, count = votes.most_common(1)[0]
+        if count * 2 > len(answered):
+            reference[puzzle] = answer
+    return reference
+
+
+class GoldenStore:
+    """Agreed answers per input hash, plus how often each agent agreed."""
+
+    def __init__(self, day: int, root: Path = GOLDEN_DIR):
+        self.path = Path(root) / f"day{day:02d}.json"
+        self.day = day
+        if self.path.is_file():
+            self.data = json.loads(self.path.read_text(encoding="utf-8"))
+        else:
+            self.data = {"inputs": {}, "agreements": {}, "elapsed_ms": {}}
+
+    def answers(self, path: Path) -> Optional[Dict[int, str]]:
+        if Path(path).resolve() == default_input(self.day).resolve():
+            known = expected_answers(self.day)
+            if known:
+                return known
+        entry = self.data["inputs"].get(input_hash(path))
+        if entry is None:
+            return None
+        return {int(n): v for n, v in entry["answers"].items()}
+
+    def trusted_agent(self) -> Optional[str]:
+        """The fastest agent with at least ``TRUST_THRESHOLD`` agreements."""
+        trusted = [
+            agent for agent, count in self.data["agreements"].items()
+            if count >= TRUST_THRESHOLD
+        ]
+        if not trusted:
+            return None
+        return min(trusted, key=lambda agent: self.data["elapsed_ms"].get(agent, float("inf")))
+
+    def record(self, path: Path, answers: Dict[int, str], agents: Sequence[AgentAnswer]) -> None:
+        self.data["inputs"][input_hash(path)] = {
+            "answers": {str(n): v for n, v in answers.items()},
+            "agents": [a.agent for a in agents],
+        }
+        if len(agents) < 2:
+            return  # a lone trusted agent does not vouch for itself
+        for result in agents:
+            agreements = self.data["agreements"]
+            agreements[result.agent] = agreements.get(result.agent, 0) + 1
+            self.data["elapsed_ms"][result.agent] = result.elapsed_ms
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.data, indent=2), encoding="utf-8")
+
+
+def compare(
+    day: int,
+    path: Optional[Path] = None,
+    agents: Optional[Sequence[str]] = None,
+    timeout: Optional[float] = None,
+    store: Optional[GoldenStore] = None,
+    trusted_only: bool = False,
+) -> Comparison:
+    """Run the selected agents for ``day`` on ``path`` and compare their answers."""
+    path = Path(path or default_input(day))
+    solutions = [s for s in discover(days=[day], agents=agents) if has_adapter(s)]
+    golden = store.answers(path) if store is not None else None
+
+    source = "majority"
+    if trusted_only and golden is None and store is not None:
+        trusted = store.trusted_agent()
+        if trusted is not None and any(s.agent == trusted for s in solutions):
+            solutions = [s for s in solutions if s.agent == trusted]
+            source = f"trusted {trusted}"
+
+    results = [run_agent(s, path, timeout) for s in solutions]
+    comparison = Comparison(day, path, results, reference_source=source)
+    if golden is not None:
+        comparison.reference, comparison.reference_source = golden, "golden"
+    else:
+        comparison.reference = majority(results)
+
+    if store is not None and golden is None:
+        agreeing = [
+            r for r in comparison.answered()
+            if comparison.reference and all(
+                r.answers.get(n) == v for n, v in comparison.reference.items()
+            )
+        ]
+        if len(agreeing) >= 2 or (source != "majority" and agreeing):
+            store.record(path, comparison.reference, agreeing)
+            store.save()
+    return comparison
+
+
+def _still_fails(day: int, path: Path, agents: Sequence[str], puzzle: int,
+                 timeout: Optional[float]) -> bool:
+    comparison = compare(day, path, agents, timeout)
+    if len(comparison.answered()) < len(agents):
+        return False  # an agent crashed: the candidate is not a valid input
+    return puzzle in comparison.disagreements()
+
+
+def shrink(
+    day: int,
+    lines: List[str],
+    agents: Sequence[str],
+    puzzle: int,
+    work_path: Path,
+    timeout: Optional[float] = None,
+    max_tests: int = 200,
+) -> List[str]:
+    """
+    Delta-debug ``lines`` down to a smaller input on which ``agents`` still
+    disagree about ``puzzle``. The result is written to ``work_path``.
+    """
+    tests = 0
+
+    def fails(candidate: List[str]) -> bool:
+        nonlocal tests
+        tests += 1
+        work_path.write_text("".join(candidate), encoding="utf-8")
+        return _still_fails(day, work_path, agents, puzzle, timeout)
+
+    chunks = 2
+    while len(lines) >= 2 and tests < max_tests:
+        size = max(1, len(lines) // chunks)
+        for start in range(0, len(lines), size):
+            candidate = lines[:start] + lines[start + size:]
+            if candidate and fails(candidate):
+                lines = candidate
+                chunks = max(chunks - 1, 2)
+                break
+            if tests >= max_tests:
+                break
+        else:
+            if size == 1:
+                break
+            chunks = min(chunks * 2, len(lines))
+
+    work_path.write_text("".join(lines), encoding="utf-8")
+    return lines
+
+
+def shrink_generated(
+    day: int,
+    scale: float,
+    seed: int,
+    agents: Sequence[str],
+    puzzle: int,
+    work_path: Path,
+    timeout: Optional[float] = None,
+    max_tests: int = 200,
+) -> List[str]:
+    """Halve the generator scale while the disagreement persists, then shrink lines."""
+    text = generate_text(day, scale, seed)
+    while scale > 1 / 64:
+        smaller = generate_text(day, scale / 2, seed)
+        work_path.write_text(smaller, encoding="utf-8")
+        if not _still_fails(day, work_path, agents, puzzle, timeout):
+            break
+        scale, text = scale / 2, smaller
+    return shrink(day, text.splitlines(keepends=True), agents, puzzle, work_path,
+                  timeout, max_tests)
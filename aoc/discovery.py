@@ -0,0 +1,101 @@
+"""
+Locate the Python entry point of every ``Day N/<Agent>`` solution.
+"""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Column order used by the README results table.
+AGENTS = ("Claude CLI", "Google Gemini", "Human", "Chat GPT")
+
+# Preferred script names when an agent directory holds several scripts
+# (e.g. Day 11 Claude CLI also ships solution_diagnostic.py).
+ENTRY_POINT_NAMES = ("solution.py", "solve.py", "solver.py", "python.py")
+
+DAY_DIR_RE = re.compile(r"^Day (\d+)$")
+MAIN_GUARD_RE = re.compile(r"^if __name__ == ['\"]__main__['\"]:", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class Solution:
+    """A runnable solution script for one day and one agent."""
+
+    day: int
+    agent: str
+    path: Path
+
+    @property
+    def directory(self) -> Path:
+        return self.path.parent
+
+    @property
+    def key(self) -> str:
+        return f"Day {self.day}/{self.agent}"
+
+    @property
+    def slug(self) -> str:
+        """File-name friendly key, e.g. ``day08-claude-cli``."""
+        return f"day{self.day:02d}-" + re.sub(r"\W+", "-", self.agent.lower())
+
+
+def find_entry_point(directory: Path) -> Optional[Path]:
+    """
+    Return the script in ``directory`` that runs the solution, if any.
+
+    Only files with a ``__main__`` guard qualify, and ad-hoc ``test_*``
+    scripts are ignored.
+    """
+    candidates = [
+        path for path in sorted(directory.glob("*.py"))
+        if not path.name.startswith("test_")
+        and MAIN_GUARD_RE.search(path.read_text(encoding="utf-8"))
+    ]
+    if not candidates:
+        return None
+
+    for name in ENTRY_POINT_NAMES:
+        for path in candidates:
+            if path.name == name:
+                return path
+    return candidates[0]
+
+
+def discover(
+    root: Path = REPO_ROOT,
+    days: Optional[Iterable[int]] = None,
+    agents: Optional[Iterable[str]] = None,
+) -> List[Solution]:
+    """Find every Python solution under ``root``, ordered by day then agent."""
+    day_filter = set(days) if days else None
+    agent_filter = set(agents) if agents else None
+
+    solutions: List[Solution] = []
+    for day_dir in root.iterdir():
+        match = DAY_DIR_RE.match(day_dir.name)
+        if not match or not day_dir.is_dir():
+            continue
+        day = int(match.group(1))
+        if day_filter is not None and day not in day_filter:
+            continue
+
+        for agent_dir in day_dir.iterdir():
+            if not agent_dir.is_dir() or agent_dir.name == "Instructions":
+                continue
+            if agent_filter is not None and agent_dir.name not in agent_filter:
+                continue
+            entry = find_entry_point(agent_dir)
+            if entry is not None:
+                solutions.append(Solution(day, agent_dir.name, entry))
+
+    solutions.sort(key=lambda s: (s.day, _agent_order(s.agent)))
+    return solutions
+
+
+def _agent_order(agent: str):
+    if agent in AGENTS:
+        return (AGENTS.index(agent), agent)
+    return (len(AGENTS), agent)
@@ -0,0 +1,47 @@
+"""
+Engines: solvers written for scale rather than by the agents.
+
+The agents' solutions are kept as they were generated, since they are
+what the benchmark compares. The engines answer the same puzzles for
+inputs the solutions cannot handle, such as 10^9-click rotations or
+10^8-line logs, and act as fast references for the differential checker.
+
+Each day module has an ``ENGINES`` dict that maps an engine name to a
+``solve(path) -> (part1, part2)`` function. Modules load on first use.
+"""
+
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List, Tuple
+
+from aoc.lazy import lazy_import
+
+DAYS: Dict[int, ModuleType] = {
+    1: lazy_import("aoc.engines.day01"),
+    2: lazy_import("aoc.engines.day02"),
+}
+
+
+def names(day: int) -> List[str]:
+    return list(DAYS[day].ENGINES) if day in DAYS else []
+
+
+def solve(day: int, engine: str, path: Path) -> Tuple[Any, Any]:
+    if day not in DAYS:
+        raise ValueError(f"No engines for day {day}")
+    try:
+        fn = DAYS[day].ENGINES[engine]
+    except KeyError:
+        raise ValueError(
+            f"Unknown engine {engine!r} for day {day}, expected one of {names(day)}"
+        ) from None
+    return fn(Path(path))
+
+
+def require_numpy(purpose: str) -> Any:
+    """Import numpy, which only some engines need, or say which one does."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(f"{purpose} needs numpy (pip install numpy)") from None
+    return numpy
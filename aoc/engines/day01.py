@@ -0,0 +1,271 @@
+"""
+Day 1 engines: count the dial's zero hits without stepping through clicks.
+
+The agents count part 2 one click at a time (``for _ in range(distance)``
+in ChatGPT's ``solve_puzzle2`` and Claude's ``solve_puzzle_two``; Gemini's
+``solve_puzzle_2`` takes whole turns at once but still loops over the
+rest). Their runtime is therefore the total number of clicks. Here each
+rotation costs O(1):
+
+- turning right by ``d`` from ``p`` passes 0 once for every multiple of
+  100 in ``(p, p + d]``, which is ``(p + d) // 100`` times;
+- turning left is turning right on the mirrored dial, where ``p`` becomes
+  ``-p % 100``.
+
+Runtime depends only on the number of rotations, so distances of 10^9
+cost as little as distances of 10. The ``numpy`` engine applies the same
+counts to whole chunks of rotations at once. Like the Day 2 ``numpy-brute``
+and ``sharded-numpy`` engines and the ``id-index`` command, it needs numpy;
+the rest of the tooling does not. The ``parallel`` engine turns each chunk of
+the log into a :class:`Transfer` table in a process pool and composes
+the tables in order.
+"""
+
+from array import array
+from dataclasses import dataclass
+from functools import reduce
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Tuple
+
+from aoc.engines import require_numpy
+
+DIAL = 100
+START = 50
+
+
+def zero_hits(position: int, rotation: int) -> int:
+    """Clicks that land on 0 while turning by ``rotation`` (R > 0, L < 0) from ``position``."""
+    if rotation >= 0:
+        return (position + rotation) // DIAL
+    return (-position % DIAL - rotation) // DIAL
+
+
+def count_zeros(rotations: Iterable[int], position: int = START) -> Tuple[int, int, int]:
+    """
+    Run ``rotations`` from ``position``.
+
+    Returns ``(end position, rotations ending on 0, clicks landing on 0)``,
+    the last two being the part 1 and part 2 answers.
+    """
+    at_zero = passed_zero = 0
+    for rotation in rotations:
+        # zero_hits(), inlined: this loop is the whole engine.
+        if rotation >= 0:
+            passed_zero += (position + rotation) // DIAL
+        else:
+            passed_zero += (-position % DIAL - rotation) // DIAL
+        position = (position + rotation) % DIAL
+        if position == 0:
+            at_zero += 1
+    return position, at_zero, passed_zero
+
+
+def read_rotations(path: Path) -> array:
+    """The rotations as signed integers, ``L68`` -> -68 (see :mod:`aoc.loader`)."""
+    from aoc.loader import map_input, signed_directions
+
+    with map_input(path) as buf:
+        return signed_directions(buf)
+
+
+def solve_arithmetic(path: Path) -> Tuple[int, int]:
+    _, at_zero, passed_zero = count_zeros(read_rotations(path))
+    return at_zero, passed_zero
+
+
+# ---------------------------------------------------------------------------
+# NumPy: whole chunks at a time (optional dependency)
+# ---------------------------------------------------------------------------
+
+# 8 MiB of input is about 1.6M rotations, or ~13 MB per int64 temporary.
+NUMPY_CHUNK = 8 << 20
+
+# "L68" -> "-68" and "R43" -> " 43", so numpy's text parser reads signed ints.
+_SIGNS = bytes.maketrans(b"LR", b"- ")
+
+
+def _numpy() -> Any:
+    return require_numpy("the numpy engine")
+
+
+def count_zeros_numpy(rotations: Any, position: int = START) -> Tuple[int, int, int]:
+    """
+    :func:`count_zeros` for an int64 array, with no Python loop.
+
+    ``absolute`` is the unwrapped dial position after each rotation. A
+    right turn from ``prev`` to ``cur`` hits a multiple of 100 in
+    ``(prev, cur]``, which is ``cur // 100 - prev // 100`` times. A left turn
+    hits one in ``[cur, prev)``, which is ``(prev - 1) // 100 - (cur - 1) // 100``
+    times. Floor division rounds towards minus infinity on negatives too.
+    """
+    np = _numpy()
+    rotations = np.asarray(rotations, dtype=np.int64)
+    if not len(rotations):
+        return position, 0, 0
+    absolute = np.cumsum(rotations)
+    absolute += position
+    previous = np.empty_like(absolute)
+    previous[0] = position
+    previous[1:] = absolute[:-1]
+
+    at_zero = int(np.count_nonzero(absolute % DIAL == 0))
+    hits = np.where(
+        rotations > 0,
+        absolute // DIAL - previous // DIAL,
+        (previous - 1) // DIAL - (absolute - 1) // DIAL,
+    )
+    return int(absolute[-1] % DIAL), at_zero, int(hits.sum())
+
+
+def solve_numpy(path: Path) -> Tuple[int, int]:
+    """
+    Vectorised engine for very large logs (10^8 rotations).
+
+    The file is memory-mapped and parsed in newline-aligned chunks. Only the
+    dial position is carried from one chunk to the next, so memory stays
+    bounded by the chunk size, whatever the file size.
+    """
+    from aoc.loader import chunks, map_input
+
+    np = _numpy()
+    position, at_zero, passed_zero = START, 0, 0
+    with map_input(path) as buf:
+        for chunk in chunks(buf, NUMPY_CHUNK):
+            rotations = np.fromstring(chunk.translate(_SIGNS), dtype=np.int64, sep=" ")
+            position, ends, hits = count_zeros_numpy(rotations, position)
+            at_zero += ends
+            passed_zero += hits
+    return at_zero, passed_zero
+
+
+# ---------------------------------------------------------------------------
+# Transfer tables: chunks of the log as composable functions
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Transfer:
+    """
+    The effect of a run of rotations on every possible start position.
+
+    Starting at ``s``, the run ends at ``end[s]``. It ends ``at_zero[s]``
+    rotations on 0 (part 1) and lands on 0 ``passed_zero[s]`` times
+    (part 2). Transfers compose with :meth:`then`, and the composition is
+    associative. Chunks of a log can therefore be tabulated independently
+    and combined in order.
+    """
+
+    end: Tuple[int, ...]
+    at_zero: Tuple[int, ...]
+    passed_zero: Tuple[int, ...]
+
+    @classmethod
+    def identity(cls) -> "Transfer":
+        return cls(tuple(range(DIAL)), (0,) * DIAL, (0,) * DIAL)
+
+    def then(self, other: "Transfer") -> "Transfer":
+        """This run followed by ``other``."""
+        return Transfer(
+            tuple(other.end[e] for e in self.end),
+            tuple(a + other.at_zero[e] for a, e in zip(self.at_zero, self.end)),
+            tuple(p + other.passed_zero[e] for p, e in zip(self.passed_zero, self.end)),
+        )
+
+    def apply(self, position: int = START) -> Tuple[int, int, int]:
+        """Same result as ``count_zeros(rotations, position)``."""
+        return self.end[position], self.at_zero[position], self.passed_zero[position]
+
+
+def _add_cyclic(diff: List[int], start: int, length: int) -> None:
+    """Add 1 to the start positions ``start .. start + length - 1`` (mod 100)."""
+    stop = start + length
+    diff[start] += 1
+    if stop <= DIAL:
+        diff[stop] -= 1
+    else:
+        diff[DIAL] -= 1
+        diff[0] += 1
+        diff[stop - DIAL] -= 1
+
+
+def transfer(rotations: Iterable[int]) -> Transfer:
+    """
+    Tabulate ``rotations`` for all 100 start positions in one pass.
+
+    The run is followed from start 0; start ``s`` is the same run shifted by
+    ``s``. A rotation by ``d`` always makes ``d // 100`` whole turns. It
+    crosses 0 once more only if its shifted start lies in one cyclic
+    interval of ``d % 100`` positions:
+
+    - right from ``x``: ``x >= 100 - d % 100``
+    - left from ``x``: ``1 <= x <= d % 100``
+
+    Each rotation therefore updates a difference array in O(1), and the
+    table costs O(n + 100) rather than 100 replays.
+    """
+    relative = 0
+    turns = 0
+    partial = [0] * (DIAL + 1)
+    ends = [0] * DIAL
+    for rotation in rotations:
+        distance = -rotation if rotation < 0 else rotation
+        turns += distance // DIAL
+        rest = distance % DIAL
+        if rest:
+            # Shifted start x = (relative + s) % 100, solved for s.
+            low = DIAL - rest if rotation > 0 else 1
+            _add_cyclic(partial, (low - relative) % DIAL, rest)
+        relative = (relative + rotation) % DIAL
+        ends[-relative % DIAL] += 1
+
+    passed_zero = []
+    running = 0
+    for s in range(DIAL):
+        running += partial[s]
+        passed_zero.append(turns + running)
+    return Transfer(
+        tuple((relative + s) % DIAL for s in range(DIAL)), tuple(ends), tuple(passed_zero),
+    )
+
+
+def _chunk_transfer(job: Tuple[Path, int, int]) -> Transfer:
+    from aoc.loader import map_input, signed_directions
+
+    path, start, stop = job
+    with map_input(path) as buf:
+        return transfer(signed_directions(buf[start:stop]))
+
+
+def solve_parallel(path: Path, workers: Optional[int] = None) -> Tuple[int, int]:
+    """
+    Tabulate chunks of the file in a process pool, then compose them in order.
+
+    Each worker maps the file itself and parses only its byte range, so
+    just the 300-entry tables travel between processes. There are four
+    chunks per worker, which keeps the pool busy when chunks run at
+    different speeds.
+    """
+    # Imported here: the parser imports this module (through aoc.streaming),
+    # and multiprocessing alone would add ~60 ms to every command.
+    from concurrent.futures import ProcessPoolExecutor
+
+    from aoc.loader import byte_ranges, map_input
+    from aoc.scheduler import usable_cpus
+
+    workers = workers or len(usable_cpus())
+    with map_input(path) as buf:
+        jobs = [(Path(path), start, stop) for start, stop in byte_ranges(buf, workers * 4)]
+    if workers == 1:
+        tables = map(_chunk_transfer, jobs)
+        _, at_zero, passed_zero = reduce(Transfer.then, tables, Transfer.identity()).apply(START)
+        return at_zero, passed_zero
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        tables = pool.map(_chunk_transfer, jobs)
+        _, at_zero, passed_zero = reduce(Transfer.then, tables, Transfer.identity()).apply(START)
+    return at_zero, passed_zero
+
+
+ENGINES = {
+    "arithmetic": solve_arithmetic,
+    "numpy": solve_numpy,
+    "parallel": solve_parallel,
+}
@@ -0,0 +1,254 @@
+"""
+Range-query index over a Day 1 rotation log.
+
+Answers "how many times did the dial hit zero between rotation ``i`` and
+rotation ``j``?" without replaying the log. The index lives in a directory
+of flat binary files, so opening it costs nothing and appending new
+rotations only writes the new data:
+
+- ``rotations.bin``: the signed rotations (int64);
+- ``positions.bin``: the dial position after each prefix (uint8);
+- ``at_zero.bin`` / ``passed_zero.bin``: prefix counts of the part 1 and
+  part 2 hits (int64);
+- ``level<L>.bin``: :class:`~aoc.engines.day01.Transfer` tables for
+  aligned groups of ``2**L`` blocks of ``BLOCK`` rotations.
+
+A query that starts where the log actually was at ``i`` is two prefix
+lookups, O(1). A query from any other start position combines at most
+two partial blocks with O(log n) block-group tables.
+
+Lines are parsed with ``parse_rotation`` from ``Day 1/Claude CLI``.
+"""
+
+import json
+import mmap
+from array import array
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from aoc.adapters import load_module
+from aoc.discovery import discover
+from aoc.engines.day01 import DIAL, START, Transfer, count_zeros, transfer, zero_hits
+
+BLOCK = 256
+TABLE_SIZE = 3 * DIAL  # end, at_zero, passed_zero
+FORMAT_VERSION = 1
+
+
+def rotation_parser() -> Callable[[str], int]:
+    """Claude's ``parse_rotation``, returning a signed rotation (L negative)."""
+    solution = discover(days=[1], agents=["Claude CLI"])[0]
+    parse_rotation = load_module(solution).parse_rotation
+
+    def parse(line: str) -> int:
+        direction, distance = parse_rotation(line)
+        return -distance if direction == "L" else distance
+    return parse
+
+
+def _pack(table: Transfer) -> array:
+    return array("q", table.end + table.at_zero + table.passed_zero)
+
+
+def _unpack(flat: memoryview, index: int) -> Transfer:
+    base = index * TABLE_SIZE
+    values = flat[base:base + TABLE_SIZE].tolist()
+    return Transfer(tuple(values[:DIAL]), tuple(values[DIAL:2 * DIAL]), tuple(values[2 * DIAL:]))
+
+
+class RotationIndex:
+    """An on-disk index; create it with :meth:`create`, then :meth:`append`."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        meta = json.loads((self.root / "meta.json").read_text(encoding="utf-8"))
+        if meta.get("version") != FORMAT_VERSION:
+            raise ValueError(f"{self.root} is not a version {FORMAT_VERSION} rotation index")
+        self.block = meta["block"]
+        self._maps: List[mmap.mmap] = []
+        self._views: Dict[str, memoryview] = {}
+        self._open()
+
+    @classmethod
+    def create(cls, root: Path, block: int = BLOCK) -> "RotationIndex":
+        root = Path(root)
+        root.mkdir(parents=True, exist_ok=True)
+        for stale in root.glob("*.bin"):
+            stale.unlink()
+        (root / "meta.json").write_text(
+            json.dumps({"version": FORMAT_VERSION, "block": block}), encoding="utf-8",
+        )
+        (root / "rotations.bin").write_bytes(b"")
+        (root / "positions.bin").write_bytes(bytes([START]))
+        (root / "at_zero.bin").write_bytes(array("q", [0]).tobytes())
+        (root / "passed_zero.bin").write_bytes(array("q", [0]).tobytes())
+        return cls(root)
+
+    # -- file access ------------------------------------------------------
+
+    def _open(self) -> None:
+        self.close()
+        for path in sorted(self.root.glob("*.bin")):
+            typecode = "B" if path.name == "positions.bin" else "q"
+            if path.stat().st_size == 0:
+                self._views[path.stem] = memoryview(b"").cast(typecode)
+                continue
+            with path.open("rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps.append(mapped)
+            self._views[path.stem] = memoryview(mapped).cast(typecode)
+
+    def close(self) -> None:
+        for view in self._views.values():
+            view.release()
+        for mapped in self._maps:
+            mapped.close()
+        self._views, self._maps = {}, []
+
+    def __enter__(self) -> "RotationIndex":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._views["rotations"])
+
+    def _level(self, level: int) -> memoryview:
+        return self._views.get(f"level{level}", memoryview(b"").cast("q"))
+
+    def _tables(self, level: int) -> int:
+        return len(self._level(level)) // TABLE_SIZE
+
+    # -- building -----------------------------------------------------------
+
+    def append(self, rotations: Iterable[int]) -> int:
+        """Add rotations at the end of the log; returns how many were added."""
+        new = array("q", rotations)
+        if not new:
+            return 0
+        count = len(self)
+        position = self._views["positions"][count]
+        at_zero = self._views["at_zero"][count]
+        passed_zero = self._views["passed_zero"][count]
+
+        positions, ends, hits = array("B"), array("q"), array("q")
+        for rotation in new:
+            passed_zero += zero_hits(position, rotation)
+            position = (position + rotation) % DIAL
+            at_zero += position == 0
+            positions.append(position)
+            ends.append(at_zero)
+            hits.append(passed_zero)
+
+        # The last block may be partial; tabulate every block it now completes.
+        first_block = count // self.block
+        tail = self._views["rotations"][first_block * self.block:count].tolist()
+        tables = self._new_tables(tail + new.tolist(), first_block)
+
+        self.close()
+        files = [("rotations", new), ("positions", positions),
+                 ("at_zero", ends), ("passed_zero", hits)]
+        for level, level_tables in tables.items():
+            flat = array("q")
+            for table in level_tables:
+                flat.extend(_pack(table))
+            files.append((f"level{level}", flat))
+        for name, values in files:
+            with (self.root / f"{name}.bin").open("ab") as f:
+                values.tofile(f)
+        self._open()
+        return len(new)
+
+    def _new_tables(self, rotations: List[int], first_block: int) -> Dict[int, List[Transfer]]:
+        """Tables for the complete blocks, and for every 2**L group they complete."""
+        new_tables: Dict[int, List[Transfer]] = {}
+
+        def table_at(level: int, index: int) -> Transfer:
+            written = self._tables(level)
+            if index < written:
+                return _unpack(self._level(level), index)
+            return new_tables[level][index - written]
+
+        for offset in range(0, len(rotations) - self.block + 1, self.block):
+            block = first_block + offset // self.block
+            table = transfer(rotations[offset:offset + self.block])
+            level = 0
+            while True:
+                new_tables.setdefault(level, []).append(table)
+                if (block + 1) % (2 << level):
+                    break
+                # This block closes an aligned group of 2**(level + 1) blocks:
+                # combine the group's two halves one level up.
+                index = ((block + 1) >> level) - 1
+                table = table_at(level, index - 1).then(table)
+                level += 1
+        return new_tables
+
+    # -- queries ------------------------------------------------------------
+
+    def position(self, i: int) -> int:
+        """Dial position after the first ``i`` rotations."""
+        return self._views["positions"][i]
+
+    def query(self, i: int, j: int, position: Optional[int] = None) -> Tuple[int, int, int]:
+        """
+        Replay rotations ``i .. j - 1``; returns ``(end, at_zero, passed_zero)``.
+
+        Without ``position`` the replay starts where the log was after ``i``
+        rotations, and the answer comes from the prefix counts. With
+        ``position`` it starts there instead.
+        """
+        if not 0 <= i <= j <= len(self):
+            raise IndexError(f"rotations {i}..{j} outside 0..{len(self)}")
+        if position is not None and not 0 <= position < DIAL:
+            raise ValueError(f"{position} is not a dial position (0..{DIAL - 1})")
+        if position is None or position == self.position(i):
+            views = self._views
+            return (
+                views["positions"][j],
+                views["at_zero"][j] - views["at_zero"][i],
+                views["passed_zero"][j] - views["passed_zero"][i],
+            )
+
+        rotations = self._views["rotations"]
+        first = min(j, -(-i // self.block) * self.block)
+        last = max(first, j // self.block * self.block)
+        position, at_zero, passed_zero = count_zeros(rotations[i:first].tolist(), position)
+
+        block, end_block = first // self.block, last // self.block
+        while block < end_block:
+            level = 0
+            while (block % (2 << level) == 0 and block + (2 << level) <= end_block
+                   and (block >> (level + 1)) < self._tables(level + 1)):
+                level += 1
+            table = _unpack(self._level(level), block >> level)
+            position, ends, hits = table.apply(position)
+            at_zero += ends
+            passed_zero += hits
+            block += 1 << level
+
+        position, ends, hits = count_zeros(rotations[last:j].tolist(), position)
+        return position, at_zero + ends, passed_zero + hits
+
+
+def build(root: Path, lines: Iterable[str], block: int = BLOCK) -> RotationIndex:
+    """Create an index at ``root`` from rotation lines like ``L68``."""
+    index = RotationIndex.create(root, block)
+    append_lines(index, lines)
+    return index
+
+
+def append_lines(index: RotationIndex, lines: Iterable[str], batch: int = 1 << 20) -> int:
+    """Parse and append rotation lines in batches; returns how many were added."""
+    parse = rotation_parser()
+    added = 0
+    pending: List[int] = []
+    for line in lines:
+        line = line.strip()
+        if line:
+            pending.append(parse(line))
+        if len(pending) >= batch:
+            added += index.append(pending)
+            pending = []
+    return added + index.append(pending)
@@ -0,0 +1,349 @@
+"""
+Day 2 engines: sum the repeated-block IDs in a range without visiting it.
+
+Claude's ``solve_puzzle1``/``solve_puzzle2`` and Gemini's loop test every
+integer in every range with string slicing. ChatGPT's
+``generate_repeated_numbers`` enumerates every block. Both approaches
+grow with the size of the ranges. Here the sum is closed-form.
+
+An ``L``-digit number made of a ``b``-digit block repeated ``L / b`` times
+is ``block * R(L, b)``, where ``R(L, b) = (10**L - 1) // (10**b - 1)`` is
+the repunit multiplier (``R(9, 3) = 1001001``). The blocks that land in
+``[lo, hi]`` form an interval, so their sum is ``R`` times an arithmetic
+series.
+
+- Part 1 (a block repeated exactly twice) is that sum for ``b = L / 2``.
+- Part 2 (repeated at least twice) is the union over all proper divisors
+  ``b`` of ``L``. A number with period ``b`` also has every period that
+  ``b`` divides, so the union is deduplicated with the Möbius function:
+  ``sum = -Σ μ(L / b) · S(b)`` over the divisors ``b < L``. For ``L = 6``
+  this is ``S(2) + S(3) - S(1)``.
+
+Each range costs O(digits²) big-integer operations, so ranges up to
+10^18 are answered in microseconds. The ``numpy-brute`` engine checks
+every ID instead. It is a fast oracle to verify the closed form against.
+The ``sharded`` engines spread such per-ID scans over a process pool.
+The ``rules`` engine states both puzzles as :mod:`aoc.engines.day02_rules`
+rules.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+from aoc.adapters import load_module
+from aoc.discovery import discover
+from aoc.engines import require_numpy
+from aoc.lazy import lazy_import
+
+rules = lazy_import("aoc.engines.day02_rules")
+
+Range = Tuple[int, int]
+
+
+def repunit(length: int, block: int) -> int:
+    """Multiplier repeating a ``block``-digit number up to ``length`` digits."""
+    return (10 ** length - 1) // (10 ** block - 1)
+
+
+@lru_cache(maxsize=None)
+def mobius(n: int) -> int:
+    result, p = 1, 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            result = -result
+        p += 1
+    return -result if n > 1 else result
+
+
+@lru_cache(maxsize=None)
+def divisors(n: int) -> Tuple[int, ...]:
+    return tuple(d for d in range(1, n + 1) if n % d == 0)
+
+
+def by_length(lo: int, hi: int) -> Iterator[Tuple[int, int, int]]:
+    """Split ``[lo, hi]`` into ``(length, lo, hi)`` pieces of equal digit count."""
+    length = len(str(max(lo, 1)))
+    while lo <= hi:
+        top = min(hi, 10 ** length - 1)
+        if top >= lo:
+            yield length, lo, top
+        lo = max(lo, 10 ** length)
+        length += 1
+
+
+def periodic_sum(lo: int, hi: int, length: int, block: int) -> int:
+    """Sum of ``length``-digit numbers in ``[lo, hi]`` with period ``block``."""
+    multiplier = repunit(length, block)
+    first = max(10 ** (block - 1), -(-lo // multiplier))
+    last = min(10 ** block - 1, hi // multiplier)
+    if first > last:
+        return 0
+    return multiplier * (first + last) * (last - first + 1) // 2
+
+
+def sum_doubled(lo: int, hi: int) -> int:
+    """Part 1: IDs in ``[lo, hi]`` that are some block written exactly twice."""
+    return sum(
+        periodic_sum(a, b, length, length // 2)
+        for length, a, b in by_length(lo, hi)
+        if length % 2 == 0
+    )
+
+
+def sum_repeated(lo: int, hi: int) -> int:
+    """Part 2: IDs in ``[lo, hi]`` that are some block written two or more times."""
+    total = 0
+    for length, a, b in by_length(lo, hi):
+        total -= sum(
+            mobius(length // block) * periodic_sum(a, b, length, block)
+            for block in divisors(length)[:-1]
+        )
+    return total
+
+
+def merge_ranges(ranges: List[Range]) -> List[Range]:
+    """ChatGPT's ``merge_ranges``, so overlapping ranges count each ID once."""
+    solution = discover(days=[2], agents=["Chat GPT"])[0]
+    return load_module(solution).merge_ranges(ranges)
+
+
+def read_ranges(path: Path) -> List[Range]:
+    from aoc.loader import map_input, ranges as parse_ranges
+
+    with map_input(path) as buf:
+        starts, ends = parse_ranges(buf)
+    return [(min(a, b), max(a, b)) for a, b in zip(starts, ends)]
+
+
+def solve_closed_form(path: Path) -> Tuple[int, int]:
+    merged = merge_ranges(read_ranges(path))
+    return (
+        sum(sum_doubled(lo, hi) for lo, hi in merged),
+        sum(sum_repeated(lo, hi) for lo, hi in merged),
+    )
+
+
+# ---------------------------------------------------------------------------
+# NumPy brute force: every ID, checked arithmetically (optional dependency)
+# ---------------------------------------------------------------------------
+
+# 4M IDs per chunk, ~32 MB per uint64 temporary.
+BRUTE_CHUNK = 1 << 22
+
+
+def _numpy() -> Any:
+    return require_numpy("the numpy-brute engine")
+
+
+def exact_sum(values: Any) -> int:
+    """Sum of a uint64 array as a Python int, without wrapping at 2**64."""
+    # Neither 32-bit half overflows for fewer than 2**32 values.
+    return (int((values >> 32).sum()) << 32) + int((values & 0xFFFFFFFF).sum())
+
+
+def has_period(numbers: Any, length: int, block: int) -> Any:
+    """
+    Mask of the ``length``-digit ``numbers`` that repeat a ``block``-digit block.
+
+    Such a number reads the same after dropping its first ``block`` digits
+    as after dropping its last ``block`` digits, so the test is
+    ``n % 10**(length - block) == n // 10**block``. This replaces the
+    agents' string slicing in ``is_invalid_puzzle1``/``is_invalid_puzzle2``.
+    """
+    return numbers % (10 ** (length - block)) == numbers // (10 ** block)
+
+
+def brute_sums(lo: int, hi: int) -> Tuple[int, int]:
+    """Both parts' sums over ``[lo, hi]``, testing every ID in uint64 chunks."""
+    np = _numpy()
+    part1 = part2 = 0
+    for length, a, b in by_length(lo, hi):
+        blocks = divisors(length)[:-1]
+        if not blocks:
+            continue
+        for start in range(a, b + 1, BRUTE_CHUNK):
+            stop = min(b + 1, start + BRUTE_CHUNK)
+            numbers = np.arange(start, stop, dtype=np.uint64)
+            repeated = np.zeros(len(numbers), dtype=bool)
+            for block in blocks:
+                periodic = has_period(numbers, length, block)
+                if 2 * block == length:
+                    part1 += exact_sum(numbers[periodic])
+                repeated |= periodic
+            part2 += exact_sum(numbers[repeated])
+    return part1, part2
+
+
+def solve_numpy_brute(path: Path) -> Tuple[int, int]:
+    part1 = part2 = 0
+    for lo, hi in merge_ranges(read_ranges(path)):
+        doubled, repeated = brute_sums(lo, hi)
+        part1 += doubled
+        part2 += repeated
+    return part1, part2
+
+
+# ---------------------------------------------------------------------------
+# Sharded scanning: per-ID checks spread over a process pool
+# ---------------------------------------------------------------------------
+
+Sums = Tuple[int, ...]
+Summer = Callable[[int, int], Sums]
+
+
+def shard_ranges(ranges: List[Range], count: int) -> List[List[Range]]:
+    """
+    Cut ``ranges`` into at most ``count`` shards holding equal numbers of IDs.
+
+    The ranges are merged first, so no ID is scanned twice. Pieces never
+    straddle a digit-length boundary: summers such as :func:`brute_sums`
+    work one length at a time, and a piece of one length is uniform work.
+    A shard may hold pieces of several ranges.
+    """
+    pieces = [
+        (a, b) for lo, hi in merge_ranges(ranges) for _, a, b in by_length(lo, hi)
+    ]
+    total = sum(b - a + 1 for a, b in pieces)
+    target = max(1, -(-total // max(1, count)))
+    shards: List[List[Range]] = []
+    current: List[Range] = []
+    room = target
+    for a, b in pieces:
+        while a <= b:
+            stop = min(b, a + room - 1)
+            current.append((a, stop))
+            room -= stop - a + 1
+            a = stop + 1
+            if not room:
+                shards.append(current)
+                current, room = [], target
+    if current:
+        shards.append(current)
+    return shards
+
+
+@dataclass(frozen=True)
+class PredicateSums:
+    """
+    A summer for per-ID predicates: one sum of the accepted IDs per predicate.
+
+    The predicates are pickled by name, so they must be module-level
+    functions taking the ID as an int.
+    """
+
+    predicates: Tuple[Callable[[int], bool], ...]
+
+    def __call__(self, lo: int, hi: int) -> Sums:
+        sums = [0] * len(self.predicates)
+        for number in range(lo, hi + 1):
+            for i, accepts in enumerate(self.predicates):
+                if accepts(number):
+                    sums[i] += number
+        return tuple(sums)
+
+
+@lru_cache(maxsize=None)
+def _agent_predicates(agent: str, names: Tuple[str, ...]) -> Tuple[Callable[[str], bool], ...]:
+    """An agent's predicates, loaded once per process."""
+    module = load_module(discover(days=[2], agents=[agent])[0])
+    return tuple(getattr(module, name) for name in names)
+
+
+@dataclass(frozen=True)
+class AgentPredicates:
+    """
+    A summer for an agent's own predicates, e.g. Claude's ``is_invalid_puzzle1``.
+
+    Only the agent and function names are pickled. Each worker loads the
+    script once, on its first piece. As in the agents' own loops, the
+    predicates are given the ID as a string.
+    """
+
+    agent: str
+    names: Tuple[str, ...]
+
+    def __call__(self, lo: int, hi: int) -> Sums:
+        predicates = _agent_predicates(self.agent, self.names)
+        sums = [0] * len(predicates)
+        for number in range(lo, hi + 1):
+            text = str(number)
+            for i, accepts in enumerate(predicates):
+                if accepts(text):
+                    sums[i] += number
+        return tuple(sums)
+
+
+def _add(left: Sums, right: Sums) -> Sums:
+    return tuple(a + b for a, b in zip(left, right)) if left else right
+
+
+def _scan_shard(job: Tuple[Summer, List[Range]]) -> Sums:
+    summer, shard = job
+    sums: Sums = ()
+    for lo, hi in shard:
+        sums = _add(sums, summer(lo, hi))
+    return sums
+
+
+def scan(
+    ranges: Sequence[Range], summer: Summer, workers: Optional[int] = None,
+) -> Sums:
+    """
+    Apply ``summer`` to every ID of ``ranges``, in parallel shards.
+
+    ``summer(lo, hi)`` returns a tuple of sums over ``[lo, hi]``, and the
+    shards' tuples are added up. There are four shards per worker, which
+    keeps the pool busy even when some IDs are slower to check than
+    others. With one worker the shards are scanned in this process.
+    """
+    # Imported here, as in day01.solve_parallel, to keep the CLI's startup lazy.
+    from concurrent.futures import ProcessPoolExecutor
+
+    from aoc.scheduler import usable_cpus
+
+    workers = workers or len(usable_cpus())
+    jobs = [(summer, shard) for shard in shard_ranges(list(ranges), workers * 4)]
+    if workers == 1:
+        results = list(map(_scan_shard, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_scan_shard, jobs))
+    total: Sums = ()
+    for sums in results:
+        total = _add(total, sums)
+    return total
+
+
+def solve_sharded(path: Path) -> Tuple[int, int]:
+    """Claude's ``is_invalid_puzzle1``/``is_invalid_puzzle2``, on every core."""
+    summer = AgentPredicates("Claude CLI", ("is_invalid_puzzle1", "is_invalid_puzzle2"))
+    part1, part2 = scan(read_ranges(path), summer) or (0, 0)
+    return part1, part2
+
+
+def solve_sharded_numpy(path: Path) -> Tuple[int, int]:
+    _numpy()  # fail here rather than in every worker
+    part1, part2 = scan(read_ranges(path), brute_sums) or (0, 0)
+    return part1, part2
+
+
+def solve_rules(path: Path) -> Tuple[int, int]:
+    ranges = read_ranges(path)
+    return (
+        rules.sum_ids(rules.RepeatedExactly(2), ranges),
+        rules.sum_ids(rules.RepeatedAtLeast(2), ranges),
+    )
+
+
+ENGINES = {
+    "closed-form": solve_closed_form,
+    "numpy-brute": solve_numpy_brute,
+    "sharded": solve_sharded,
+    "sharded-numpy": solve_sharded_numpy,
+    "rules": solve_rules,
+}
@@ -0,0 +1,162 @@
+"""
+Persistent index of every repeated-block ID up to a digit length, for Day 2.
+
+ChatGPT's ``generate_repeated_numbers`` enumerates the invalid IDs of the
+input's span. It then walks them against the merged ranges with
+``sum_candidates_in_ranges``, one value at a time. For millions of
+ranges, the IDs are worth enumerating once and storing. After that, a
+range's sum is two binary searches and a difference of prefix sums, and
+``numpy.searchsorted`` does the searches for a whole batch of ranges at
+once.
+
+The index is a directory of ``.npy`` files, opened with ``mmap_mode="r"``:
+
+- ``part<N>.ids.npy``: the sorted, deduplicated IDs of part N (uint64);
+- ``part<N>.sum_lo.npy`` / ``part<N>.sum_hi.npy``: their prefix sums,
+  split into the low 64 bits and the number of 2**64 wraps. The sums
+  outgrow uint64 from 14 digits on, and the split keeps them exact.
+
+The IDs are generated as ChatGPT's function generates them, by length,
+repeat count and block, but each (length, block) pair is a single
+``arange(blocks) * repunit`` array. There are about ``10**(digits / 2)``
+IDs, so 12 digits is about a million IDs and 16 digits about 10^8.
+numpy is needed to build and query the index.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from aoc.engines import require_numpy
+from aoc.engines.day02 import Range, divisors, exact_sum, merge_ranges, repunit
+
+DIGITS = 12
+MAX_DIGITS = 19  # the largest length whose IDs all fit in uint64
+FORMAT_VERSION = 1
+PARTS = (1, 2)
+
+
+def _numpy() -> Any:
+    return require_numpy("the repeated-ID index")
+
+
+def generate(digits: int) -> Tuple[Any, Any]:
+    """
+    Sorted uint64 arrays of the part 1 and part 2 IDs with at most ``digits``
+    digits, like ``generate_repeated_numbers(1, 10**digits - 1)``.
+    """
+    np = _numpy()
+    if not 1 <= digits <= MAX_DIGITS:
+        raise ValueError(f"digits must be between 1 and {MAX_DIGITS}, not {digits}")
+    doubled: List[Any] = []
+    repeated: List[Any] = []
+    for length in range(2, digits + 1):
+        by_block = []
+        for block in divisors(length)[:-1]:
+            blocks = np.arange(10 ** (block - 1), 10 ** block, dtype=np.uint64)
+            by_block.append(blocks * np.uint64(repunit(length, block)))
+        if length % 2 == 0:
+            doubled.append(by_block[-1])  # the largest proper divisor is length / 2
+        # A number with several periods appears once per period.
+        repeated.append(np.unique(np.concatenate(by_block)))
+    empty = np.empty(0, dtype=np.uint64)
+    return (
+        np.concatenate(doubled) if doubled else empty,
+        np.concatenate(repeated) if repeated else empty,
+    )
+
+
+def prefix_sums(ids: Any) -> Tuple[Any, Any]:
+    """
+    Exact prefix sums of ``ids``, as ``(low 64 bits, count of 2**64 wraps)``.
+
+    Entry ``k`` is the sum of the first ``k`` IDs. Every ID is below 2**64,
+    so each addition wraps at most once, and it wraps exactly when the
+    running low word goes down.
+    """
+    np = _numpy()
+    low = np.zeros(len(ids) + 1, dtype=np.uint64)
+    np.cumsum(ids, dtype=np.uint64, out=low[1:])
+    high = np.zeros(len(ids) + 1, dtype=np.uint64)
+    np.cumsum(low[1:] < low[:-1], dtype=np.uint64, out=high[1:])
+    return low, high
+
+
+class RepeatedIdIndex:
+    """An on-disk index; create it with :meth:`create`."""
+
+    def __init__(self, root: Path):
+        np = _numpy()
+        self.root = Path(root)
+        meta = json.loads((self.root / "meta.json").read_text(encoding="utf-8"))
+        if meta.get("version") != FORMAT_VERSION:
+            raise ValueError(f"{self.root} is not a version {FORMAT_VERSION} repeated-ID index")
+        self.digits = meta["digits"]
+        self.limit = 10 ** self.digits - 1
+        self._arrays: Dict[str, Any] = {}
+        for part in PARTS:
+            for name in ("ids", "sum_lo", "sum_hi"):
+                key = f"part{part}.{name}"
+                self._arrays[key] = np.load(self.root / f"{key}.npy", mmap_mode="r")
+
+    @classmethod
+    def create(cls, root: Path, digits: int = DIGITS) -> "RepeatedIdIndex":
+        np = _numpy()
+        root = Path(root)
+        root.mkdir(parents=True, exist_ok=True)
+        for part, ids in zip(PARTS, generate(digits)):
+            low, high = prefix_sums(ids)
+            np.save(root / f"part{part}.ids.npy", ids)
+            np.save(root / f"part{part}.sum_lo.npy", low)
+            np.save(root / f"part{part}.sum_hi.npy", high)
+        # Written last, so an interrupted build is not mistaken for an index.
+        (root / "meta.json").write_text(
+            json.dumps({"version": FORMAT_VERSION, "digits": digits}), encoding="utf-8",
+        )
+        return cls(root)
+
+    def __len__(self) -> int:
+        return len(self._arrays["part2.ids"])
+
+    def ids(self, part: int) -> Any:
+        return self._arrays[f"part{part}.ids"]
+
+    def _differences(self, starts: Sequence[int], ends: Sequence[int], part: int) -> Tuple[Any, Any]:
+        """Per-range sums as ``(low 64 bits, high word)`` arrays."""
+        np = _numpy()
+        starts = np.asarray(starts, dtype=np.uint64)
+        ends = np.asarray(ends, dtype=np.uint64)
+        if starts.shape != ends.shape:
+            raise ValueError("starts and ends differ in length")
+        if len(ends) and int(ends.max()) > self.limit:
+            raise ValueError(
+                f"ranges reach {int(ends.max())}, past the index's {self.digits} digits; "
+                "rebuild it with more digits"
+            )
+        ids = self.ids(part)
+        first = np.searchsorted(ids, starts, side="left")
+        last = np.searchsorted(ids, ends, side="right")
+        last = np.maximum(first, last)  # empty (start > end) ranges sum to 0
+        low_words = self._arrays[f"part{part}.sum_lo"]
+        high_words = self._arrays[f"part{part}.sum_hi"]
+        low_last, low_first = low_words[last], low_words[first]
+        low = low_last - low_first  # wraps modulo 2**64, borrowing from high
+        high = high_words[last] - high_words[first] - (low_last < low_first)
+        return low, high
+
+    def range_sums(self, starts: Sequence[int], ends: Sequence[int], part: int) -> List[int]:
+        """Sum of the part's IDs in each ``[start, end]``, for a batch of ranges."""
+        low, high = self._differences(starts, ends, part)
+        return [(h << 64) | l for l, h in zip(low.tolist(), high.tolist())]
+
+    def total(self, starts: Sequence[int], ends: Sequence[int], part: int) -> int:
+        """Sum of :meth:`range_sums`; the ranges must not overlap."""
+        low, high = self._differences(starts, ends, part)
+        return (int(high.sum()) << 64) + exact_sum(low)
+
+    def solve(self, ranges: Iterable[Range]) -> Tuple[int, int]:
+        """Both answers for puzzle ranges, which may overlap."""
+        merged = merge_ranges(list(ranges))
+        starts = [start for start, _ in merged]
+        ends = [end for _, end in merged]
+        return self.total(starts, ends, 1), self.total(starts, ends, 2)
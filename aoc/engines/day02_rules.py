@@ -0,0 +1,269 @@
+"""
+Pluggable invalid-ID rules for Day 2.
+
+Each new rule used to mean another predicate like ``is_invalid_puzzle2``,
+run on every integer of every range. A :class:`Rule` instead enumerates
+the IDs it matches in ``[lo, hi]``, in increasing order, so a sum costs
+time in proportion to the matches, not to the width of the range. A rule
+may also give a closed-form :meth:`~Rule.total`. The driver,
+:func:`sum_ids`, uses the closed form when there is one and sums the
+enumeration otherwise.
+
+Rules combine with :func:`union` and :func:`intersection`, and an ID matched
+by several rules is counted once. A union merges the rules' sorted
+streams. An intersection leapfrogs: the rules take turns seeking to the
+current candidate.
+
+The two puzzles are rules too::
+
+    sum_ids(RepeatedExactly(2), ranges)   # part 1
+    sum_ids(RepeatedAtLeast(2), ranges)   # part 2
+"""
+
+import heapq
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from aoc.engines.day02 import (
+    Range, by_length, divisors, merge_ranges, mobius, periodic_sum, repunit,
+)
+
+
+class Rule(ABC):
+    """A set of IDs, enumerable in increasing order."""
+
+    @abstractmethod
+    def generate(self, lo: int, hi: int) -> Iterator[int]:
+        """The matching IDs in ``[lo, hi]``, in increasing order."""
+
+    def total(self, lo: int, hi: int) -> Optional[int]:
+        """The sum of :meth:`generate`, if the rule has a closed form."""
+        return None
+
+
+def sum_ids(rule: Rule, ranges: Iterable[Range]) -> int:
+    """Sum of the IDs matching ``rule`` in ``ranges``, each counted once."""
+    total = 0
+    for lo, hi in merge_ranges(list(ranges)):
+        closed = rule.total(lo, hi)
+        total += sum(rule.generate(lo, hi)) if closed is None else closed
+    return total
+
+
+# ---------------------------------------------------------------------------
+# Repeated blocks (the puzzles' rules)
+# ---------------------------------------------------------------------------
+
+def _periodic(lo: int, hi: int, length: int, block: int) -> Iterator[int]:
+    """``length``-digit IDs in ``[lo, hi]`` that repeat a ``block``-digit block."""
+    multiplier = repunit(length, block)
+    first = max(10 ** (block - 1), -(-lo // multiplier))
+    last = min(10 ** block - 1, hi // multiplier)
+    return (b * multiplier for b in range(first, last + 1))
+
+
+def _dedup(numbers: Iterable[int]) -> Iterator[int]:
+    previous = None
+    for number in numbers:
+        if number != previous:
+            yield number
+            previous = number
+
+
+@dataclass(frozen=True)
+class RepeatedExactly(Rule):
+    """A block written exactly ``times`` times, e.g. ``123123`` for 2 (part 1)."""
+
+    times: int
+
+    def __post_init__(self) -> None:
+        if self.times < 2:
+            raise ValueError(f"times must be at least 2, not {self.times}")
+
+    def generate(self, lo: int, hi: int) -> Iterator[int]:
+        for length, a, b in by_length(lo, hi):
+            if length % self.times == 0:
+                yield from _periodic(a, b, length, length // self.times)
+
+    def total(self, lo: int, hi: int) -> Optional[int]:
+        return sum(
+            periodic_sum(a, b, length, length // self.times)
+            for length, a, b in by_length(lo, hi)
+            if length % self.times == 0
+        )
+
+
+@dataclass(frozen=True)
+class RepeatedAtLeast(Rule):
+    """A block written ``times`` times or more, e.g. ``121212`` for 2 (part 2)."""
+
+    times: int
+
+    def __post_init__(self) -> None:
+        if self.times < 2:
+            raise ValueError(f"times must be at least 2, not {self.times}")
+
+    def _blocks(self, length: int) -> Tuple[int, ...]:
+        return tuple(b for b in divisors(length) if length // b >= self.times)
+
+    def generate(self, lo: int, hi: int) -> Iterator[int]:
+        for length, a, b in by_length(lo, hi):
+            streams = [_periodic(a, b, length, block) for block in self._blocks(length)]
+            yield from _dedup(heapq.merge(*streams))
+
+    def total(self, lo: int, hi: int) -> Optional[int]:
+        """
+        An ID is matched iff its smallest period ``m`` is one of the blocks,
+        so each ID is summed once, under ``m``. IDs whose smallest period is
+        exactly ``m`` sum to ``Σ μ(m / d) · S(d)`` over the divisors ``d`` of
+        ``m``, where ``S(d)`` counts every ID with period ``d``.
+        """
+        total = 0
+        for length, a, b in by_length(lo, hi):
+            for block in self._blocks(length):
+                total += sum(
+                    mobius(block // d) * periodic_sum(a, b, length, d)
+                    for d in divisors(block)
+                )
+        return total
+
+
+# ---------------------------------------------------------------------------
+# Other rules
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Palindrome(Rule):
+    """IDs that read the same backwards, e.g. ``12321``. No closed form."""
+
+    def generate(self, lo: int, hi: int) -> Iterator[int]:
+        for length, a, b in by_length(lo, hi):
+            # Palindromes of one length increase with their first half.
+            half = (length + 1) // 2
+            for first_half in range(int(str(a)[:half]), 10 ** half):
+                text = str(first_half)
+                number = int(text + text[length // 2 - 1::-1] if length > 1 else text)
+                if number > b:
+                    break
+                if number >= a:
+                    yield number
+
+
+@lru_cache(maxsize=None)
+def _suffixes(digits: int, target: int) -> Tuple[int, int]:
+    """Count and sum of the ``digits``-digit strings (zeros allowed) with digit sum ``target``."""
+    if digits == 0:
+        return (1, 0) if target == 0 else (0, 0)
+    count = total = 0
+    for digit in range(min(9, target) + 1):
+        c, s = _suffixes(digits - 1, target - digit)
+        count += c
+        total += digit * 10 ** (digits - 1) * c + s
+    return count, total
+
+
+def _digit_sum_upto(n: int, target: int) -> int:
+    """Sum of the integers in ``[0, n]`` with digit sum ``target`` (digit DP)."""
+    if n < 0:
+        return 0
+    text = str(n)
+    total, prefix, used = 0, 0, 0
+    for i, char in enumerate(text):
+        rest = len(text) - i - 1
+        for digit in range(int(char)):
+            if used + digit > target:
+                break
+            count, suffix_sum = _suffixes(rest, target - used - digit)
+            total += (prefix * 10 + digit) * 10 ** rest * count + suffix_sum
+        prefix = prefix * 10 + int(char)
+        used += int(char)
+    return total + (n if used == target else 0)
+
+
+@dataclass(frozen=True)
+class DigitSum(Rule):
+    """IDs whose digits add up to ``target``."""
+
+    target: int
+
+    def generate(self, lo: int, hi: int) -> Iterator[int]:
+        for _, a, b in by_length(lo, hi):
+            yield from self._walk(str(a), str(b), 0, 0, self.target, True, True)
+
+    def _walk(self, low: str, high: str, i: int, prefix: int, rest: int,
+              at_low: bool, at_high: bool) -> Iterator[int]:
+        """Depth-first over the digits, smallest first, pruning infeasible sums."""
+        if i == len(low):
+            if rest == 0:
+                yield prefix
+            return
+        first = int(low[i]) if at_low else 0
+        last = int(high[i]) if at_high else 9
+        remaining = len(low) - i - 1
+        for digit in range(first, min(last, rest) + 1):
+            if rest - digit > 9 * remaining:
+                continue
+            yield from self._walk(
+                low, high, i + 1, prefix * 10 + digit, rest - digit,
+                at_low and digit == first, at_high and digit == last,
+            )
+
+    def total(self, lo: int, hi: int) -> Optional[int]:
+        return _digit_sum_upto(hi, self.target) - _digit_sum_upto(lo - 1, self.target)
+
+
+# ---------------------------------------------------------------------------
+# Combinators
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Union(Rule):
+    """IDs matched by any of the rules, each once."""
+
+    rules: Tuple[Rule, ...]
+
+    def generate(self, lo: int, hi: int) -> Iterator[int]:
+        return _dedup(heapq.merge(*(rule.generate(lo, hi) for rule in self.rules)))
+
+
+@dataclass(frozen=True)
+class Intersection(Rule):
+    """
+    IDs matched by every rule.
+
+    A leapfrog join: each rule in turn seeks to its first match at or
+    above the current candidate, by restarting its enumeration there, and
+    a match above the candidate becomes the new candidate. The candidate
+    only jumps between one rule's matches, so the cost follows the
+    sparsest rule (times the number of rules and the cost of a seek),
+    not the range width or the denser rules.
+    """
+
+    rules: Tuple[Rule, ...]
+
+    def generate(self, lo: int, hi: int) -> Iterator[int]:
+        if not self.rules:
+            return
+        candidate, agreed, i = lo, 0, 0
+        while candidate <= hi:
+            value = next(iter(self.rules[i].generate(candidate, hi)), None)
+            if value is None:
+                return
+            if value == candidate:
+                agreed += 1
+            else:
+                candidate, agreed = value, 1
+            if agreed == len(self.rules):
+                yield candidate
+                candidate, agreed = candidate + 1, 0
+            i = (i + 1) % len(self.rules)
+
+
+def union(*rules: Rule) -> Rule:
+    return rules[0] if len(rules) == 1 else Union(rules)
+
+
+def intersection(*rules: Rule) -> Rule:
+    return rules[0] if len(rules) == 1 else Intersection(rules)
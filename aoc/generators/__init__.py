@@ -0,0 +1,52 @@
+"""
+Seeded synthetic input generators, one per day.
+
+Every generator takes a ``scale`` relative to the size of the real puzzle
+input (``scale=10`` is roughly ten times as much data) and a seeded
+``random.Random``, and yields the input text in pieces so that very large
+files never have to be held in memory. The same ``(day, scale, seed)``
+always produces byte-identical output.
+"""
+
+import random
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, Iterator
+
+from aoc.lazy import lazy_import
+
+# Day -> generator module, each defining ``generate(scale, rng)``. Modules
+# load on first use, so generating one day does not import the other eleven.
+GENERATORS: Dict[int, ModuleType] = {
+    day: lazy_import(f"aoc.generators.day{day:02d}") for day in range(1, 13)
+}
+
+
+def make_rng(day: int, seed: int) -> random.Random:
+    """Independent, reproducible random stream for one day and seed."""
+    return random.Random(f"aoc2025-day{day}-seed{seed}")
+
+
+def generate(day: int, scale: float = 1.0, seed: int = 0) -> Iterator[str]:
+    if day not in GENERATORS:
+        raise ValueError(f"No generator for day {day}")
+    if scale <= 0:
+        raise ValueError("scale must be positive")
+    return GENERATORS[day].generate(scale, make_rng(day, seed))
+
+
+def generate_text(day: int, scale: float = 1.0, seed: int = 0) -> str:
+    return "".join(generate(day, scale, seed))
+
+
+def write_input(path: Path, day: int, scale: float = 1.0, seed: int = 0) -> Path:
+    """Write a generated input to ``path`` and return it."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="\n") as f:
+        f.writelines(generate(day, scale, seed))
+    return path
+
+
+def default_filename(day: int, scale: float, seed: int) -> str:
+    return f"day{day:02d}-x{scale:g}-seed{seed}.txt"
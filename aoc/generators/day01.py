@@ -0,0 +1,14 @@
+"""
+Day 1: dial rotations, one ``L<n>`` / ``R<n>`` per line.
+"""
+
+import random
+from typing import Iterator
+
+BASE_ROTATIONS = 4732
+MAX_DISTANCE = 999
+
+
+def generate(scale: float, rng: random.Random) -> Iterator[str]:
+    for _ in range(max(1, round(BASE_ROTATIONS * scale))):
+        yield f"{rng.choice('LR')}{rng.randint(1, MAX_DISTANCE)}\n"
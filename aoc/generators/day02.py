@@ -0,0 +1,39 @@
+"""
+Day 2: one line of comma-separated, non-overlapping ``start-end`` ID ranges.
+"""
+
+import bisect
+import random
+from typing import Iterator, List, Tuple
+
+BASE_RANGES = 36
+MAX_DIGITS = 10
+MAX_WIDTH = 250_000
+
+
+def generate(scale: float, rng: random.Random) -> Iterator[str]:
+    count = max(1, round(BASE_RANGES * scale))
+    starts: List[int] = []
+    ranges: List[Tuple[int, int]] = []
+
+    attempts = 0
+    while len(ranges) < count and attempts < count * 20:
+        attempts += 1
+        digits = rng.randint(1, MAX_DIGITS)
+        low = 10 ** (digits - 1)
+        start = rng.randint(low, 10 ** digits - 1)
+        end = start + rng.randint(0, min(MAX_WIDTH, max(1, start)))
+
+        # Keep ranges disjoint, as in the real input.
+        idx = bisect.bisect_left(starts, start)
+        if idx > 0 and ranges[idx - 1][1] >= start:
+            continue
+        if idx < len(ranges) and ranges[idx][0] <= end:
+            continue
+        starts.insert(idx, start)
+        ranges.insert(idx, (start, end))
+
+    rng.shuffle(ranges)
+    for i, (start, end) in enumerate(ranges):
+        yield f"{',' if i else ''}{start}-{end}"
+    yield "\n"
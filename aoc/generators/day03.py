@@ -0,0 +1,15 @@
+"""
+Day 3: battery banks, one line of digits 1-9 per bank.
+"""
+
+import random
+from typing import Iterator
+
+BASE_BANKS = 200
+BANK_LENGTH = 100
+
+
+def generate(scale: float, rng: random.Random) -> Iterator[str]:
+    digits = "123456789"
+    for _ in range(max(1, round(BASE_BANKS * scale))):
+        yield "".join(rng.choices(digits, k=BANK_LENGTH)) + "\n"
@@ -0,0 +1,19 @@
+"""
+Day 4: square grid of paper rolls (``@``) and empty floor (``.``).
+"""
+
+import math
+import random
+from typing import Iterator
+
+BASE_SIDE = 139
+ROLL_DENSITY = 0.65
+
+
+def generate(scale: float, rng: random.Random) -> Iterator[str]:
+    # Scale the area, not the side, so scale=10 means ten times the cells.
+    side = max(3, round(BASE_SIDE * math.sqrt(scale)))
+    for _ in range(side):
+        yield "".join(
+            "@" if rng.random() < ROLL_DENSITY else "." for _ in range(side)
+        ) + "\n"
@@ -0,0 +1,20 @@
+"""
+Day 5: fresh ``start-end`` ranges, a blank line, then ingredient IDs.
+"""
+
+import random
+from typing import Iterator
+
+BASE_RANGES = 173
+BASE_IDS = 1000
+MAX_ID = 560_000_000_000_000
+MAX_WIDTH = 5_000_000_000_000
+
+
+def generate(scale: float, rng: random.Random) -> Iterator[str]:
+    for _ in range(max(1, round(BASE_RANGES * scale))):
+        start = rng.randint(1, MAX_ID)
+        yield f"{start}-{start + rng.randint(0, MAX_WIDTH)}\n"
+    yield "\n"
+    for _ in range(max(1, round(BASE_IDS * scale))):
+        yield f"{rng.randint(1, MAX_ID)}\n"
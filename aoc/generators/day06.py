@@ -0,0 +1,33 @@
+"""
+Day 6: cephalopod worksheet.
+
+Four rows of numbers and an operator row. Each problem is a block of
+columns separated from its neighbours by an all-space column; numbers in a
+block share one alignment and the operator sits in the block's first
+column.
+"""
+
+import random
+from typing import Iterator, List
+
+BASE_PROBLEMS = 1000
+NUMBER_ROWS = 4
+MAX_DIGITS = 4
+
+
+def generate(scale: float, rng: random.Random) -> Iterator[str]:
+    rows: List[List[str]] = [[] for _ in range(NUMBER_ROWS + 1)]
+
+    for _ in range(max(1, round(BASE_PROBLEMS * scale))):
+        numbers = [
+            str(rng.randint(1, 10 ** rng.randint(1, MAX_DIGITS) - 1))
+            for _ in range(NUMBER_ROWS)
+        ]
+        width = max(len(n) for n in numbers)
+        pad = str.ljust if rng.random() < 0.5 else str.rjust
+        for row, number in zip(rows, numbers):
+            row.append(pad(number, width))
+        rows[NUMBER_ROWS].append(rng.choice("+*").ljust(width))
+
+    for row in rows:
+        yield " ".join(row) + "\n"
@@ -0,0 +1,33 @@
+"""
+Day 7: tachyon manifold.
+
+``S`` in the middle of the top row and ``^`` splitters on every other row,
+confined to the cone the beam can reach.
+"""
+
+import math
+import random
+from typing import Iterator
+
+BASE_SIDE = 141
+SPLITTER_DENSITY = 0.4
+
+
+def generate(scale: float, rng: random.Random) -> Iterator[str]:
+    side = max(3, round(BASE_SIDE * math.sqrt(scale)))
+    if side % 2 == 0:
+        side += 1
+    centre = side // 2
+
+    yield "." * centre + "S" + "." * (side - centre - 1) + "\n"
+    for row in range(1, side):
+        if row % 2 == 1:
+            yield "." * side + "\n"
+            continue
+        reach = row // 2
+        cells = [
+            "^" if abs(col - centre) <= reach and rng.random() < SPLITTER_DENSITY
+            else "."
+            for col in range(side)
+        ]
+        yield "".join(cells) + "\n"
@@ -0,0 +1,20 @@
+"""
+Day 8: junction boxes, one ``x,y,z`` point per line.
+"""
+
+import random
+from typing import Iterator
+
+BASE_POINTS = 1000
+MAX_COORD = 99_999
+# Puzzle 1 always makes 1000 connections and multiplies the three largest
+# circuits; with too few points they all merge into one.
+MIN_POINTS = 500
+
+
+def generate(scale: float, rng: random.Random) -> Iterator[str]:
+    for _ in range(max(MIN_POINTS, round(BASE_POINTS * scale))):
+        yield (
+            f"{rng.randint(0, MAX_COORD)},{rng.randint(0, MAX_COORD)},"
+            f"{rng.randint(0, MAX_COORD)}\n"
+        )
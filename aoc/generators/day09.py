@@ -0,0 +1,48 @@
+"""
+Day 9: red tiles, the vertices of a closed rectilinear polygon in order.
+
+The polygon is a band between a top and a bottom skyline over the same
+columns, so it is always simple: each vertex shares its x or y coordinate
+with the next one.
+"""
+
+import random
+from typing import Iterator, List, Tuple
+
+BASE_VERTICES = 496
+MAX_COORD = 99_999
+
+
+def generate(scale: float, rng: random.Random) -> Iterator[str]:
+    columns = max(2, round(BASE_VERTICES * scale) // 4)
+    # Widen the grid for very large polygons so every column gets its own x.
+    span = max(MAX_COORD, columns * 8)
+    xs = sorted(rng.sample(range(0, span + 1), columns + 1))
+    mid = span // 2
+    gap = max(1, span // 50)
+
+    # Top heights stay above mid + gap and bottom heights below mid - gap,
+    # so the vertical edges of the two skylines can never meet.
+    tops = _distinct_neighbours(rng, columns, mid + gap, span)
+    bottoms = _distinct_neighbours(rng, columns, 0, mid - gap)
+
+    vertices: List[Tuple[int, int]] = []
+    for i in range(columns):
+        vertices.append((xs[i], tops[i]))
+        vertices.append((xs[i + 1], tops[i]))
+    for i in reversed(range(columns)):
+        vertices.append((xs[i + 1], bottoms[i]))
+        vertices.append((xs[i], bottoms[i]))
+
+    for x, y in vertices:
+        yield f"{x},{y}\n"
+
+
+def _distinct_neighbours(rng: random.Random, count: int, low: int, high: int) -> List[int]:
+    """Random heights in [low, high] where neighbouring heights differ."""
+    heights = [rng.randint(low, high)]
+    while len(heights) < count:
+        h = rng.randint(low, high)
+        if h != heights[-1]:
+            heights.append(h)
+    return heights
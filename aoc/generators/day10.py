@@ -0,0 +1,49 @@
+"""
+Day 10: factory machines.
+
+Each line is ``[lights] (button) ... {joltages}``. Targets are built from
+random button presses, so every machine is solvable for both puzzles.
+"""
+
+import random
+from typing import Iterator, List
+
+BASE_MACHINES = 187
+MIN_LIGHTS = 4
+MAX_LIGHTS = 10
+MAX_PRESSES = 20
+
+
+def generate(scale: float, rng: random.Random) -> Iterator[str]:
+    for _ in range(max(1, round(BASE_MACHINES * scale))):
+        yield _machine(rng) + "\n"
+
+
+def _machine(rng: random.Random) -> str:
+    lights = rng.randint(MIN_LIGHTS, MAX_LIGHTS)
+    buttons: List[List[int]] = []
+    for _ in range(rng.randint(lights - 2, lights + 2)):
+        size = rng.randint(1, lights - 1)
+        buttons.append(sorted(rng.sample(range(lights), size)))
+
+    # Every light/counter must be wired to at least one button.
+    covered = {i for button in buttons for i in button}
+    for i in range(lights):
+        if i not in covered:
+            buttons.append([i])
+
+    toggled = [0] * lights
+    for button in buttons:
+        if rng.random() < 0.5:
+            for i in button:
+                toggled[i] ^= 1
+
+    joltages = [0] * lights
+    for button in buttons:
+        presses = rng.randint(0, MAX_PRESSES)
+        for i in button:
+            joltages[i] += presses
+
+    pattern = "".join("#" if bit else "." for bit in toggled)
+    wiring = " ".join("(" + ",".join(map(str, b)) + ")" for b in buttons)
+    return f"[{pattern}] {wiring} {{{','.join(map(str, joltages))}}}"
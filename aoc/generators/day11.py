@@ -0,0 +1,64 @@
+"""
+Day 11: reactor device graph, ``name: output output ...`` per line.
+
+The graph is a DAG in which every device eventually reaches ``out``, and
+``you`` and ``svr`` both have paths to ``out`` (the latter through ``fft``
+and ``dac``). Edges mostly jump far ahead, which keeps the path counts
+polynomial in the number of devices rather than exponential.
+"""
+
+import itertools
+import random
+import string
+from typing import Dict, Iterator, List
+
+BASE_DEVICES = 592
+MAX_OUTPUTS = 4
+RESERVED = ("svr", "you", "fft", "dac", "out")
+
+
+def generate(scale: float, rng: random.Random) -> Iterator[str]:
+    count = max(len(RESERVED) + 4, round(BASE_DEVICES * scale))
+    names = _names(count - len(RESERVED), rng)
+
+    # Topological order: svr and you first, fft and dac a third and two
+    # thirds of the way through, out last.
+    order: List[str] = ["svr", "you"] + names
+    order.insert(len(order) // 3, "fft")
+    order.insert(2 * len(order) // 3, "dac")
+    order.append("out")
+    position = {name: i for i, name in enumerate(order)}
+    last = len(order) - 1
+
+    edges: Dict[str, List[str]] = {name: [] for name in order[:-1]}
+    for i, name in enumerate(order[:-1]):
+        targets = {order[rng.randint(i + 1, last)] for _ in range(rng.randint(1, MAX_OUTPUTS))}
+        edges[name].extend(sorted(targets, key=position.get))
+
+    # Guarantee svr -> fft -> dac -> out through random intermediate devices.
+    waypoints = ["svr", "fft", "dac", "out"]
+    for a, b in zip(waypoints, waypoints[1:]):
+        via = order[rng.randint(position[a] + 1, position[b] - 1)]
+        for src, dst in ((a, via), (via, b)):
+            if dst not in edges[src]:
+                edges[src].append(dst)
+
+    listing = list(edges.items())
+    rng.shuffle(listing)
+    for name, outputs in listing:
+        yield f"{name}: {' '.join(outputs)}\n"
+
+
+def _names(count: int, rng: random.Random) -> List[str]:
+    """``count`` distinct lowercase names, three letters long when possible."""
+    length = 3
+    while 26 ** length - len(RESERVED) < count:
+        length += 1
+    pool = (
+        "".join(letters)
+        for letters in itertools.product(string.ascii_lowercase, repeat=length)
+    )
+    names = [n for n in itertools.islice(pool, count + len(RESERVED)) if n not in RESERVED]
+    names = names[:count]
+    rng.shuffle(names)
+    return names
@@ -0,0 +1,33 @@
+"""
+Day 12: present shapes followed by ``WxH: counts`` tree regions.
+"""
+
+import random
+from typing import Iterator, List
+
+SHAPES = 6
+BASE_REGIONS = 1000
+MIN_CELLS = 5
+MAX_CELLS = 7
+SHAPE_AREA = 9
+
+
+def generate(scale: float, rng: random.Random) -> Iterator[str]:
+    areas: List[int] = []
+    for index in range(SHAPES):
+        cells = set(rng.sample(range(SHAPE_AREA), rng.randint(MIN_CELLS, MAX_CELLS)))
+        areas.append(len(cells))
+        yield f"{index}:\n"
+        for row in range(3):
+            yield "".join("#" if row * 3 + col in cells else "." for col in range(3)) + "\n"
+        yield "\n"
+
+    for _ in range(max(1, round(BASE_REGIONS * scale))):
+        width = rng.randint(35, 50)
+        height = rng.randint(35, 50)
+        # Aim for 60-110% of the region area so both outcomes occur.
+        budget = width * height * rng.uniform(0.6, 1.1)
+        weights = [rng.random() for _ in range(SHAPES)]
+        total = sum(w * a for w, a in zip(weights, areas))
+        counts = [int(budget * w / total) for w in weights]
+        yield f"{width}x{height}: {' '.join(map(str, counts))}\n"
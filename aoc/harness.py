@@ -0,0 +1,111 @@
+"""
+In-process benchmark harness.
+
+Each solution module is imported once through its adapter, then every
+phase (parse, part1, part2 or a combined solve) is timed on its own. This
+keeps interpreter startup and import time out of the numbers, and no
+phase is timed differently just because an agent put its timer somewhere
+else.
+"""
+
+import gc
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from aoc.adapters import get_adapter
+from aoc.discovery import REPO_ROOT, Solution
+
+
+@dataclass
+class Measurement:
+    """Per-phase timings (milliseconds) and answers for one solution."""
+
+    solution: Solution
+    answers: Dict[int, Any] = field(default_factory=dict)
+    timings: Dict[str, List[float]] = field(default_factory=dict)
+
+
+def default_input(day: int) -> Path:
+    """The shared puzzle input every agent was given."""
+    return REPO_ROOT / f"Day {day}" / "Instructions" / "input.txt"
+
+
+def timed_call(
+    fn: Callable[[Any], Any],
+    arg: Any,
+    disable_gc: bool = True,
+) -> Tuple[Any, float]:
+    """
+    Call ``fn(arg)`` and return ``(result, elapsed_ms)``.
+
+    With ``disable_gc`` the collector is run beforehand and paused during the
+    call, so earlier phases cannot leave garbage that is collected on this
+    phase's clock.
+    """
+    was_enabled = gc.isenabled()
+    if disable_gc:
+        gc.collect()
+        gc.disable()
+    try:
+        start = time.perf_counter()
+        result = fn(arg)
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+    finally:
+        if disable_gc and was_enabled:
+            gc.enable()
+    return result, elapsed_ms
+
+
+def measure(
+    solution: Solution,
+    input_path: Optional[Path] = None,
+    runs: int = 5,
+    warmup: int = 1,
+    disable_gc: bool = True,
+    reuse_prepared: bool = False,
+) -> Measurement:
+    """
+    Time every phase of ``solution`` over ``runs`` runs after ``warmup`` runs.
+
+    Each run parses the input afresh, so solutions that modify their parsed
+    data cannot affect the next run. Adapters with a ``prepare`` step get
+    a separate ``prepare`` timing, and both parts share its result.
+
+    With ``reuse_prepared`` the input is parsed and prepared only once and
+    the result is kept for every later run. ``parse`` and ``prepare`` then
+    have a single (cold) sample, and the parts are timed on their own.
+    """
+    adapter = get_adapter(solution)
+    path = input_path or default_input(solution.day)
+    measurement = Measurement(solution)
+    prepared: Optional[Tuple[Any]] = None
+
+    for run in range(warmup + runs):
+        record = run >= warmup
+        if prepared is None:
+            data, parse_ms = timed_call(adapter.parse, path, disable_gc)
+            stages = [("parse", parse_ms)]
+            if adapter.prepare is not None:
+                data, prepare_ms = timed_call(adapter.prepare, data, disable_gc)
+                stages.append(("prepare", prepare_ms))
+            if record or reuse_prepared:
+                for stage, elapsed_ms in stages:
+                    measurement.timings.setdefault(stage, []).append(elapsed_ms)
+            if reuse_prepared:
+                prepared = (data,)
+        else:
+            data = prepared[0]
+
+        for phase, fn in adapter.phases():
+            result, elapsed_ms = timed_call(fn, data, disable_gc)
+            if not record:
+                continue
+            measurement.timings.setdefault(phase, []).append(elapsed_ms)
+            if phase == "solve":
+                measurement.answers[1], measurement.answers[2] = result
+            else:
+                measurement.answers[int(phase[-1])] = result
+
+    return measurement
@@ -0,0 +1,184 @@
+"""
+Local SQLite store of every benchmark run.
+
+The README table holds one hand-edited number per cell, so it cannot show
+how a solution's performance changed over time. Every ``bench`` run is
+appended to ``benchmarks/results.sqlite`` instead, together with what is
+needed to compare runs:
+
+- ``runs``: when the run was made, the git commit, a machine fingerprint
+  and the mode (``subprocess`` or ``in-process``);
+- ``results``: one row per (day, agent, phase) with every timing sample,
+  their median, the peak RSS and the outcome.
+
+``python -m aoc dashboard`` renders the store as a static HTML page.
+"""
+
+import hashlib
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from aoc.discovery import REPO_ROOT
+
+DB_PATH = REPO_ROOT / "benchmarks" / "results.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    created TEXT NOT NULL,
+    git_commit TEXT,
+    machine TEXT NOT NULL,
+    machine_description TEXT NOT NULL,
+    mode TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    day INTEGER NOT NULL,
+    agent TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    samples_ms TEXT NOT NULL,
+    median_ms REAL,
+    peak_rss_kb INTEGER,
+    outcome TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_by_solution ON results(day, agent, phase);
+"""
+
+
+@dataclass
+class ResultRow:
+    """One phase of one solution in one run."""
+
+    day: int
+    agent: str
+    phase: str
+    samples_ms: List[float] = field(default_factory=list)
+    peak_rss_kb: Optional[int] = None
+    outcome: str = "ok"
+
+    @property
+    def median_ms(self) -> Optional[float]:
+        return statistics.median(self.samples_ms) if self.samples_ms else None
+
+
+@dataclass
+class StoredResult(ResultRow):
+    """A result read back from the store, with its run's metadata."""
+
+    run_id: int = 0
+    created: str = ""
+    git_commit: Optional[str] = None
+    machine: str = ""
+    mode: str = ""
+
+
+def git_commit(cwd: Path = REPO_ROOT) -> Optional[str]:
+    """Short HEAD commit, with ``+dirty`` if tracked files were modified."""
+    try:
+        head = subprocess.run(
+            ["git", "rev-parse", "--short=12", "HEAD"],
+            cwd=cwd, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=cwd, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return head + ("+dirty" if dirty else "")
+
+
+def machine_description() -> str:
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+    return (
+        f"{platform.node()} {platform.system()} {platform.release()} "
+        f"{platform.machine()} {platform.processor() or '?'} {cpus} cpus "
+        f"{sys.implementation.name}-{platform.python_version()}"
+    )
+
+
+def machine_fingerprint(description: Optional[str] = None) -> str:
+    """Short stable hash of the host, OS, CPU and interpreter."""
+    description = description or machine_description()
+    return hashlib.sha256(description.encode("utf-8")).hexdigest()[:12]
+
+
+class ResultStore:
+    def __init__(self, path: Path = DB_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path))
+        self._db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def record_run(self, mode: str, rows: Iterable[ResultRow]) -> int:
+        """Append one run and its results; returns the run id."""
+        rows = list(rows)
+        description = machine_description()
+        with self._db:
+            cursor = self._db.execute(
+                "INSERT INTO runs (created, git_commit, machine, machine_description, mode) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (time.strftime("%Y-%m-%dT%H:%M:%S"), git_commit(),
+                 machine_fingerprint(description), description, mode),
+            )
+            run_id = cursor.lastrowid
+            self._db.executemany(
+                "INSERT INTO results (run_id, day, agent, phase, samples_ms, median_ms, "
+                "peak_rss_kb, outcome) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (run_id, r.day, r.agent, r.phase, json.dumps(r.samples_ms),
+                     r.median_ms, r.peak_rss_kb, r.outcome)
+                    for r in rows
+                ],
+            )
+        return run_id
+
+    def results(
+        self,
+        mode: Optional[str] = None,
+        machine: Optional[str] = None,
+    ) -> List[StoredResult]:
+        """Every stored result, oldest run first."""
+        query = (
+            "SELECT r.day, r.agent, r.phase, r.samples_ms, r.peak_rss_kb, r.outcome, "
+            "runs.id, runs.created, runs.git_commit, runs.machine, runs.mode "
+            "FROM results r JOIN runs ON runs.id = r.run_id"
+        )
+        conditions, params = [], []
+        if mode is not None:
+            conditions.append("runs.mode = ?")
+            params.append(mode)
+        if machine is not None:
+            conditions.append("runs.machine = ?")
+            params.append(machine)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY runs.id, r.day, r.agent, r.phase"
+        return [
+            StoredResult(
+                day, agent, phase, json.loads(samples), peak, outcome,
+                run_id=run_id, created=created, git_commit=commit, machine=machine_id,
+                mode=run_mode,
+            )
+            for (day, agent, phase, samples, peak, outcome,
+                 run_id, created, commit, machine_id, run_mode)
+            in self._db.execute(query, params)
+        ]
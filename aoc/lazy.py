@@ -0,0 +1,28 @@
+"""
+Lazy imports for the shared tooling.
+
+``lazy_import("aoc.profiling")`` returns the module object at once but
+runs its body, and everything it imports, only when an attribute is first
+used. The CLI imports every command's module this way, so a command pays
+only for the modules it actually touches. Without this, ``python -m aoc
+bench`` also imported tracemalloc, cProfile and multiprocessing.
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return module ``name``, deferring its execution until first attribute access."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,249 @@
+"""
+Shared zero-copy input loader with bytes-level parsers.
+
+Every solution reads its input its own way, usually ``readlines()`` and
+``strip()`` into lists of ``str``. That is fine at 20 KB, but on generated
+multi-GB inputs the per-line string objects cost more than the puzzle. The
+parsers here work on a memory-mapped file in newline-aligned chunks and
+return compact ``array``/``bytes`` results. At most one chunk's worth of
+temporary objects exists at a time.
+
+=======================  ===========================  =====================
+Parser                   Input shape                  Days
+=======================  ===========================  =====================
+``signed_directions``    ``L68`` / ``R43`` per line   1
+``ranges``               ``a-b`` (comma or newline)   2, 5
+``integers``             whitespace-separated ints    5 (ids)
+``digit_grid``           rows of digits               3
+``char_grid``            rows of characters           4, 7
+``int_tuples``           ``x,y[,z]`` per line         8, 9
+``adjacency``            ``node: a b c`` per line     11
+=======================  ===========================  =====================
+
+Each parser takes anything bytes-like: an ``mmap`` from :func:`map_input`,
+``bytes``, or a ``memoryview`` section from :func:`sections`.
+"""
+
+import mmap
+import re
+from array import array
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+CHUNK_SIZE = 1 << 20
+
+BLANK_LINE_RE = re.compile(rb"\r?\n[ \t]*\r?\n")
+
+# Day 1: "L68" -> "-68", "R43" -> "+43", so int() parses the whole token.
+_DIRECTIONS = bytes.maketrans(b"LR", b"-+")
+_RANGE_SEPARATORS = bytes.maketrans(b"-,", b"  ")
+_COMMAS = bytes.maketrans(b",", b" ")
+_DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+@contextmanager
+def map_input(path: Union[str, Path]) -> Iterator[Buffer]:
+    """Memory-map ``path`` read-only; empty files yield ``b""``."""
+    with open(path, "rb") as f:
+        if Path(path).stat().st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def _next_newline(buf: Buffer, pos: int) -> int:
+    """Index of the first newline at or after ``pos``, or -1."""
+    if hasattr(buf, "find"):
+        return buf.find(b"\n", pos)
+    while pos < len(buf):  # memoryview has no find(); scan in small pieces
+        found = bytes(buf[pos:pos + 4096]).find(b"\n")
+        if found >= 0:
+            return pos + found
+        pos += 4096
+    return -1
+
+
+def chunks(buf: Buffer, size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield ``buf`` in pieces of about ``size`` bytes that end on a newline."""
+    start, end = 0, len(buf)
+    while start < end:
+        stop = min(start + size, end)
+        if stop < end:
+            newline = _next_newline(buf, stop)
+            stop = end if newline < 0 else newline + 1
+        yield bytes(buf[start:stop])
+        start = stop
+
+
+def byte_ranges(buf: Buffer, parts: int) -> List[Tuple[int, int]]:
+    """
+    Split ``buf`` into at most ``parts`` ``(start, stop)`` ranges ending on a newline.
+
+    The ranges let separate processes parse their own share of one
+    memory-mapped file.
+    """
+    end = len(buf)
+    size = max(1, -(-end // max(1, parts)))
+    result = []
+    start = 0
+    while start < end:
+        stop = min(start + size, end)
+        if stop < end:
+            newline = _next_newline(buf, stop)
+            stop = end if newline < 0 else newline + 1
+        result.append((start, stop))
+        start = stop
+    return result
+
+
+def sections(buf: Buffer) -> List[memoryview]:
+    """
+    Split on blank lines (Day 5: ranges, then ids) without copying.
+
+    The views keep an ``mmap`` open; release them before it is closed.
+    """
+    view = memoryview(buf)
+    result = []
+    start = 0
+    for match in BLANK_LINE_RE.finditer(buf if hasattr(buf, "find") else bytes(buf)):
+        result.append(view[start:match.start()])
+        start = match.end()
+    result.append(view[start:])
+    return result
+
+
+def _ints(buf: Buffer, table: Optional[bytes] = None, typecode: str = "q") -> array:
+    values = array(typecode)
+    for chunk in chunks(buf):
+        tokens = chunk.translate(table).split() if table else chunk.split()
+        values.extend(map(int, tokens))
+    return values
+
+
+def signed_directions(buf: Buffer) -> array:
+    """Day 1 rotations as signed integers: ``L68`` -> -68, ``R43`` -> 43."""
+    return _ints(buf, _DIRECTIONS)
+
+
+def integers(buf: Buffer) -> array:
+    """Every whitespace-separated integer in ``buf``."""
+    return _ints(buf)
+
+
+def ranges(buf: Buffer) -> Tuple[array, array]:
+    """
+    ``a-b`` ranges separated by commas or newlines, as ``(starts, ends)``.
+
+    Only non-negative bounds are supported, as in Days 2 and 5.
+    """
+    flat = _ints(buf, _RANGE_SEPARATORS)
+    if len(flat) % 2:
+        raise ValueError("unpaired range bound")
+    return flat[0::2], flat[1::2]
+
+
+def int_tuples(buf: Buffer, arity: int) -> array:
+    """
+    ``x,y[,z]`` lines flattened into one array of ``arity``-tuples.
+
+    Point ``i`` is ``values[i * arity:(i + 1) * arity]``.
+    """
+    flat = _ints(buf, _COMMAS)
+    if len(flat) % arity:
+        raise ValueError(f"{len(flat)} values do not form {arity}-tuples")
+    return flat
+
+
+@dataclass(frozen=True)
+class Grid:
+    """A rectangular grid stored row-major in one ``bytes`` object."""
+
+    width: int
+    height: int
+    cells: bytes
+
+    def at(self, row: int, col: int) -> int:
+        return self.cells[row * self.width + col]
+
+    def row(self, row: int) -> memoryview:
+        start = row * self.width
+        return memoryview(self.cells)[start:start + self.width]
+
+    @property
+    def view(self) -> memoryview:
+        """2-D view: ``grid.view[row, col]``."""
+        return memoryview(self.cells).cast("B", (self.height, self.width))
+
+
+def char_grid(buf: Buffer, table: Optional[bytes] = None) -> Grid:
+    """Rows of equal length, newlines removed (Days 4 and 7)."""
+    cells = bytearray()
+    width = None
+    for chunk in chunks(buf):
+        chunk = chunk.replace(b"\r", b"")
+        if width is None:
+            first = chunk.find(b"\n")
+            width = len(chunk) if first < 0 else first
+        cells += chunk.replace(b"\n", b"")
+    data = bytes(cells.translate(table) if table else cells)
+    width = width or 0
+    if width and len(data) % width:
+        raise ValueError("grid rows have different lengths")
+    return Grid(width, len(data) // width if width else 0, data)
+
+
+def digit_grid(buf: Buffer) -> Grid:
+    """Rows of digits with cells holding the values 0-9 (Day 3)."""
+    return char_grid(buf, _DIGITS)
+
+
+@dataclass(frozen=True)
+class Graph:
+    """
+    Directed graph in compressed sparse row form.
+
+    The successors of node ``i`` are ``targets[offsets[i]:offsets[i + 1]]``.
+    ``names[i]`` is the node's label and ``ids`` maps labels back.
+    """
+
+    names: List[bytes]
+    ids: Dict[bytes, int]
+    offsets: array
+    targets: array
+
+    def successors(self, node: int) -> array:
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+
+def adjacency(buf: Buffer) -> Graph:
+    """``node: a b c`` lines (Day 11); nodes only named as targets get no edges."""
+    ids: Dict[bytes, int] = {}
+    names: List[bytes] = []
+    edges: Dict[int, array] = {}
+
+    def node_id(name: bytes) -> int:
+        index = ids.get(name)
+        if index is None:
+            index = ids[name] = len(names)
+            names.append(name)
+        return index
+
+    for chunk in chunks(buf):
+        for line in chunk.splitlines():
+            source, sep, rest = line.partition(b":")
+            if not sep:
+                continue
+            targets = edges.setdefault(node_id(source.strip()), array("l"))
+            targets.extend(node_id(name) for name in rest.split())
+
+    offsets = array("l", [0])
+    flat = array("l")
+    for node in range(len(names)):
+        flat.extend(edges.get(node, ()))
+        offsets.append(len(flat))
+    return Graph(names, ids, offsets, flat)
@@ -0,0 +1,215 @@
+"""
+Profiling hooks for registered solutions.
+
+Each phase of a solution is run through its adapter three times. There is
+no need to edit the solution to add profiling:
+
+1. under ``cProfile``, written as a ``.pstats`` file;
+2. under a sampling profiler (``ITIMER_REAL`` ticks), written as collapsed stacks
+   (``frame;frame;frame count``). ``flamegraph.pl``, speedscope and
+   inferno all read this format;
+3. under ``tracemalloc``, written as the top-N allocation sites by size.
+
+The passes are kept separate so the bookkeeping of one does not distort
+another. Typical targets are Day 2 Claude's ``is_invalid_puzzle2``, which
+takes millions of string slices, and Day 4 Gemini's full rescan per wave.
+"""
+
+import cProfile
+import io
+import pstats
+import signal
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType
+from typing import Any, Callable, List, Optional, Tuple
+
+from aoc.adapters import get_adapter
+from aoc.discovery import Solution
+from aoc.harness import default_input
+
+SAMPLE_INTERVAL_S = 0.001
+
+# Wall-clock ticks: ITIMER_PROF is far coarser than its interval on some
+# kernels, and the phases profiled here are CPU-bound anyway.
+TIMER, TIMER_SIGNAL = signal.ITIMER_REAL, signal.SIGALRM
+TRACEMALLOC_FRAMES = 25
+
+
+@dataclass
+class PhaseProfile:
+    """Files written for one phase, and the headline numbers."""
+
+    phase: str
+    pstats_path: Path
+    stacks_path: Path
+    allocations_path: Path
+    samples: int = 0
+    top_functions: List[Tuple[str, float]] = field(default_factory=list)
+    top_allocations: List[Tuple[str, int]] = field(default_factory=list)
+
+
+def _run_phase(fn: Callable[[Any], Any], arg: Any) -> Any:
+    # Stack samples are cut off at this frame, so harness frames stay out.
+    return fn(arg)
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{Path(code.co_filename).name}:{code.co_name}"
+
+
+class StackSampler:
+    """Count the Python call stacks seen at each timer tick."""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL_S):
+        self.interval = interval
+        self.counts: Counter = Counter()
+
+    def _sample(self, signum: int, frame: Optional[FrameType]) -> None:
+        stack = []
+        while frame is not None and frame.f_code is not _run_phase.__code__:
+            stack.append(_frame_label(frame))
+            frame = frame.f_back
+        if frame is not None:  # only count samples taken inside the phase
+            self.counts[";".join(reversed(stack))] += 1
+
+    def __enter__(self) -> "StackSampler":
+        self._previous = signal.signal(TIMER_SIGNAL, self._sample)
+        signal.setitimer(TIMER, self.interval, self.interval)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        signal.setitimer(TIMER, 0, 0)
+        signal.signal(TIMER_SIGNAL, self._previous)
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.counts.items()))
+
+
+class PeakSnapshot:
+    """
+    ``tracemalloc`` snapshot taken close to the peak of traced memory.
+
+    A snapshot at the end would miss everything a phase freed before
+    returning, so the traced size is polled every few milliseconds. A new
+    snapshot is taken whenever it grows by ``growth`` over the last one.
+    """
+
+    def __init__(self, interval: float = 0.01, growth: float = 1.1):
+        self.interval = interval
+        self.growth = growth
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self._size = 0
+
+    def _poll(self, signum: int, frame: Optional[FrameType]) -> None:
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self._size * self.growth:
+            self._size = current
+            self.snapshot = tracemalloc.take_snapshot()
+
+    def __enter__(self) -> "PeakSnapshot":
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+        self._previous = signal.signal(TIMER_SIGNAL, self._poll)
+        signal.setitimer(TIMER, self.interval, self.interval)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        signal.setitimer(TIMER, 0, 0)
+        signal.signal(TIMER_SIGNAL, self._previous)
+        self._poll(TIMER_SIGNAL, None)
+        tracemalloc.stop()
+
+
+def _top_functions(profiler: cProfile.Profile, top: int) -> List[Tuple[str, float]]:
+    stats = pstats.Stats(profiler, stream=io.StringIO())
+    rows = []
+    for (filename, line, name), (_, _, tottime, _, _) in stats.stats.items():
+        if filename == __file__ or "_lsprof" in name:
+            continue
+        rows.append((f"{Path(filename).name}:{line}({name})", tottime * 1000.0))
+    rows.sort(key=lambda row: row[1], reverse=True)
+    return rows[:top]
+
+
+def _write_allocations(
+    path: Path,
+    snapshot: tracemalloc.Snapshot,
+    top: int,
+) -> List[Tuple[str, int]]:
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ])
+    statistics = snapshot.statistics("lineno")[:top]
+    lines = []
+    result = []
+    for stat in statistics:
+        frame = stat.traceback[0]
+        site = f"{Path(frame.filename).name}:{frame.lineno}"
+        result.append((site, stat.size))
+        lines.append(f"{stat.size / 1024:10.1f} KiB {stat.count:>9} blocks  {site}")
+        for line in stat.traceback.format()[1:2]:
+            lines.append(f"{'':>33}{line.strip()}")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return result
+
+
+def profile_solution(
+    solution: Solution,
+    out_dir: Path,
+    input_path: Optional[Path] = None,
+    top: int = 15,
+) -> List[PhaseProfile]:
+    """Profile every phase of ``solution`` and write the reports to ``out_dir``."""
+    adapter = get_adapter(solution)
+    path = input_path or default_input(solution.day)
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    phases: List[Tuple[str, Optional[Callable[[Any], Any]]]] = [("parse", None)]
+    if adapter.prepare is not None:
+        phases.append(("prepare", adapter.prepare))
+    phases += adapter.phases()
+    profiles = []
+    for phase, fn in phases:
+        base = out_dir / f"{solution.slug}-{phase}"
+        profile = PhaseProfile(
+            phase,
+            pstats_path=base.with_suffix(".pstats"),
+            stacks_path=base.with_suffix(".collapsed"),
+            allocations_path=Path(f"{base}-alloc.txt"),
+        )
+
+        def fresh_call() -> Tuple[Callable[[Any], Any], Any]:
+            # The phase's function and its input. Each pass parses afresh, as
+            # solutions may modify their data.
+            if fn is None:
+                return adapter.parse, path
+            if fn is adapter.prepare:
+                return fn, adapter.parse(path)
+            return fn, adapter.load(path)
+
+        profiler = cProfile.Profile()
+        profiler.runcall(_run_phase, *fresh_call())
+        profiler.dump_stats(str(profile.pstats_path))
+        profile.top_functions = _top_functions(profiler, top)
+
+        call, arg = fresh_call()
+        with StackSampler() as sampler:
+            _run_phase(call, arg)
+        profile.stacks_path.write_text(sampler.collapsed(), encoding="utf-8")
+        profile.samples = sum(sampler.counts.values())
+
+        call, arg = fresh_call()
+        with PeakSnapshot() as peak:
+            result = _run_phase(call, arg)  # kept alive for the final poll
+        del result
+        profile.top_allocations = _write_allocations(
+            profile.allocations_path, peak.snapshot, top,
+        )
+
+        profiles.append(profile)
+    return profiles
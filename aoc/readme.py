@@ -0,0 +1,118 @@
+"""
+Regenerate the "Code Results" table in the top-level README.
+
+Only the cells that were measured are rewritten; cells for solutions the
+runner cannot execute (C#, Go, Rust) keep their hand-recorded values. The
+fastest time in each row is re-highlighted in bold afterwards.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from aoc.discovery import REPO_ROOT
+from aoc.runner import UNIT_TO_MS, RunResult
+from aoc.sandbox import OOM
+from aoc.stats import format_ms, summarize
+
+README_PATH = REPO_ROOT / "README.md"
+
+# README column header -> agent directory name.
+COLUMN_AGENTS = {
+    "Claude CLI": "Claude CLI",
+    "Google Gemini": "Google Gemini",
+    "Human": "Human",
+    "ChatGPT 5.1": "Chat GPT",
+}
+
+TABLE_HEADER_RE = re.compile(r"^\|\s*Day\s*\|.*Claude CLI.*\|\s*$")
+CELL_TIME_RE = re.compile(r"([0-9]*\.?[0-9]+)\s*(µs|μs|us|ms|s)\b")
+
+Cells = Dict[Tuple[int, str], str]
+
+
+def result_cell(results: List[RunResult], language: str = "Python") -> str:
+    """Render the README cell for a set of runs of one solution."""
+    if any(r.timed_out for r in results):
+        return f"{language}<br>Timed out"
+    if any(r.outcome == OOM for r in results):
+        return f"{language}<br>Out of memory"
+    if not results or not all(r.ok for r in results):
+        return f"{language}<br>🔴"
+    samples = [
+        r.reported_ms if r.reported_ms is not None else r.wall_ms
+        for r in results
+    ]
+    return f"{language}<br>{format_ms(summarize(samples).median)}"
+
+
+def parse_cell_ms(cell: str) -> Optional[float]:
+    """Return the time recorded in a table cell, in milliseconds."""
+    match = CELL_TIME_RE.search(cell.replace("**", ""))
+    if not match:
+        return None
+    value, unit = match.groups()
+    return float(value) * UNIT_TO_MS[unit]
+
+
+def _split_row(line: str) -> List[str]:
+    return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+
+def _join_row(cells: List[str]) -> str:
+    return "| " + " | ".join(cells) + " |"
+
+
+def _highlight_fastest(cells: List[str]) -> List[str]:
+    """Bold the fastest time in a row, clearing any earlier highlight."""
+    cells = [re.sub(r"\s*\*\*\s*", " ", c).strip() for c in cells]
+    timings = [(parse_cell_ms(c), i) for i, c in enumerate(cells)]
+    timings = [(ms, i) for ms, i in timings if ms is not None]
+    if not timings:
+        return cells
+
+    _, fastest = min(timings)
+    match = CELL_TIME_RE.search(cells[fastest])
+    start, end = match.span()
+    cell = cells[fastest]
+    cells[fastest] = f"{cell[:start]}**{cell[start:end]}**{cell[end:]}"
+    return cells
+
+
+def update_results_table(text: str, cells: Cells) -> str:
+    """
+    Return ``text`` with the results table updated from ``cells``.
+
+    ``cells`` maps ``(day, agent directory)`` to the new cell contents. Rows
+    are matched by position (row N is Day N), which also repairs day labels
+    that were mistyped when the table was edited by hand.
+    """
+    lines = text.split("\n")
+    header_idx = next(
+        (i for i, line in enumerate(lines) if TABLE_HEADER_RE.match(line)), None
+    )
+    if header_idx is None:
+        raise ValueError("README has no results table")
+
+    columns = _split_row(lines[header_idx])[1:]
+    agents = [COLUMN_AGENTS.get(name, name) for name in columns]
+
+    row_idx = header_idx + 2  # skip the |---| separator
+    day = 1
+    while row_idx < len(lines) and lines[row_idx].startswith("|"):
+        row = _split_row(lines[row_idx])
+        values = row[1:] + [""] * (len(agents) - len(row) + 1)
+        for col, agent in enumerate(agents):
+            if (day, agent) in cells:
+                values[col] = cells[(day, agent)]
+        values = _highlight_fastest(values[: len(agents)])
+        lines[row_idx] = _join_row([f"**Day {day}**"] + values)
+        row_idx += 1
+        day += 1
+
+    return "\n".join(lines)
+
+
+def rewrite_readme(cells: Cells, path: Path = README_PATH) -> None:
+    text = path.read_text(encoding="utf-8")
+    path.write_text(update_results_table(text, cells), encoding="utf-8")
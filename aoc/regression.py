@@ -0,0 +1,127 @@
+"""
+Performance regression gate.
+
+A baseline stores the raw in-process timing samples of every
+(day, agent, phase) in a JSON file. ``compare`` measures the suite again
+and tests each phase for a statistically significant slowdown. A single
+noisy ``Total Duration`` line cannot show whether a change to, say,
+``merge_ranges`` in Day 5 helped; a distribution of 20 runs can.
+
+A phase is flagged only when both conditions hold:
+
+- the slowdown is significant: a one-sided Mann-Whitney U test at
+  ``alpha``, or a bootstrap interval of the median ratio lying entirely
+  above 1;
+- the median grew by more than ``threshold``, so tiny but real shifts do
+  not fail the gate.
+"""
+
+import json
+import platform
+import statistics
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from aoc.harness import Measurement
+from aoc.stats import bootstrap_ratio, mann_whitney_greater
+
+Samples = Dict[str, Dict[str, List[float]]]  # solution key -> phase -> ms
+
+METHODS = ("mann-whitney", "bootstrap")
+
+REGRESSION = "regression"
+IMPROVEMENT = "improvement"
+UNCHANGED = "unchanged"
+
+
+@dataclass
+class PhaseComparison:
+    key: str
+    phase: str
+    baseline_ms: float
+    current_ms: float
+    ratio: float
+    p_value: Optional[float]
+    low: Optional[float]
+    high: Optional[float]
+    verdict: str
+
+
+def samples_from(measurements: Iterable[Measurement]) -> Samples:
+    return {m.solution.key: dict(m.timings) for m in measurements}
+
+
+def save_baseline(path: Path, samples: Samples) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "samples": samples,
+    }
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def load_baseline(path: Path) -> Samples:
+    return json.loads(Path(path).read_text(encoding="utf-8"))["samples"]
+
+
+def compare_phase(
+    key: str,
+    phase: str,
+    baseline: List[float],
+    current: List[float],
+    method: str = "mann-whitney",
+    alpha: float = 0.01,
+    threshold: float = 0.05,
+) -> PhaseComparison:
+    base_median = statistics.median(baseline)
+    current_median = statistics.median(current)
+    ratio = current_median / base_median if base_median > 0 else float("inf")
+    p_value = low = high = None
+
+    if method == "bootstrap":
+        # A two-sided 1 - 2*alpha interval leaves alpha in each tail, so
+        # "entirely above 1" is a one-sided test at alpha, like Mann-Whitney.
+        ratio, low, high = bootstrap_ratio(current, baseline, confidence=1.0 - 2 * alpha)
+        slower, faster = low > 1.0, high < 1.0
+    elif method == "mann-whitney":
+        p_slower = mann_whitney_greater(current, baseline)
+        p_faster = mann_whitney_greater(baseline, current)
+        slower, faster = p_slower < alpha, p_faster < alpha
+        p_value = p_faster if faster else p_slower
+    else:
+        raise ValueError(f"unknown method {method!r}, expected one of {METHODS}")
+
+    verdict = UNCHANGED
+    if slower and ratio > 1.0 + threshold:
+        verdict = REGRESSION
+    elif faster and ratio < 1.0 / (1.0 + threshold):
+        verdict = IMPROVEMENT
+    return PhaseComparison(
+        key, phase, base_median, current_median, ratio, p_value, low, high, verdict,
+    )
+
+
+def compare_samples(
+    baseline: Samples,
+    current: Samples,
+    method: str = "mann-whitney",
+    alpha: float = 0.01,
+    threshold: float = 0.05,
+) -> List[PhaseComparison]:
+    """Compare every phase present in both ``baseline`` and ``current``."""
+    results = []
+    for key, phases in current.items():
+        for phase, samples in phases.items():
+            reference = baseline.get(key, {}).get(phase)
+            if not reference or not samples:
+                continue
+            results.append(
+                compare_phase(key, phase, reference, samples, method, alpha, threshold)
+            )
+    return results
+
@@ -0,0 +1,145 @@
+"""
+Run solution scripts in fresh interpreters and collect their output.
+
+Every script prints the same three lines::
+
+    Puzzle 1: [result]
+    Puzzle 2: [result]
+    Total Duration: [time]ms
+
+but the duration unit and precision vary between agents (``30.34ms``,
+``566µs``, ``12ms``), so it is normalised to milliseconds here.
+"""
+
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence
+
+from aoc.discovery import REPO_ROOT, Solution
+from aoc.sandbox import OK, TIMEOUT, Limits, classify, run_limited
+
+DURATION_RE = re.compile(
+    r"^Total Duration:\s*([0-9]*\.?[0-9]+)\s*(ns|µs|μs|us|ms|s)\s*$",
+    re.MULTILINE,
+)
+ANSWER_RE = re.compile(r"^Puzzle (\d+):\s*(.*?)\s*$", re.MULTILINE)
+
+UNIT_TO_MS = {
+    "ns": 1e-6,
+    "µs": 1e-3,
+    "μs": 1e-3,
+    "us": 1e-3,
+    "ms": 1.0,
+    "s": 1000.0,
+}
+
+
+@dataclass
+class RunResult:
+    """Outcome of a single subprocess run."""
+
+    wall_ms: float
+    reported_ms: Optional[float]
+    answers: Dict[int, str] = field(default_factory=dict)
+    returncode: Optional[int] = 0
+    outcome: str = OK
+    peak_rss_kb: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.outcome == OK
+
+    @property
+    def timed_out(self) -> bool:
+        return self.outcome == TIMEOUT
+
+
+def parse_duration(output: str) -> Optional[float]:
+    """Return the self-reported ``Total Duration`` in milliseconds."""
+    match = DURATION_RE.search(output)
+    if not match:
+        return None
+    value, unit = match.groups()
+    return float(value) * UNIT_TO_MS[unit]
+
+
+def parse_answers(output: str) -> Dict[int, str]:
+    """Return the ``Puzzle N: result`` lines keyed by puzzle number."""
+    return {int(n): value for n, value in ANSWER_RE.findall(output)}
+
+
+def expected_answers(day: int) -> Dict[int, str]:
+    """
+    Known-correct answers from ``Day N/Instructions/answers.txt``.
+
+    The file uses the same ``Puzzle N: result`` lines the scripts print.
+    Days without one are not checked.
+    """
+    path = REPO_ROOT / f"Day {day}" / "Instructions" / "answers.txt"
+    if not path.is_file():
+        return {}
+    return parse_answers(path.read_text(encoding="utf-8"))
+
+
+def run_once(
+    solution: Solution,
+    timeout: Optional[float] = None,
+    python: str = sys.executable,
+    memory_mb: Optional[int] = None,
+    expected: Optional[Dict[int, str]] = None,
+    python_flags: Sequence[str] = (),
+) -> RunResult:
+    """
+    Run ``solution`` once from its own directory, as the agents intended.
+
+    The wall-clock time includes interpreter startup and input parsing; the
+    reported time is whatever the script chose to measure. A run that times
+    out keeps its elapsed time and any answers printed before it was killed.
+    """
+    proc = run_limited(
+        [python, *python_flags, solution.path.name],
+        cwd=solution.directory,
+        limits=Limits(wall_s=timeout, memory_mb=memory_mb),
+    )
+    answers = parse_answers(proc.stdout)
+    return RunResult(
+        wall_ms=proc.wall_ms,
+        reported_ms=parse_duration(proc.stdout),
+        answers=answers,
+        returncode=proc.returncode,
+        outcome=classify(proc, answers, expected),
+        peak_rss_kb=proc.peak_rss_kb,
+    )
+
+
+def run_solution(
+    solution: Solution,
+    runs: int,
+    timeout: Optional[float] = None,
+    memory_mb: Optional[int] = None,
+    check: bool = True,
+    before_run: Optional[Callable[[], None]] = None,
+    python_flags: Sequence[str] = (),
+) -> List[RunResult]:
+    """
+    Run ``solution`` up to ``runs`` times.
+
+    Stops early after a timeout or a failure, since repeating those only
+    multiplies the wait without adding information. With ``check``, answers
+    are compared against the day's ``answers.txt``. ``before_run`` is called
+    ahead of every run.
+    """
+    expected = expected_answers(solution.day) if check else None
+    results: List[RunResult] = []
+    for _ in range(runs):
+        if before_run is not None:
+            before_run()
+        result = run_once(
+            solution, timeout=timeout, memory_mb=memory_mb,
+            expected=expected, python_flags=python_flags,
+        )
+        results.append(result)
+        if not result.ok:
+            break
+    return results
@@ -0,0 +1,162 @@
+"""
+Resource-limited execution of solution scripts.
+
+Each run gets a wall-clock limit and optionally an address-space limit
+(``RLIMIT_AS``), and its peak resident set size is read from the child's
+``getrusage`` data when it is reaped. Runs are classified so that a
+timeout, running out of memory, crashing and printing the wrong answer
+are reported as different outcomes rather than one generic failure.
+
+POSIX only: it relies on ``resource``, ``os.wait4`` and process groups.
+On Linux ``ru_maxrss`` survives ``exec``, so a child never reports less than
+the harness's own RSS at spawn time (about 16 MB for ``python -m aoc``).
+"""
+
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+OK = "ok"
+TIMEOUT = "timeout"
+OOM = "oom"
+ERROR = "error"
+WRONG_ANSWER = "wrong answer"
+
+MEMORY_ERROR_MARKERS = ("MemoryError", "Cannot allocate memory", "out of memory")
+
+
+@dataclass(frozen=True)
+class Limits:
+    """Resource limits for one run; ``None`` means unlimited."""
+
+    wall_s: Optional[float] = None
+    memory_mb: Optional[int] = None
+
+
+@dataclass
+class ProcessResult:
+    """Raw result of a limited run, before any answer checking."""
+
+    returncode: Optional[int]
+    stdout: str
+    stderr: str
+    wall_ms: float
+    peak_rss_kb: int
+    timed_out: bool
+
+
+def _exit_code(status: int) -> int:
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+# Sets the limit and then replaces itself with the real command. Doing this
+# in a trampoline rather than a ``preexec_fn`` keeps ``subprocess`` on its
+# fast vfork path and avoids running Python code between fork and exec.
+TRAMPOLINE = (
+    "import os, resource, sys; "
+    "limit = int(sys.argv[1]); "
+    "resource.setrlimit(resource.RLIMIT_AS, (limit, limit)); "
+    "os.execvp(sys.argv[2], sys.argv[2:])"
+)
+
+
+def _with_limits(argv: List[str], limits: Limits) -> List[str]:
+    if limits.memory_mb is None:
+        return list(argv)
+    limit = limits.memory_mb * 1024 * 1024
+    return [sys.executable, "-c", TRAMPOLINE, str(limit), *argv]
+
+
+def run_limited(argv: List[str], cwd: Path, limits: Limits) -> ProcessResult:
+    """
+    Run ``argv`` in ``cwd`` under ``limits`` and collect its output.
+
+    Output goes to temporary files rather than pipes, so a killed process
+    cannot deadlock the reader. Whatever it printed before a timeout is kept.
+    """
+    if resource is None or not hasattr(os, "wait4"):
+        raise RuntimeError("resource-limited runs need a POSIX platform")
+
+    env = dict(os.environ, PYTHONUNBUFFERED="1")
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            _with_limits(argv, limits),
+            cwd=cwd,
+            stdout=out,
+            stderr=err,
+            env=env,
+            start_new_session=True,
+        )
+
+        timed_out = threading.Event()
+
+        def kill() -> None:
+            timed_out.set()
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+        timer = None
+        if limits.wall_s is not None:
+            timer = threading.Timer(limits.wall_s, kill)
+            timer.start()
+        try:
+            _, status, usage = os.wait4(proc.pid, 0)
+        finally:
+            if timer is not None:
+                timer.cancel()
+        wall_ms = (time.perf_counter() - start) * 1000.0
+        proc.returncode = _exit_code(status)
+
+        out.seek(0)
+        err.seek(0)
+        stdout = out.read().decode("utf-8", errors="replace")
+        stderr = err.read().decode("utf-8", errors="replace")
+
+    # ru_maxrss is in kilobytes on Linux but bytes on macOS.
+    peak_rss_kb = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+    return ProcessResult(
+        returncode=proc.returncode,
+        stdout=stdout,
+        stderr=stderr,
+        wall_ms=wall_ms,
+        peak_rss_kb=peak_rss_kb,
+        timed_out=timed_out.is_set(),
+    )
+
+
+def classify(
+    result: ProcessResult,
+    answers: Dict[int, str],
+    expected: Optional[Dict[int, str]] = None,
+) -> str:
+    """Return the outcome of a run: ok, timeout, oom, error or wrong answer."""
+    if result.timed_out:
+        return TIMEOUT
+    output = result.stderr + result.stdout
+    if any(marker in output for marker in MEMORY_ERROR_MARKERS):
+        return OOM
+    if result.returncode == -signal.SIGKILL:
+        # Killed without us asking: the kernel's OOM killer.
+        return OOM
+    if result.returncode != 0 or not answers:
+        return ERROR
+    if expected and any(answers.get(n) != value for n, value in expected.items()):
+        return WRONG_ANSWER
+    return OK
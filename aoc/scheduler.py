@@ -0,0 +1,135 @@
+"""
+Parallel benchmark scheduler with one pinned core per worker.
+
+Solutions are spread over a process pool. Each worker is pinned to its own
+core with ``os.sched_setaffinity`` (the solution subprocesses inherit the
+pinning), and one core is left to the system by default. Parallel runs can
+still slow each other down through shared caches, memory bandwidth or
+frequency scaling, so every worker times a small calibration loop between
+runs. The ratio to the same loop timed before the pool starts is reported
+as the job's contention factor; about 1.0 means the timings are comparable
+to a serial run.
+
+Pinning is Linux only; elsewhere workers run unpinned.
+"""
+
+import multiprocessing
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from aoc.discovery import Solution
+from aoc.runner import RunResult, run_solution
+
+CALIBRATION_LOOPS = 200_000
+
+# Contention factors above this are flagged in the output.
+CONTENTION_WARNING = 1.10
+
+Job = Tuple[Solution, bool]  # (solution, check answers)
+
+
+@dataclass
+class JobResult:
+    solution: Solution
+    results: List[RunResult]
+    cpu: Optional[int] = None
+    calibration_ms: List[float] = field(default_factory=list)
+    baseline_ms: Optional[float] = None
+
+    @property
+    def contention(self) -> Optional[float]:
+        """Median calibration time relative to the uncontended baseline."""
+        if not self.calibration_ms or not self.baseline_ms:
+            return None
+        return statistics.median(self.calibration_ms) / self.baseline_ms
+
+
+def usable_cpus() -> List[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def worker_cpus(spare: int = 1) -> List[int]:
+    """Cores available to workers, leaving the first ``spare`` to the system."""
+    cpus = usable_cpus()
+    return cpus[spare:] if len(cpus) > spare else cpus[-1:]
+
+
+def calibrate(loops: int = CALIBRATION_LOOPS) -> float:
+    """Time a fixed pure-Python loop, in milliseconds."""
+    start = time.perf_counter()
+    total = 0
+    for i in range(loops):
+        total += i * i % 7
+    return (time.perf_counter() - start) * 1000.0
+
+
+def baseline(repeats: int = 5) -> float:
+    return min(calibrate() for _ in range(repeats))
+
+
+_cpu: Optional[int] = None
+
+
+def _pin_worker(cpus: "multiprocessing.Queue") -> None:
+    global _cpu
+    _cpu = cpus.get()
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {_cpu})
+
+
+def _run_job(
+    solution: Solution,
+    check: bool,
+    runs: int,
+    timeout: Optional[float],
+    memory_mb: Optional[int],
+    calibrate_between: bool,
+) -> JobResult:
+    job = JobResult(solution, [], cpu=_cpu)
+    job.results = run_solution(
+        solution, runs, timeout=timeout, memory_mb=memory_mb, check=check,
+        before_run=(lambda: job.calibration_ms.append(calibrate())) if calibrate_between else None,
+    )
+    return job
+
+
+def run_jobs(
+    jobs: Sequence[Job],
+    runs: int,
+    timeout: Optional[float] = None,
+    memory_mb: Optional[int] = None,
+    workers: int = 1,
+    spare: int = 1,
+) -> Iterator[JobResult]:
+    """
+    Run ``jobs`` and yield their results as they finish.
+
+    ``workers`` is capped at the number of cores left after ``spare``; with a
+    single worker the jobs run serially in this process, in order.
+    """
+    cpus = worker_cpus(spare)
+    workers = max(1, min(workers, len(cpus), len(jobs)))
+    if workers == 1:
+        for solution, check in jobs:
+            yield _run_job(solution, check, runs, timeout, memory_mb, False)
+        return
+
+    base = baseline()
+    queue: "multiprocessing.Queue" = multiprocessing.Queue()
+    for cpu in cpus[:workers]:
+        queue.put(cpu)
+    with ProcessPoolExecutor(workers, initializer=_pin_worker, initargs=(queue,)) as pool:
+        futures = [
+            pool.submit(_run_job, solution, check, runs, timeout, memory_mb, True)
+            for solution, check in jobs
+        ]
+        for future in as_completed(futures):
+            job = future.result()
+            job.baseline_ms = base
+            yield job
@@ -0,0 +1,125 @@
+"""
+Cold-start cost of each solution: interpreter startup and imports.
+
+For the small days the solving itself is below a millisecond (Day 5
+ChatGPT: 566µs), so the end-to-end time is mostly interpreter startup and
+module imports. Examples are ``fractions`` and ``re`` in Day 10 ChatGPT and
+``typing`` almost everywhere. This module splits a run into:
+
+- **interpreter**: ``python -c pass``, including ``site``;
+- **imports**: what importing the solution module adds, read from
+  ``-X importtime`` (the ``__main__`` guard keeps it from solving);
+- **solve**: the script's own ``Total Duration``;
+- **other**: whatever remains of the end-to-end wall time, such as reading
+  the input outside the timed region or interpreter shutdown.
+"""
+
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from aoc.discovery import Solution
+
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$", re.MULTILINE)
+
+# Imports a module the same way ``python solution.py`` would, minus ``__main__``.
+LOADER = (
+    "import importlib.util, sys; "
+    "spec = importlib.util.spec_from_file_location('solution', sys.argv[1]); "
+    "module = importlib.util.module_from_spec(spec); "
+    "spec.loader.exec_module(module)"
+)
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """One ``-X importtime`` line; times in microseconds."""
+
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class StartupProfile:
+    solution: Solution
+    interpreter_ms: float
+    imports: List[ImportRecord] = field(default_factory=list)
+    wall_ms: Optional[float] = None
+    solve_ms: Optional[float] = None
+
+    @property
+    def import_ms(self) -> float:
+        return sum(r.cumulative_us for r in self.imports if r.depth == 0) / 1000.0
+
+    @property
+    def other_ms(self) -> Optional[float]:
+        if self.wall_ms is None:
+            return None
+        return self.wall_ms - self.interpreter_ms - self.import_ms - (self.solve_ms or 0.0)
+
+
+def parse_importtime(stderr: str) -> List[ImportRecord]:
+    return [
+        ImportRecord(name, int(self_us), int(cumulative), len(indent) // 2)
+        for self_us, cumulative, indent, name in IMPORTTIME_RE.findall(stderr)
+    ]
+
+
+def interpreter_ms(python: str = sys.executable, flags: Sequence[str] = (), runs: int = 10) -> float:
+    """Median wall time of starting and stopping a bare interpreter."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([python, *flags, "-c", "pass"], check=True)
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(samples)
+
+
+def _importtime(python: str, flags: Sequence[str], script: Path, cwd: Path) -> List[ImportRecord]:
+    proc = subprocess.run(
+        [python, *flags, "-X", "importtime", "-c", LOADER, str(script)],
+        cwd=cwd, capture_output=True, text=True, encoding="utf-8",
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"importing {script} failed:\n{proc.stderr[-2000:]}")
+    return parse_importtime(proc.stderr)
+
+
+def solution_imports(
+    solution: Solution,
+    python: str = sys.executable,
+    flags: Sequence[str] = (),
+    runs: int = 5,
+) -> List[ImportRecord]:
+    """
+    Imports caused by the solution module itself, fastest of ``runs``.
+
+    Modules the loader pulls in anyway (measured by loading an empty file)
+    are left out, so only the agent's own imports count.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        empty = Path(tmp) / "empty.py"
+        empty.write_text("", encoding="utf-8")
+        baseline = {r.name for r in _importtime(python, flags, empty, Path(tmp))}
+
+    best: Optional[List[ImportRecord]] = None
+    for _ in range(runs):
+        records = [
+            r for r in _importtime(python, flags, solution.path, solution.directory)
+            if r.name not in baseline
+        ]
+        # Depth is relative to the outermost new import.
+        top = min((r.depth for r in records), default=0)
+        records = [ImportRecord(r.name, r.self_us, r.cumulative_us, r.depth - top) for r in records]
+        total = sum(r.cumulative_us for r in records if r.depth == 0)
+        if best is None or total < sum(r.cumulative_us for r in best if r.depth == 0):
+            best = records
+    return best or []
@@ -0,0 +1,181 @@
+"""
+Summary statistics for repeated timing samples.
+"""
+
+import functools
+import math
+import random
+import statistics
+from collections import Counter
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class Summary:
+    """Distribution summary of a list of timings (milliseconds)."""
+
+    count: int
+    median: float
+    p95: float
+    minimum: float
+    stddev: float
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """
+    Return the ``q``-th percentile (0-100) with linear interpolation.
+    """
+    if not samples:
+        raise ValueError("percentile of empty sample")
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * q / 100.0
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return ordered[lower]
+    weight = rank - lower
+    return ordered[lower] * (1 - weight) + ordered[upper] * weight
+
+
+def summarize(samples: Sequence[float]) -> Summary:
+    if not samples:
+        raise ValueError("cannot summarize an empty sample")
+    return Summary(
+        count=len(samples),
+        median=statistics.median(samples),
+        p95=percentile(samples, 95),
+        minimum=min(samples),
+        stddev=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    )
+
+
+def format_ms(ms: float) -> str:
+    """Format a duration the way the README records it (``566µs``, ``30.34ms``)."""
+    if ms < 1.0:
+        return f"{ms * 1000:.0f}µs"
+    return f"{ms:.2f}ms"
+
+
+@dataclass(frozen=True)
+class PowerFit:
+    """Least-squares fit of ``y = coefficient * x ** exponent`` in log-log space."""
+
+    exponent: float
+    coefficient: float
+    r_squared: float
+
+
+def fit_power_law(xs: Sequence[float], ys: Sequence[float]) -> PowerFit:
+    """
+    Fit ``y ~ c * x**k``, ignoring points where either value is not positive.
+
+    ``k`` is the empirical complexity exponent: about 1 for linear work,
+    2 for all-pairs loops.
+    """
+    points = [(math.log(x), math.log(y)) for x, y in zip(xs, ys) if x > 0 and y > 0]
+    if len(points) < 2:
+        raise ValueError("need at least two positive points to fit")
+
+    n = len(points)
+    mean_x = sum(p[0] for p in points) / n
+    mean_y = sum(p[1] for p in points) / n
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    if sxx == 0:
+        raise ValueError("need at least two distinct sizes to fit")
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    slope = sxy / sxx
+    intercept = mean_y - slope * mean_x
+
+    ss_tot = sum((y - mean_y) ** 2 for _, y in points)
+    ss_res = sum((y - (intercept + slope * x)) ** 2 for x, y in points)
+    r_squared = 1.0 - ss_res / ss_tot if ss_tot > 0 else 1.0
+    return PowerFit(slope, math.exp(intercept), r_squared)
+
+
+def _ranks(values: Sequence[float]) -> List[float]:
+    """1-based ranks, with ties given their average rank."""
+    order = sorted(range(len(values)), key=lambda i: values[i])
+    ranks = [0.0] * len(values)
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2.0 + 1.0
+        i = j + 1
+    return ranks
+
+
+def _exact_u_tail(u: float, n1: int, n2: int) -> float:
+    """P(U >= u) under the null hypothesis, without ties."""
+    # count(a, b)[k]: orderings of a + b values in which sample 1 beats
+    # sample 2 in k pairs. The largest value comes from one sample or the other.
+    @functools.lru_cache(maxsize=None)
+    def count(a: int, b: int) -> Tuple[int, ...]:
+        if a == 0 or b == 0:
+            return (1,)
+        with_a = (0,) * b + count(a - 1, b)  # largest value is from sample 1
+        with_b = count(a, b - 1)
+        size = max(len(with_a), len(with_b))
+        return tuple(
+            (with_a[k] if k < len(with_a) else 0) + (with_b[k] if k < len(with_b) else 0)
+            for k in range(size)
+        )
+
+    counts = count(n1, n2)
+    total = sum(counts)
+    return sum(c for k, c in enumerate(counts) if k >= u) / total
+
+
+def mann_whitney_greater(xs: Sequence[float], ys: Sequence[float]) -> float:
+    """
+    One-sided Mann-Whitney U test that ``xs`` tend to be larger than ``ys``.
+
+    Returns the p-value. Small samples without ties use the exact
+    distribution; otherwise the normal approximation with tie and
+    continuity correction.
+    """
+    n1, n2 = len(xs), len(ys)
+    if not n1 or not n2:
+        raise ValueError("both samples need at least one value")
+    ranks = _ranks(list(xs) + list(ys))
+    u = sum(ranks[:n1]) - n1 * (n1 + 1) / 2.0
+
+    tied = len(set(ranks)) < len(ranks)
+    if not tied and n1 + n2 <= 30:
+        return _exact_u_tail(u, n1, n2)
+
+    n = n1 + n2
+    tie_term = sum(t ** 3 - t for t in Counter(ranks).values())
+    variance = n1 * n2 / 12.0 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2.0 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def bootstrap_ratio(
+    xs: Sequence[float],
+    ys: Sequence[float],
+    resamples: int = 2000,
+    confidence: float = 0.95,
+    seed: int = 0,
+) -> Tuple[float, float, float]:
+    """
+    Ratio of medians ``median(xs) / median(ys)`` with a percentile bootstrap
+    confidence interval, as ``(ratio, low, high)``.
+    """
+    rng = random.Random(seed)
+    ratios = []
+    for _ in range(resamples):
+        x = statistics.median(rng.choices(xs, k=len(xs)))
+        y = statistics.median(rng.choices(ys, k=len(ys)))
+        if y > 0:
+            ratios.append(x / y)
+    if not ratios:
+        raise ValueError("baseline median is zero")
+    tail = (1.0 - confidence) / 2.0 * 100.0
+    ratio = statistics.median(xs) / statistics.median(ys)
+    return ratio, percentile(ratios, tail), percentile(ratios, 100.0 - tail)
@@ -0,0 +1,259 @@
+"""
+Streaming solvers for the line-oriented days.
+
+Every agent reads the whole input into a list before solving, so memory
+grows with the input even where the algorithm only needs a few counters.
+Here each day is a generator pipeline over the lines of a binary stream
+(a file, ``sys.stdin.buffer`` or a decompressor's pipe). The lines are
+consumed as they arrive, and memory is bounded by the algorithm's own
+state:
+
+=====  ==========================================  ==========================
+Day    State kept while streaming                  Both answers from
+=====  ==========================================  ==========================
+1      dial position and two counters              one pass
+3      the current bank                            one pass
+5      merged fresh ranges (first section only)    one pass over the ids
+8      the points and the 1000 closest pairs       pass, then Prim's MST
+11     the graph (path counts need all of it)      pass, then path counting
+=====  ==========================================  ==========================
+
+Day 8 still needs every point, but not the n²/2 sorted edge list that the
+agents build: a bounded heap keeps the 1000 closest pairs as points arrive,
+and part 2 is the longest edge of the minimum spanning tree, found with
+O(n) memory.
+"""
+
+import heapq
+from array import array
+from bisect import bisect_right
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Tuple
+
+from aoc.engines import day01
+
+Answers = Tuple[object, object]
+Streamer = Callable[[Iterator[bytes]], Answers]
+
+STREAMERS: Dict[int, Streamer] = {}
+
+
+def streamer(day: int) -> Callable[[Streamer], Streamer]:
+    """Decorator registering the streaming solver for ``day``."""
+    def decorator(fn: Streamer) -> Streamer:
+        STREAMERS[day] = fn
+        return fn
+    return decorator
+
+
+def lines(stream: BinaryIO) -> Iterator[bytes]:
+    """Non-empty stripped lines, read one at a time."""
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield line
+
+
+def solve_stream(day: int, stream: BinaryIO) -> Answers:
+    try:
+        solver = STREAMERS[day]
+    except KeyError:
+        raise KeyError(f"no streaming solver for day {day}") from None
+    return solver(lines(stream))
+
+
+# ---------------------------------------------------------------------------
+# Day 1: dial position plus two counters
+# ---------------------------------------------------------------------------
+
+def _rotations(lines: Iterable[bytes]) -> Iterator[Tuple[int, int]]:
+    for line in lines:
+        yield (1 if line[:1] == b"R" else -1), int(line[1:])
+
+
+@streamer(1)
+def day1(lines: Iterator[bytes]) -> Answers:
+    _, at_zero, passed_zero = day01.count_zeros(
+        step * distance for step, distance in _rotations(lines)
+    )
+    return at_zero, passed_zero
+
+
+# ---------------------------------------------------------------------------
+# Day 3: one bank at a time
+# ---------------------------------------------------------------------------
+
+def max_joltage(bank: bytes, k: int) -> int:
+    """Largest k-digit number keeping the digits' order (monotonic stack)."""
+    to_remove = len(bank) - k
+    stack = bytearray()
+    for digit in bank:
+        while stack and to_remove > 0 and stack[-1] < digit:
+            stack.pop()
+            to_remove -= 1
+        stack.append(digit)
+    return int(stack[:k])
+
+
+@streamer(3)
+def day3(lines: Iterator[bytes]) -> Answers:
+    part1 = part2 = 0
+    for bank in lines:
+        part1 += max_joltage(bank, 2)
+        part2 += max_joltage(bank, 12)
+    return part1, part2
+
+
+# ---------------------------------------------------------------------------
+# Day 5: ranges are kept (merged), the ids are only counted
+# ---------------------------------------------------------------------------
+
+def _merge(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+@streamer(5)
+def day5(lines: Iterator[bytes]) -> Answers:
+    # lines() drops the blank separator, so the first line without a dash
+    # is the first id.
+    ranges = []
+    first_id = None
+    for line in lines:
+        start, dash, end = line.partition(b"-")
+        if not dash:
+            first_id = int(line)
+            break
+        ranges.append((int(start), int(end)))
+
+    merged = _merge(ranges)
+    starts = [start for start, _ in merged]
+
+    def fresh(ingredient: int) -> bool:
+        index = bisect_right(starts, ingredient) - 1
+        return index >= 0 and ingredient <= merged[index][1]
+
+    ids = (int(line) for line in lines)
+    part1 = 0 if first_id is None else sum(map(fresh, ids)) + fresh(first_id)
+    part2 = sum(end - start + 1 for start, end in merged)
+    return part1, part2
+
+
+# ---------------------------------------------------------------------------
+# Day 8: closest pairs in a bounded heap, part 2 from Prim's MST
+# ---------------------------------------------------------------------------
+
+CONNECTIONS = 1000
+
+
+def _find(parent: List[int], i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+@streamer(8)
+def day8(lines: Iterator[bytes]) -> Answers:
+    xs, ys, zs = array("q"), array("q"), array("q")
+    closest: List[Tuple[int, int, int]] = []  # max-heap of (-distance, -j, -i)
+    for line in lines:
+        x, y, z = map(int, line.split(b","))
+        j = len(xs)
+        for i in range(j):
+            d = (xs[i] - x) ** 2 + (ys[i] - y) ** 2 + (zs[i] - z) ** 2
+            if len(closest) < CONNECTIONS:
+                heapq.heappush(closest, (-d, -i, -j))
+            elif -d > closest[0][0]:
+                heapq.heapreplace(closest, (-d, -i, -j))
+        xs.append(x)
+        ys.append(y)
+        zs.append(z)
+
+    n = len(xs)
+    parent, size = list(range(n)), [1] * n
+    for _, i, j in sorted((-d, -i, -j) for d, i, j in closest):
+        a, b = _find(parent, i), _find(parent, j)
+        if a != b:
+            if size[a] < size[b]:
+                a, b = b, a
+            parent[b] = a
+            size[a] += size[b]
+    sizes = sorted((size[i] for i in range(n) if parent[i] == i), reverse=True)
+    sizes += [1, 1, 1]
+    part1 = sizes[0] * sizes[1] * sizes[2]
+
+    # Kruskal's last union (the agents' part 2) is the MST's longest edge.
+    if n < 2:
+        return part1, None
+    best = [float("inf")] * n
+    link = [0] * n
+    in_tree = [False] * n
+    current, longest = 0, (-1, 0, 0)
+    in_tree[0] = True
+    for _ in range(n - 1):
+        cx, cy, cz = xs[current], ys[current], zs[current]
+        nearest, nearest_d = -1, float("inf")
+        for v in range(n):
+            if in_tree[v]:
+                continue
+            d = (xs[v] - cx) ** 2 + (ys[v] - cy) ** 2 + (zs[v] - cz) ** 2
+            if d < best[v]:
+                best[v], link[v] = d, current
+            if best[v] < nearest_d:
+                nearest, nearest_d = v, best[v]
+        in_tree[nearest] = True
+        if nearest_d > longest[0]:
+            longest = (nearest_d, link[nearest], nearest)
+        current = nearest
+    _, i, j = longest
+    return part1, xs[i] * xs[j]
+
+
+# ---------------------------------------------------------------------------
+# Day 11: the graph is the state; paths are counted afterwards
+# ---------------------------------------------------------------------------
+
+def count_paths(graph: Dict[bytes, List[bytes]], source: bytes, target: bytes) -> int:
+    """Paths from ``source`` to ``target`` in a DAG, without recursion."""
+    counts: Dict[bytes, int] = {target: 1}
+    stack = [source]
+    while stack:
+        node = stack[-1]
+        if node in counts:
+            stack.pop()
+            continue
+        pending = [child for child in graph.get(node, ()) if child not in counts]
+        if pending:
+            stack.extend(pending)
+        else:
+            counts[node] = sum(counts[child] for child in graph.get(node, ()))
+            stack.pop()
+    return counts[source]
+
+
+@streamer(11)
+def day11(lines: Iterator[bytes]) -> Answers:
+    graph: Dict[bytes, List[bytes]] = {}
+    for line in lines:
+        name, _, rest = line.partition(b":")
+        graph[name.strip()] = rest.split()
+
+    def paths(*route: bytes) -> int:
+        total = 1
+        for source, target in zip(route, route[1:]):
+            total *= count_paths(graph, source, target)
+            if not total:
+                break
+        return total
+
+    part1 = paths(b"you", b"out") if b"you" in graph else None
+    part2 = None
+    if b"svr" in graph:
+        part2 = paths(b"svr", b"dac", b"fft", b"out") + paths(b"svr", b"fft", b"dac", b"out")
+    return part1, part2
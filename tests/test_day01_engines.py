@@ -0,0 +1,58 @@
+"""Day 1 engines against the arithmetic engine and each other."""
+
+import random
+
+import pytest
+
+from aoc.engines import day01
+
+
+def write_log(path, count: int, seed: int = 0):
+    rng = random.Random(seed)
+    lines = [
+        f"{rng.choice('LR')}{rng.choice((rng.randrange(100), rng.randrange(10 ** 6)))}"
+        for _ in range(count)
+    ]
+    path.write_text("\n".join(lines) + "\n", encoding="ascii")
+    return path
+
+
+def test_count_zeros_matches_clicks():
+    rng = random.Random(0)
+    rotations = [rng.choice((-1, 1)) * rng.randrange(400) for _ in range(500)]
+    position, at_zero, passed_zero = day01.START, 0, 0
+    for rotation in rotations:
+        step = 1 if rotation > 0 else -1
+        for _ in range(abs(rotation)):
+            position = (position + step) % day01.DIAL
+            passed_zero += position == 0
+        at_zero += position == 0
+    assert day01.count_zeros(rotations) == (position, at_zero, passed_zero)
+
+
+def test_transfer_matches_count_zeros():
+    rng = random.Random(1)
+    rotations = [rng.choice((-1, 1)) * rng.randrange(400) for _ in range(300)]
+    table = day01.transfer(rotations)
+    for start in range(day01.DIAL):
+        assert table.apply(start) == day01.count_zeros(rotations, start)
+
+
+def test_numpy_engine_across_real_chunks(tmp_path):
+    pytest.importorskip("numpy")
+    # Past 8 MiB, so at least one NUMPY_CHUNK boundary is crossed.
+    path = write_log(tmp_path / "rotations.txt", 1_500_000)
+    assert path.stat().st_size > day01.NUMPY_CHUNK
+    assert day01.solve_numpy(path) == day01.solve_arithmetic(path)
+
+
+def test_numpy_engine_across_small_chunks(tmp_path, monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(day01, "NUMPY_CHUNK", 1000)
+    path = write_log(tmp_path / "rotations.txt", 20_000, seed=2)
+    assert day01.solve_numpy(path) == day01.solve_arithmetic(path)
+
+
+def test_parallel_engine_in_process(tmp_path):
+    path = write_log(tmp_path / "rotations.txt", 20_000, seed=3)
+    assert day01.solve_parallel(path, workers=1) == day01.solve_arithmetic(path)
@@ -0,0 +1,83 @@
+"""The Day 1 rotation index against direct replays with count_zeros."""
+
+import random
+
+import pytest
+
+from aoc.engines.day01 import count_zeros
+from aoc.engines.day01_index import RotationIndex, build
+
+BLOCK = 4  # small blocks, so a few hundred rotations span several levels
+
+
+def random_rotations(rng: random.Random, count: int):
+    return [rng.choice((-1, 1)) * rng.randrange(0, 350) for _ in range(count)]
+
+
+@pytest.fixture
+def logged(tmp_path):
+    """An index built by random-sized appends, and the rotations it holds."""
+    rng = random.Random(0)
+    index = RotationIndex.create(tmp_path / "index", block=BLOCK)
+    rotations = []
+    for size in (1, 0, 3, 7, 16, 2, 45, 130, 5, 64):
+        batch = random_rotations(rng, size)
+        assert index.append(batch) == size
+        rotations += batch
+    yield index, rotations
+    index.close()
+
+
+def test_prefix_queries(logged):
+    index, rotations = logged
+    rng = random.Random(1)
+    assert len(index) == len(rotations)
+    for _ in range(300):
+        i = rng.randrange(len(rotations) + 1)
+        j = rng.randrange(i, len(rotations) + 1)
+        start, _, _ = count_zeros(rotations[:i])
+        assert index.position(i) == start
+        assert index.query(i, j) == count_zeros(rotations[i:j], start)
+
+
+def test_queries_from_any_position(logged):
+    index, rotations = logged
+    rng = random.Random(2)
+    for _ in range(300):
+        i = rng.randrange(len(rotations) + 1)
+        j = rng.randrange(i, len(rotations) + 1)
+        position = rng.randrange(100)
+        assert index.query(i, j, position) == count_zeros(rotations[i:j], position)
+
+
+def test_reopened_index_matches(logged):
+    index, rotations = logged
+    with RotationIndex(index.root) as reopened:
+        assert reopened.query(0, len(rotations), 0) == count_zeros(rotations, 0)
+
+
+def test_build_from_lines(tmp_path):
+    lines = ["L68", "L30", "R48", "L5", "R60", "L55", "L1", "L99", "R14", "L82"]
+    with build(tmp_path / "index", lines) as index:
+        assert index.query(0, len(lines))[1:] == (3, 6)
+
+
+@pytest.mark.parametrize("position", [-1, 100, 150])
+def test_positions_off_the_dial_are_rejected(logged, position):
+    index, _ = logged
+    with pytest.raises(ValueError, match="dial position"):
+        index.query(0, 10, position)
+
+
+def test_ranges_outside_the_log_are_rejected(logged):
+    index, rotations = logged
+    with pytest.raises(IndexError):
+        index.query(0, len(rotations) + 1)
+
+
+def test_cli_rejects_positions_off_the_dial(capsys):
+    from aoc.cli import build_parser
+
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(["dial-index", "query", "--position", "150"])
+    assert "not a dial position" in capsys.readouterr().err
@@ -0,0 +1,87 @@
+"""Day 2 closed-form sums against a string-based brute force."""
+
+import random
+
+import pytest
+
+from aoc.engines import day02
+
+
+def repeated_times(number: int) -> set:
+    """How many times ``number`` repeats a block, for each way it does."""
+    text = str(number)
+    return {
+        len(text) // block
+        for block in range(1, len(text))
+        if len(text) % block == 0 and text[:block] * (len(text) // block) == text
+    }
+
+
+def brute(lo: int, hi: int):
+    doubled = repeated = 0
+    for number in range(lo, hi + 1):
+        times = repeated_times(number)
+        if 2 in times:
+            doubled += number
+        if times:
+            repeated += number
+    return doubled, repeated
+
+
+def random_ranges(seed: int, count: int, digits: int = 7, width: int = 3000):
+    rng = random.Random(seed)
+    for _ in range(count):
+        lo = rng.randrange(1, 10 ** rng.randint(1, digits))
+        yield lo, lo + rng.randrange(width)
+
+
+def test_small_ranges_match_brute_force():
+    for lo, hi in [(1, 1), (1, 9), (11, 22), (95, 115), (998, 1012), (1, 20000)]:
+        assert (day02.sum_doubled(lo, hi), day02.sum_repeated(lo, hi)) == brute(lo, hi)
+
+
+def test_random_ranges_match_brute_force():
+    for lo, hi in random_ranges(seed=0, count=300):
+        assert (day02.sum_doubled(lo, hi), day02.sum_repeated(lo, hi)) == brute(lo, hi)
+
+
+def test_ranges_across_digit_lengths():
+    for lo, hi in [(9, 11), (99, 1001), (99990, 100100), (999000, 1001000)]:
+        assert (day02.sum_doubled(lo, hi), day02.sum_repeated(lo, hi)) == brute(lo, hi)
+
+
+def test_periodic_sum_counts_every_period():
+    # 6-digit numbers with period 2 in range: 101010, 121212, ... up to 999999.
+    expected = sum(n for n in range(100000, 1000000) if str(n) == str(n)[:2] * 3)
+    assert day02.periodic_sum(100000, 999999, 6, 2) == expected
+
+
+def test_mobius():
+    assert [day02.mobius(n) for n in range(1, 13)] == [1, -1, -1, 0, -1, 1, -1, 0, 0, 1, -1, 0]
+
+
+def test_brute_sums_match_closed_form():
+    pytest.importorskip("numpy")
+    cases = list(random_ranges(seed=1, count=100, digits=19, width=50000))
+    cases += [
+        (1, 200000),
+        (99990, 100100),
+        (10 ** 18 - 5000, 10 ** 18 + 5000),  # 18 to 19 digits
+        (10 ** 19 - 100000, 10 ** 19 - 1),  # the largest 19-digit IDs
+        (9999999999 * 1000000001 - 10, 9999999999 * 1000000001),  # 9999999999 twice
+    ]
+    for lo, hi in cases:
+        assert day02.brute_sums(lo, hi) == (day02.sum_doubled(lo, hi), day02.sum_repeated(lo, hi))
+
+
+def test_brute_sums_cross_chunks(monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(day02, "BRUTE_CHUNK", 997)
+    for lo, hi in [(1, 30000), (123456, 140000)]:
+        assert day02.brute_sums(lo, hi) == brute(lo, hi)
+
+
+def test_exact_sum_does_not_wrap():
+    np = pytest.importorskip("numpy")
+    values = np.array([2 ** 64 - 1, 2 ** 64 - 2, 2 ** 63, 1], dtype=np.uint64)
+    assert day02.exact_sum(values) == (2 ** 64 - 1) + (2 ** 64 - 2) + 2 ** 63 + 1
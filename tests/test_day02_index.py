@@ -0,0 +1,81 @@
+"""The Day 2 repeated-ID index against the closed-form sums."""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from aoc.engines import day02  # noqa: E402
+from aoc.engines.day02_index import RepeatedIdIndex, prefix_sums  # noqa: E402
+
+# Above 13 digits the prefix sums pass 2**64, so 14 digits exercises the
+# wrap counts and the borrow between the two words.
+DIGITS = 14
+
+
+@pytest.fixture(scope="module")
+def index(tmp_path_factory):
+    return RepeatedIdIndex.create(tmp_path_factory.mktemp("id-index"), DIGITS)
+
+
+def random_ranges(seed: int, count: int):
+    rng = random.Random(seed)
+    for _ in range(count):
+        lo = rng.randrange(1, 10 ** rng.randint(1, DIGITS))
+        hi = min(10 ** DIGITS - 1, lo + rng.randrange(1, 10 ** rng.randint(1, DIGITS)))
+        yield lo, hi
+
+
+def test_prefix_sums_wrap():
+    ids = np.array([2 ** 64 - 1, 2 ** 64 - 1, 5, 2 ** 63, 2 ** 63], dtype=np.uint64)
+    low, high = prefix_sums(ids)
+    running = 0
+    for k, value in enumerate([0] + ids.tolist()):
+        running += value
+        assert (int(high[k]) << 64) + int(low[k]) == running
+
+
+def test_index_wraps(index):
+    assert int(index._arrays["part2.sum_hi"][-1]) > 0
+
+
+def test_range_sums_match_closed_form(index):
+    ranges = list(random_ranges(seed=0, count=500))
+    ranges += [(1, 10 ** DIGITS - 1), (10 ** 13, 10 ** DIGITS - 1), (11, 11), (12, 21), (22, 10)]
+    starts = [lo for lo, _ in ranges]
+    ends = [hi for _, hi in ranges]
+    doubled = index.range_sums(starts, ends, 1)
+    repeated = index.range_sums(starts, ends, 2)
+    for (lo, hi), part1, part2 in zip(ranges, doubled, repeated):
+        assert part1 == (day02.sum_doubled(lo, hi) if lo <= hi else 0)
+        assert part2 == (day02.sum_repeated(lo, hi) if lo <= hi else 0)
+    assert sum(repeated[-5:-3]) > 2 ** 64
+
+
+def test_total_of_disjoint_ranges(index):
+    merged = day02.merge_ranges(list(random_ranges(seed=1, count=200)))
+    starts = [lo for lo, _ in merged]
+    ends = [hi for _, hi in merged]
+    assert index.total(starts, ends, 1) == sum(day02.sum_doubled(lo, hi) for lo, hi in merged)
+    assert index.total(starts, ends, 2) == sum(day02.sum_repeated(lo, hi) for lo, hi in merged)
+
+
+def test_solve_merges_overlaps(index):
+    ranges = [(11, 22), (15, 1000), (95, 115), (10 ** 12, 10 ** 13 + 5)]
+    merged = day02.merge_ranges(ranges)
+    assert index.solve(ranges) == (
+        sum(day02.sum_doubled(lo, hi) for lo, hi in merged),
+        sum(day02.sum_repeated(lo, hi) for lo, hi in merged),
+    )
+
+
+def test_reopened_index_matches(index):
+    reopened = RepeatedIdIndex(index.root)
+    assert reopened.digits == DIGITS
+    assert reopened.range_sums([1], [10 ** 9], 2) == [day02.sum_repeated(1, 10 ** 9)]
+
+
+def test_ranges_past_the_index_are_rejected(index):
+    with pytest.raises(ValueError, match="rebuild"):
+        index.range_sums([1], [10 ** DIGITS], 1)
@@ -0,0 +1,100 @@
+"""Day 2 ID rules and combinators against brute-force predicates."""
+
+import random
+
+import pytest
+
+from aoc.engines.day02_rules import (
+    DigitSum, Palindrome, RepeatedAtLeast, RepeatedExactly, Rule,
+    intersection, sum_ids, union,
+)
+
+
+def repeats(number: int, times: int) -> bool:
+    text = str(number)
+    return len(text) % times == 0 and text[:len(text) // times] * times == text
+
+
+def palindrome(number: int) -> bool:
+    return str(number) == str(number)[::-1]
+
+
+def digit_sum(number: int) -> int:
+    return sum(map(int, str(number)))
+
+
+def cases():
+    """``(rule, predicate)`` pairs, including nested combinations."""
+    for k in (2, 3, 4):
+        yield RepeatedExactly(k), lambda n, k=k: repeats(n, k)
+        yield RepeatedAtLeast(k), lambda n, k=k: any(
+            repeats(n, t) for t in range(k, len(str(n)) + 1)
+        )
+    yield Palindrome(), palindrome
+    for s in (1, 5, 10, 23):
+        yield DigitSum(s), lambda n, s=s: digit_sum(n) == s
+        yield (
+            intersection(Palindrome(), DigitSum(s)),
+            lambda n, s=s: palindrome(n) and digit_sum(n) == s,
+        )
+        yield (
+            intersection(union(Palindrome(), RepeatedExactly(2)), DigitSum(s)),
+            lambda n, s=s: (palindrome(n) or repeats(n, 2)) and digit_sum(n) == s,
+        )
+        yield (
+            union(
+                intersection(RepeatedAtLeast(2), DigitSum(s)),
+                intersection(Palindrome(), DigitSum(s + 1)),
+            ),
+            lambda n, s=s: (
+                (any(repeats(n, t) for t in range(2, len(str(n)) + 1)) and digit_sum(n) == s)
+                or (palindrome(n) and digit_sum(n) == s + 1)
+            ),
+        )
+    yield union(Palindrome(), RepeatedAtLeast(2)), lambda n: palindrome(n) or any(
+        repeats(n, t) for t in range(2, len(str(n)) + 1)
+    )
+    yield (
+        intersection(RepeatedExactly(2), Palindrome(), DigitSum(4)),
+        lambda n: repeats(n, 2) and palindrome(n) and digit_sum(n) == 4,
+    )
+
+
+def ranges():
+    yield from [(1, 1), (1, 9), (1, 20000), (95, 1015), (99990, 100100)]
+    rng = random.Random(0)
+    for _ in range(40):
+        lo = rng.randrange(1, 10 ** rng.randint(1, 7))
+        yield lo, lo + rng.randrange(5000)
+
+
+def rule_id(value):
+    return repr(value) if isinstance(value, Rule) else None
+
+
+@pytest.mark.parametrize("rule, predicate", list(cases()), ids=rule_id)
+def test_rule_matches_brute_force(rule, predicate):
+    for lo, hi in ranges():
+        expected = [n for n in range(lo, hi + 1) if predicate(n)]
+        assert list(rule.generate(lo, hi)) == expected, (lo, hi)
+        total = rule.total(lo, hi)
+        assert total is None or total == sum(expected), (lo, hi)
+
+
+def test_digit_sum_closed_form_on_wide_ranges():
+    rule = DigitSum(10)
+    for lo, hi in [(1, 10 ** 6), (123456, 7654321), (10 ** 5 - 3, 10 ** 7 + 3)]:
+        assert rule.total(lo, hi) == sum(rule.generate(lo, hi))
+
+
+def test_sum_ids_merges_overlapping_ranges():
+    rule = union(Palindrome(), RepeatedExactly(2))
+    ranges = [(1, 500), (400, 1200), (1100, 1300)]
+    assert sum_ids(rule, ranges) == sum(rule.generate(1, 1300))
+
+
+def test_rules_need_a_generator():
+    with pytest.raises(TypeError):
+        Rule()
+    with pytest.raises(ValueError):
+        RepeatedExactly(1)